@@ -1,4 +1,4 @@
-from .pages import bubble_analysis, mass_transfer
-from .utils import bubble_detection, mass_transfer_calc
+# Pages and utilities are imported by their users, so that the numerical
+# modules load without Streamlit
 
 __version__ = "0.1.0"
@@ -1,5 +1,11 @@
+import os
+import sys
 import streamlit as st
-from pages import bubble_analysis, mass_transfer
+
+# Import the page views through the app package so that their relative imports resolve
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.views import PAGES, load_page
 
 def main():
     st.set_page_config(
@@ -11,13 +17,8 @@ def main():
     st.title("Chemical Engineering Analysis Suite")
     st.sidebar.title("Navigation")
 
-    pages = {
-        "Home": None,
-        "Bubble Analysis": bubble_analysis.app,
-        "Mass Transfer Analysis": mass_transfer.app
-    }
-
-    selection = st.sidebar.radio("Go to", list(pages.keys()))
+    # Pages are imported only once selected
+    selection = st.sidebar.radio("Go to", ["Home"] + list(PAGES))
 
     if selection == "Home":
         st.write("Welcome to the Chemical Engineering Analysis Suite!")
@@ -46,7 +47,7 @@ def main():
         4. View and export results
         """)
     else:
-        pages[selection]()
+        load_page(selection)()
 
 if __name__ == "__main__":
     main()
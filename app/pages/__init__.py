@@ -1 +0,0 @@
-# Pages package initialization
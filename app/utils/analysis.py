@@ -0,0 +1,310 @@
+import hashlib
+import numpy as np
+import pandas as pd
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Mapping, Optional, Tuple
+from .mass_transfer_calc import PowerLawCorrelation, compare_with_experiment
+from .regression import (
+    DEFAULT_TOP_K,
+    ResultStore,
+    compare_models,
+    cross_validate,
+    fit_free_exponents,
+    grid_search,
+    iter_random_search,
+    kfold_masks,
+    log_features
+)
+
+# Search modes understood by run_analysis
+SEARCH_MODES = ["Random Search", "Exhaustive Grid", "Free-Exponent Fit", "Compare All Models"]
+
+# Percentage error above which a correlation is flagged
+ERROR_THRESHOLD = 10.0
+
+# Stage results kept per dataset before the least recently used are dropped
+STAGE_CACHE_ENTRIES = 64
+
+
+def model_parameters(model_type: int) -> List[str]:
+    """Names of the parameters fitted by a model."""
+    parameters = ['a', 'x1', 'x2']
+    if model_type in [1, 2]:
+        parameters.append('x3')
+    if model_type in [1, 3]:
+        parameters.append('x4')
+    return parameters
+
+
+def required_columns(model_type: int, search_mode: str = "Random Search") -> List[str]:
+    """
+    Data columns needed to run a search.
+
+    Args:
+        model_type: Model number (1-4)
+        search_mode: One of SEARCH_MODES; comparing all models needs every group
+
+    Returns:
+        list: Required column names
+    """
+    columns = ["Sh", "Re", "Sc"]
+    if model_type in [1, 2] or search_mode == "Compare All Models":
+        columns.append("We")
+    if model_type in [1, 3] or search_mode == "Compare All Models":
+        columns.append("Eg")
+    return columns
+
+
+def iter_regression_analysis(
+    data: pd.DataFrame,
+    model_type: int,
+    num_iterations: int,
+    seed: Optional[int] = None,
+    max_workers: int = 1,
+    top_k: int = DEFAULT_TOP_K,
+    n_folds: Optional[int] = None
+) -> Iterator[Tuple[int, ResultStore]]:
+    """
+    Random search over the exponent ranges, yielding after every chunk.
+
+    Args:
+        data: Experimental data with Sh and the model's groups
+        model_type: Model number (1-4)
+        num_iterations: Number of exponent draws
+        seed: Seed for the draws
+        max_workers: Number of worker processes
+        top_k: Number of ranked results to keep
+        n_folds: Rank by k-fold cross-validated R² with this many folds
+
+    Yields:
+        Tuple of the number of draws evaluated so far and the results store,
+        which is filled in place
+    """
+    sh = data['Sh'].values
+    features = log_features(data, model_type)
+
+    # Out-of-sample R² from closed-form per-fold fits, used for ranking when requested
+    if n_folds:
+        folds = kfold_masks(len(sh), min(n_folds, len(sh)), seed)
+        results = ResultStore(model_type, top_k, rank_by='r2_cv')
+    else:
+        results = ResultStore(model_type, top_k)
+    completed = 0
+
+    for start, exponents, a_values, r2_values in iter_random_search(
+        sh, features, model_type, num_iterations, seed=seed, max_workers=max_workers
+    ):
+        r2_cv = cross_validate(sh, features, exponents, folds)['r2'] if n_folds else None
+        results.add(start, exponents, a_values, r2_values, r2_cv)
+        completed += len(a_values)
+        yield completed, results
+
+
+def run_analysis(
+    data: pd.DataFrame,
+    model_type: int,
+    search_mode: str,
+    settings: Mapping,
+    max_workers: int = 1,
+    progress: Optional[Callable[[int, ResultStore], None]] = None
+) -> Dict:
+    """
+    Run one regression search and return its results as plain data.
+
+    Args:
+        data: Experimental data with Sh and the required groups
+        model_type: Model number (1-4) whose results are returned
+        search_mode: One of SEARCH_MODES
+        settings: Search settings; 'top_k' plus 'num_iterations', 'seed' and
+            'n_folds' (random search and comparison), 'grid_resolution' (grid) or
+            'bounds' and 'n_starts' (free-exponent fit)
+        max_workers: Number of worker processes
+        progress: Called with the draws completed and the results so far after
+            every chunk of a random search
+
+    Returns:
+        dict: 'results' (ResultStore), 'r2_surface' (grid search only),
+        'comparison' (model comparison only) and 'converged' (False if no
+        free-exponent fit converged)
+    """
+    if search_mode not in SEARCH_MODES:
+        raise ValueError(f"Unknown search mode: {search_mode}")
+
+    missing = [col for col in required_columns(model_type, search_mode) if col not in data.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+    top_k = settings.get('top_k', DEFAULT_TOP_K)
+    output = {'results': None, 'r2_surface': None, 'comparison': None, 'converged': True}
+
+    if search_mode == "Compare All Models":
+        output['comparison'], results = compare_models(
+            data['Sh'].values, data, settings['num_iterations'], seed=settings.get('seed'), top_k=top_k
+        )
+        output['results'] = results[model_type]
+
+    elif search_mode == "Exhaustive Grid":
+        # Every lattice point is fitted in one broadcast computation
+        surface = grid_search(data['Sh'].values, log_features(data, model_type), model_type, settings['grid_resolution'], top_k)
+        output['results'], output['r2_surface'] = surface['results'], surface
+
+    elif search_mode == "Free-Exponent Fit":
+        fit = fit_free_exponents(
+            data['Sh'].values,
+            log_features(data, model_type),
+            model_type,
+            bounds=settings['bounds'],
+            n_starts=settings['n_starts'],
+            max_workers=max_workers
+        )
+        output['converged'] = bool(fit['success'].any())
+        output['results'] = ResultStore.from_arrays(model_type, fit['exponents'], fit['a'], fit['r2'], top_k)
+
+    else:
+        for completed, results in iter_regression_analysis(
+            data, model_type, settings['num_iterations'], settings.get('seed'), max_workers, top_k, settings.get('n_folds')
+        ):
+            if progress is not None:
+                progress(completed, results)
+        output['results'] = results
+
+    return output
+
+
+class AnalysisStages:
+    """
+    Detailed analysis of one dataset as a DAG of memoized stages.
+
+    predictions (model coefficients) feed errors and mtc (char_length,
+    diffusivity), and both predictions and mtc feed comparison (W and I
+    ranges).
+    A stage is keyed by its own parameters and the keys of the stages it
+    reads, so a change recomputes only the stages downstream of it. Callers
+    can add their own stages, such as figures, with run().
+    """
+
+    def __init__(self, data: pd.DataFrame, max_entries: int = STAGE_CACHE_ENTRIES):
+        self.data = data
+        self.max_entries = max_entries
+        self.evaluations = Counter()
+        self._values = OrderedDict()
+
+    def run(self, name: str, params: Hashable, upstream: Tuple[str, ...], compute: Callable[[], Any]) -> Tuple[str, Any]:
+        """
+        Return the value of a stage, computing it only if its inputs changed.
+
+        Args:
+            name: Stage name
+            params: The stage's own inputs; must have a stable repr
+            upstream: Keys of the stages it reads
+            compute: Function computing the value from scratch
+
+        Returns:
+            Tuple of the stage key and its value
+        """
+        key = hashlib.sha256(repr((name, params, upstream)).encode()).hexdigest()
+        if key in self._values:
+            self._values.move_to_end(key)
+            return key, self._values[key]
+
+        value = compute()
+        self.evaluations[name] += 1
+        self._values[key] = value
+        while len(self._values) > self.max_entries:
+            self._values.popitem(last=False)
+        return key, value
+
+    def predictions(self, correlation: PowerLawCorrelation) -> Tuple[str, np.ndarray]:
+        """Model Sh at every data point."""
+        params = (correlation.a, tuple(correlation.exponents.items()))
+        return self.run('predictions', params, (), lambda: correlation.predict(self.data))
+
+    def errors(self, correlation: PowerLawCorrelation) -> Tuple[str, Dict]:
+        """Percentage errors ((exp/model) - 1) * 100 and their summary."""
+        predictions_key, model_sh = self.predictions(correlation)
+
+        def compute() -> Dict:
+            percent_error = (self.data['Sh'].to_numpy(dtype=float) / model_sh - 1) * 100
+            abs_error = np.abs(percent_error)
+            return {
+                'percent_error': percent_error,
+                'mean_error': float(np.mean(abs_error)),
+                'max_error': float(np.max(abs_error)),
+                'within_threshold': bool(np.max(abs_error) <= ERROR_THRESHOLD)
+            }
+
+        return self.run('errors', (), (predictions_key,), compute)
+
+    def mtc(self, correlation: PowerLawCorrelation, char_length: float, diffusivity: float) -> Tuple[str, Dict]:
+        """Experimental and model mass transfer coefficients (m/s)."""
+        predictions_key, model_sh = self.predictions(correlation)
+        mtc_factor = diffusivity / char_length
+        return self.run('mtc', (char_length, diffusivity), (predictions_key,), lambda: {
+            'experimental': self.data['Sh'].to_numpy(dtype=float) * mtc_factor,
+            'model': model_sh * mtc_factor
+        })
+
+    def comparison(
+        self,
+        correlation: PowerLawCorrelation,
+        char_length: float,
+        diffusivity: float,
+        w_range: tuple,
+        i_range: tuple
+    ) -> Tuple[str, pd.DataFrame]:
+        """Comparison table of compare_with_experiment, built from the memoized predictions and MTCs."""
+        predictions_key, model_sh = self.predictions(correlation)
+        mtc_key, mtc = self.mtc(correlation, char_length, diffusivity)
+        params = (tuple(w_range), tuple(i_range))
+        return self.run('comparison', params, (predictions_key, mtc_key), lambda: compare_with_experiment(
+            self.data, correlation, char_length, diffusivity, w_range, i_range, model_sh, mtc
+        ))
+
+
+def detailed_analysis(
+    data: pd.DataFrame,
+    model_data: Mapping,
+    model_type: int,
+    char_length: float,
+    diffusivity: float,
+    w_range: tuple,
+    i_range: tuple,
+    stages: Optional[AnalysisStages] = None
+) -> Dict:
+    """
+    Evaluate a fitted model against the experimental data.
+
+    Args:
+        data: Experimental data with Sh and the model's groups
+        model_data: Regression result with 'a' and 'x1'..'x4'
+        model_type: Model number (1-4)
+        char_length: Characteristic length (m)
+        diffusivity: Diffusivity (m²/s)
+        w_range: Minimum and maximum rotation speed W (rpm)
+        i_range: Minimum and maximum current I (A)
+        stages: Stage cache of this dataset; stages whose inputs are
+            unchanged since an earlier call are reused
+
+    Returns:
+        dict: 'correlation', 'comparison' (see compare_with_experiment),
+        'mean_error' and 'max_error' (absolute percentage errors),
+        'within_threshold' (every error at most ERROR_THRESHOLD) and 'keys'
+        (stage keys of 'predictions', 'errors', 'mtc' and 'comparison')
+    """
+    if stages is None:
+        stages = AnalysisStages(data)
+
+    correlation = PowerLawCorrelation.from_model_data(model_data, model_type, data.columns)
+    predictions_key, _ = stages.predictions(correlation)
+    errors_key, errors = stages.errors(correlation)
+    mtc_key, _ = stages.mtc(correlation, char_length, diffusivity)
+    comparison_key, comparison = stages.comparison(correlation, char_length, diffusivity, w_range, i_range)
+
+    return {
+        'correlation': correlation,
+        'comparison': comparison,
+        'mean_error': errors['mean_error'],
+        'max_error': errors['max_error'],
+        'within_threshold': errors['within_threshold'],
+        'keys': {'predictions': predictions_key, 'errors': errors_key, 'mtc': mtc_key, 'comparison': comparison_key}
+    }
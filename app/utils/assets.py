@@ -0,0 +1,73 @@
+import functools
+import json
+import os
+import tempfile
+from typing import Optional
+
+# Animations bundled with the app; override with the CHEME_ASSET_DIR environment variable
+DEFAULT_ASSET_DIR = os.environ.get(
+    'CHEME_ASSET_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'lottie')
+)
+
+# Remote sources of the animations, used only when fetching is enabled
+LOTTIE_URLS = {
+    'analysis': "https://assets5.lottiefiles.com/packages/lf20_qp1q7mct.json",
+    'loading': "https://assets3.lottiefiles.com/packages/lf20_x62chJ.json",
+    'success': "https://assets8.lottiefiles.com/packages/lf20_jbrw3hcz.json",
+}
+
+# Set CHEME_FETCH_ASSETS=1 to download animations missing from the asset directory
+FETCH_ASSETS = os.environ.get('CHEME_FETCH_ASSETS', '').lower() in ('1', 'true', 'yes')
+
+# Seconds to wait for a remote animation before giving up
+FETCH_TIMEOUT = 3.0
+
+
+@functools.lru_cache(maxsize=None)
+def load_lottie(name: str, asset_dir: str = DEFAULT_ASSET_DIR, fetch: bool = FETCH_ASSETS, timeout: float = FETCH_TIMEOUT) -> Optional[dict]:
+    """
+    Load a Lottie animation from the local asset directory.
+
+    With fetching enabled, an animation missing locally is downloaded once
+    from LOTTIE_URLS and stored in the asset directory for later runs. Results,
+    including misses, are memoized for the process.
+
+    Args:
+        name: Animation name, a key of LOTTIE_URLS
+        asset_dir: Directory holding <name>.json files
+        fetch: Download the animation if it is not available locally
+        timeout: Timeout of the download in seconds
+
+    Returns:
+        Optional[dict]: Animation data, or None if it is unavailable
+    """
+    path = os.path.join(asset_dir, f"{name}.json")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    if not fetch or name not in LOTTIE_URLS:
+        return None
+
+    import requests
+
+    try:
+        response = requests.get(LOTTIE_URLS[name], timeout=timeout)
+        response.raise_for_status()
+        animation = response.json()
+    except (requests.RequestException, ValueError):
+        return None
+
+    # Keep the download for later runs; a read-only asset directory is not an error
+    try:
+        os.makedirs(asset_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=asset_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(animation, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+    return animation
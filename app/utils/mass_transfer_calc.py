@@ -1,5 +1,134 @@
 import numpy as np
+import pandas as pd
 from scipy.optimize import minimize
+from typing import Iterable, List, Mapping, Optional
+
+class PowerLawCorrelation:
+    """Sherwood number correlation Sh = a(Re^x1)(Sc^x2)(We^x3)(Eg^x4), evaluated in log space."""
+
+    GROUPS = ['Re', 'Sc', 'We', 'Eg']
+
+    def __init__(self, a: float, x1: float, x2: float, x3: Optional[float] = None, x4: Optional[float] = None):
+        self.a = a
+        self.exponents = {
+            group: exponent
+            for group, exponent in zip(self.GROUPS, [x1, x2, x3, x4])
+            if exponent is not None
+        }
+
+    @classmethod
+    def from_model_data(cls, model_data: Mapping, model_type: int, columns: Optional[Iterable[str]] = None) -> 'PowerLawCorrelation':
+        """
+        Build the correlation of a regression result.
+
+        Args:
+            model_data: Regression result with 'a' and 'x1'..'x4'
+            model_type: Model number (1-4)
+            columns: Available data columns; groups missing from them are left out
+
+        Returns:
+            PowerLawCorrelation: Correlation using only the model's groups
+        """
+        columns = set(cls.GROUPS if columns is None else columns)
+        x3 = model_data['x3'] if model_type in [1, 2] and 'We' in columns else None
+        x4 = model_data['x4'] if model_type in [1, 3] and 'Eg' in columns else None
+        return cls(model_data['a'], model_data['x1'], model_data['x2'], x3, x4)
+
+    @property
+    def terms(self) -> List[str]:
+        """Dimensionless groups used by the correlation."""
+        return list(self.exponents)
+
+    @property
+    def parameter_names(self) -> List[str]:
+        """Names of the correlation parameters, in gradient column order."""
+        return ['a'] + [f"x{self.GROUPS.index(group) + 1}" for group in self.exponents]
+
+    def log_predict(self, values: Mapping) -> np.ndarray:
+        """
+        Calculate log(Sh) for arrays of dimensionless groups.
+
+        Args:
+            values: Mapping (dict or DataFrame) from group name to scalars or
+                arrays; arrays are broadcast against each other
+
+        Returns:
+            numpy.ndarray: log(Sh) with the broadcast shape of the inputs
+        """
+        log_sh = np.log(self.a)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for group, exponent in self.exponents.items():
+                log_sh = log_sh + exponent * np.log(np.asarray(values[group], dtype=float))
+        return np.asarray(log_sh)
+
+    def predict(self, values: Mapping) -> np.ndarray:
+        """Calculate Sh for arrays of dimensionless groups."""
+        return np.exp(self.log_predict(values))
+
+    def gradient(self, values: Mapping) -> np.ndarray:
+        """
+        Calculate the gradient of Sh with respect to the correlation parameters.
+
+        Args:
+            values: Mapping from group name to scalars or arrays
+
+        Returns:
+            numpy.ndarray: Array of shape (..., n_parameters) ordered as parameter_names
+        """
+        sh = self.predict(values)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            columns = [sh / self.a] + [
+                sh * np.log(np.asarray(values[group], dtype=float)) for group in self.exponents
+            ]
+        return np.stack(np.broadcast_arrays(*columns), axis=-1)
+
+def compare_with_experiment(
+    data: pd.DataFrame,
+    correlation: PowerLawCorrelation,
+    char_length: float,
+    diffusivity: float,
+    w_range: tuple,
+    i_range: tuple,
+    model_sh: Optional[np.ndarray] = None,
+    mtc: Optional[Mapping[str, np.ndarray]] = None
+) -> pd.DataFrame:
+    """
+    Compare experimental and correlation Sherwood numbers and mass transfer coefficients.
+
+    Every column is computed as one array operation, so memory grows only
+    with the output columns and large datasets need no per-row Python work.
+
+    Args:
+        data: Experimental data with Sh and the groups used by the correlation
+        correlation: Fitted correlation
+        char_length: Characteristic length (m)
+        diffusivity: Diffusivity (m²/s)
+        w_range: Minimum and maximum rotation speed W (rpm), spread over the points
+        i_range: Minimum and maximum current I (A), spread over the points
+        model_sh: Correlation Sh at the data points, if already computed
+        mtc: 'experimental' and 'model' mass transfer coefficients (m/s) at
+            the data points, if already computed
+
+    Returns:
+        pandas.DataFrame: One row per data point with experimental and model
+        Sh and MTC, percentage error ((exp/model) - 1) * 100, W and I
+    """
+    exp_sh = data['Sh'].to_numpy(dtype=float)
+    model_sh = correlation.predict(data) if model_sh is None else np.asarray(model_sh, dtype=float)
+    if mtc is None:
+        mtc_factor = diffusivity / char_length
+        mtc = {'experimental': exp_sh * mtc_factor, 'model': model_sh * mtc_factor}
+
+    return pd.DataFrame({
+        'Data Point': np.arange(1, len(data) + 1),
+        'Experimental Sh': exp_sh,
+        'Experimental MTC (m/s)': mtc['experimental'],
+        'Observed Sh': model_sh,
+        'Observed MTC (m/s)': mtc['model'],
+        'Percentage Error (%)': (exp_sh / model_sh - 1) * 100,
+        'W (rpm)': np.linspace(*w_range, len(data)),
+        'I (A)': np.linspace(*i_range, len(data))
+    })
 
 def calculate_mass_transfer(data: dict, model_type: str):
     """Calculate mass transfer coefficients based on selected model."""
@@ -27,4 +156,4 @@ def calculate_mass_transfer(data: dict, model_type: str):
 def calculate_sherwood_number(Re: float, Sc: float, params: list) -> float:
     """Calculate Sherwood number using optimized parameters."""
     a, x1, x2 = params[:3]
-    return a * (Re**x1) * (Sc**x2)
+    return float(PowerLawCorrelation(a, x1, x2).predict({'Re': Re, 'Sc': Sc}))
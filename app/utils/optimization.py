@@ -0,0 +1,122 @@
+import numpy as np
+from scipy.optimize import minimize
+from typing import Dict, Mapping, Optional, Tuple
+from .mass_transfer_calc import PowerLawCorrelation
+
+# Points per axis of the operating-condition grid
+OPTIMUM_GRID_POINTS = 20
+
+# Times the grid is rebuilt around its best cell before the continuous search
+REFINEMENT_LEVELS = 3
+
+# Largest number of cells in one refinement grid; finer per-axis requests are
+# reduced so that high-dimensional searches stay within memory
+MAX_GRID_ELEMENTS = 1 << 22
+
+
+def evaluate_grid(
+    correlation: PowerLawCorrelation,
+    bounds: Dict[str, Tuple[float, float]],
+    resolution: int = OPTIMUM_GRID_POINTS,
+    fixed: Optional[Mapping[str, float]] = None
+) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """
+    Evaluate the correlation on a regular grid in one broadcast call.
+
+    Args:
+        correlation: Fitted correlation
+        bounds: Lower and upper bound of each grid axis, in axis order
+        resolution: Number of points per axis
+        fixed: Values of the groups that are held constant
+
+    Returns:
+        Tuple of the axis values per group and the predicted Sh with shape
+        (resolution,) * len(bounds), indexed in axis order
+    """
+    axes = {name: np.linspace(low, high, resolution) for name, (low, high) in bounds.items()}
+    mesh = np.meshgrid(*axes.values(), indexing='ij', sparse=True)
+    values = dict(fixed or {})
+    values.update(zip(axes, mesh))
+    return axes, np.broadcast_to(correlation.predict(values), (resolution,) * len(axes))
+
+
+def refine_grid_optimum(
+    correlation: PowerLawCorrelation,
+    bounds: Dict[str, Tuple[float, float]],
+    resolution: int = OPTIMUM_GRID_POINTS,
+    levels: int = REFINEMENT_LEVELS,
+    fixed: Optional[Mapping[str, float]] = None
+) -> Tuple[Dict[str, float], float]:
+    """
+    Locate the grid maximum of Sh, zooming in on the best cell at each level.
+
+    After each evaluation the bounds shrink to the cells either side of the
+    best point, so every level divides the spacing by about resolution / 2.
+    The resolution is reduced where needed to keep each grid within
+    MAX_GRID_ELEMENTS cells.
+
+    Args:
+        correlation: Fitted correlation
+        bounds: Lower and upper bound of each varied group
+        resolution: Number of points per axis
+        levels: Number of refinements after the first grid
+        fixed: Values of the groups that are held constant
+
+    Returns:
+        Tuple of the best point found and its predicted Sh
+    """
+    resolution = max(2, min(resolution, int(MAX_GRID_ELEMENTS ** (1 / len(bounds)))))
+    for _ in range(levels + 1):
+        axes, sh = evaluate_grid(correlation, bounds, resolution, fixed)
+        best = np.unravel_index(np.nanargmax(sh), sh.shape)
+        point = {name: axis[i] for (name, axis), i in zip(axes.items(), best)}
+        bounds = {
+            name: (axis[max(i - 1, 0)], axis[min(i + 1, resolution - 1)])
+            for (name, axis), i in zip(axes.items(), best)
+        }
+    return point, float(sh[best])
+
+
+def optimize_conditions(
+    correlation: PowerLawCorrelation,
+    bounds: Dict[str, Tuple[float, float]],
+    fixed: Optional[Mapping[str, float]] = None,
+    resolution: int = OPTIMUM_GRID_POINTS,
+    levels: int = REFINEMENT_LEVELS
+) -> Tuple[Dict[str, float], float]:
+    """
+    Find the operating conditions that maximize Sh within the bounds.
+
+    The refined grid optimum seeds a bounded L-BFGS-B search over the log of
+    every varied group, where log(Sh) is linear with the exponents as its
+    exact gradient, so the result is not limited to the grid spacing.
+
+    Args:
+        correlation: Fitted correlation
+        bounds: Lower and upper bound of each varied group (positive)
+        fixed: Values of the groups that are held constant
+        resolution: Number of points per axis of the seeding grid
+        levels: Number of grid refinements
+
+    Returns:
+        Tuple of the optimal value of each varied group and the predicted Sh
+    """
+    start, _ = refine_grid_optimum(correlation, bounds, resolution, levels, fixed)
+    names = list(bounds)
+    exponents = np.array([correlation.exponents.get(name, 0.0) for name in names])
+    fixed = dict(fixed or {})
+
+    def objective(log_point: np.ndarray) -> Tuple[float, np.ndarray]:
+        values = dict(fixed, **dict(zip(names, np.exp(log_point))))
+        return -float(correlation.log_predict(values)), -exponents
+
+    result = minimize(
+        objective,
+        np.log([start[name] for name in names]),
+        jac=True,
+        method='L-BFGS-B',
+        bounds=np.log([bounds[name] for name in names])
+    )
+    # exp(log(bound)) can round past the bound, so clip back onto the box
+    point = {name: float(np.clip(value, *bounds[name])) for name, value in zip(names, np.exp(result.x))}
+    return point, float(correlation.predict(dict(fixed, **point)))
@@ -0,0 +1,784 @@
+import heapq
+import time
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from scipy.optimize import least_squares
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Dimensionless groups used by each Sherwood number correlation
+MODEL_TERMS = {
+    1: ['Re', 'Sc', 'We', 'Eg'],
+    2: ['Re', 'Sc', 'We'],
+    3: ['Re', 'Sc', 'Eg'],
+    4: ['Re', 'Sc'],
+}
+
+# Column of each group in the exponent matrix (X1, X2, X3, X4)
+EXPONENT_INDEX = {'Re': 0, 'Sc': 1, 'We': 2, 'Eg': 3}
+
+# Search ranges for the exponents
+X1_RANGE = (0.65, 0.75)
+X2_VALUE = 0.33
+X3_RANGE = (-0.5, -0.2)
+X4_RANGE = (0.1, 0.15)
+A_BOUNDS = (0.1, 10.0)
+GRID_POINTS = 20
+
+# Correlation parameters in the order used by the free-exponent fit
+PARAMETER_NAMES = ['a', 'x1', 'x2', 'x3', 'x4']
+DEFAULT_BOUNDS = {
+    'a': A_BOUNDS,
+    'x1': X1_RANGE,
+    'x2': (X2_VALUE, X2_VALUE),
+    'x3': X3_RANGE,
+    'x4': X4_RANGE
+}
+
+# Largest number of random-search iterations accepted from the UI
+MAX_ITERATIONS = 5_000_000
+
+# Largest number of experimental data points accepted from the UI
+MAX_DATA_POINTS = 1_000_000
+
+# Number of best candidates ranked and displayed by default
+DEFAULT_TOP_K = 1000
+
+# One fitted candidate per row
+RESULT_DTYPE = np.dtype([
+    ('a', 'f8'),
+    ('x1', 'f8'),
+    ('x2', 'f8'),
+    ('x3', 'f8'),
+    ('x4', 'f8'),
+    ('r2', 'f8'),
+    ('r2_cv', 'f8')
+])
+
+# Fixed bins counting the R² of every evaluated candidate
+R2_HISTOGRAM_BINS = 1000
+R2_HISTOGRAM_RANGE = (0.0, 1.0)
+
+# Upper bound on candidates x data points held in memory at once
+_CHUNK_ELEMENTS = 1 << 21
+
+
+def model_type_from_name(selected_model: str) -> int:
+    """Convert a model name such as 'Model 2' to its model type (1-4)."""
+    return int(selected_model.split(" ")[1])
+
+
+def exponent_grids(num_points: int = GRID_POINTS) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the X1, X3 and X4 value grids searched by the regression."""
+    return (
+        np.linspace(*X1_RANGE, num_points),
+        np.linspace(*X3_RANGE, num_points),
+        np.linspace(*X4_RANGE, num_points)
+    )
+
+
+def log_features(data: pd.DataFrame, model_type: int) -> np.ndarray:
+    """
+    Take the logarithm of every dimensionless group used by the model.
+
+    Args:
+        data: Experimental data with Re, Sc and, where needed, We and Eg
+        model_type: Model number (1-4)
+
+    Returns:
+        numpy.ndarray: Array of shape (n_points, 4); unused groups are zero
+    """
+    features = np.zeros((len(data), 4))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for name in MODEL_TERMS[model_type]:
+            features[:, EXPONENT_INDEX[name]] = np.log(data[name].to_numpy(dtype=float))
+    return features
+
+
+def sample_exponents(model_type: int, num_iterations: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Draw random exponent sets from the search grids.
+
+    Args:
+        model_type: Model number (1-4)
+        num_iterations: Number of candidate exponent sets
+        rng: Random generator; a fresh one is created if omitted
+
+    Returns:
+        numpy.ndarray: Array of shape (num_iterations, 4) with columns X1..X4
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    x1_range, x3_range, x4_range = exponent_grids()
+
+    exponents = np.zeros((num_iterations, 4))
+    exponents[:, 0] = rng.choice(x1_range, num_iterations)
+    exponents[:, 1] = X2_VALUE
+
+    if model_type in [1, 2]:
+        exponents[:, 2] = rng.choice(x3_range, num_iterations)
+
+    if model_type in [1, 3]:
+        exponents[:, 3] = rng.choice(x4_range, num_iterations)
+
+    return exponents
+
+
+def _fit_basis(sh: np.ndarray, basis: np.ndarray, ss_total: float, a_bounds: Tuple[float, float]) -> Tuple[np.ndarray, np.ndarray]:
+    """Closed-form bounded fit of 'a' along the last axis of basis."""
+    fy = basis @ sh
+    ff = np.einsum('...j,...j->...', basis, basis)
+    coef = np.clip(fy / ff, *a_bounds)
+
+    # Residual sum of squares from the sums alone, without a residual array;
+    # rounding can take it just below zero for an exact fit
+    rss = np.maximum(sh @ sh - 2 * coef * fy + coef**2 * ff, 0.0)
+    return coef, 1 - rss / ss_total
+
+
+def fit_coefficients(
+    sh: np.ndarray,
+    features: np.ndarray,
+    exponents: np.ndarray,
+    a_bounds: Tuple[float, float] = A_BOUNDS
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fit the coefficient 'a' for every candidate exponent set at once.
+
+    With the exponents fixed, Sh = a * f is linear in 'a', so the bounded
+    least-squares optimum is the closed-form solution clipped to a_bounds.
+
+    Args:
+        sh: Experimental Sherwood numbers, shape (n_points,)
+        features: Log features from log_features, shape (n_points, 4)
+        exponents: Candidate exponent sets, shape (n_candidates, 4)
+        a_bounds: Lower and upper bound for 'a'
+
+    Returns:
+        Tuple containing:
+        - a: Fitted coefficient for each candidate
+        - r2: Coefficient of determination for each candidate
+    """
+    sh = np.asarray(sh, dtype=float)
+    exponents = np.atleast_2d(exponents)
+    n_candidates = len(exponents)
+    ss_total = np.sum((sh - sh.mean())**2)
+
+    a = np.empty(n_candidates)
+    r2 = np.empty(n_candidates)
+    chunk_size = max(1, _CHUNK_ELEMENTS // max(1, len(sh)))
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for start in range(0, n_candidates, chunk_size):
+            stop = min(start + chunk_size, n_candidates)
+
+            # Correlation without 'a', one row per candidate
+            basis = np.exp(exponents[start:stop] @ features.T)
+            a[start:stop], r2[start:stop] = _fit_basis(sh, basis, ss_total, a_bounds)
+
+    return a, r2
+
+
+def kfold_masks(n_points: int, n_folds: int, seed: Optional[int] = None) -> np.ndarray:
+    """
+    Randomly assign data points to cross-validation folds of near-equal size.
+
+    Args:
+        n_points: Number of data points
+        n_folds: Number of folds (2 to n_points)
+        seed: Seed for the fold assignment
+
+    Returns:
+        numpy.ndarray: Boolean array of shape (n_points, n_folds), True where
+        the point belongs to the fold
+    """
+    if not 2 <= n_folds <= n_points:
+        raise ValueError(f"n_folds must be between 2 and the number of data points ({n_points})")
+
+    fold = np.empty(n_points, dtype=int)
+    fold[np.random.default_rng(seed).permutation(n_points)] = np.arange(n_points) % n_folds
+    return fold[:, None] == np.arange(n_folds)
+
+
+def cross_validate(
+    sh: np.ndarray,
+    features: np.ndarray,
+    exponents: np.ndarray,
+    folds: np.ndarray,
+    a_bounds: Tuple[float, float] = A_BOUNDS
+) -> Dict[str, np.ndarray]:
+    """
+    K-fold cross-validate every candidate exponent set at once.
+
+    With the exponents fixed, the per-fold least-squares 'a' only needs the
+    sums of f*Sh and f² over the training points. These are the full-data
+    sums minus the held-out fold's sums, which come from one matrix product
+    with the fold masks, so no candidate or fold is refitted in a loop.
+
+    Args:
+        sh: Experimental Sherwood numbers, shape (n_points,)
+        features: Log features from log_features, shape (n_points, 4)
+        exponents: Candidate exponent sets, shape (n_candidates, 4)
+        folds: Fold masks from kfold_masks, shape (n_points, n_folds)
+        a_bounds: Lower and upper bound for 'a'
+
+    Returns:
+        dict: 'a' fitted on each training split, shape (n_candidates, n_folds),
+        and out-of-sample 'r2' (1 - PRESS / total sum of squares) per candidate
+    """
+    sh = np.asarray(sh, dtype=float)
+    exponents = np.atleast_2d(exponents)
+    folds = np.asarray(folds, dtype=float)
+    n_candidates = len(exponents)
+    ss_total = np.sum((sh - sh.mean())**2)
+
+    # Held-out sums of Sh² per fold do not depend on the candidate
+    test_yy = (sh**2) @ folds
+
+    a = np.empty((n_candidates, folds.shape[1]))
+    r2 = np.empty(n_candidates)
+    chunk_size = max(1, _CHUNK_ELEMENTS // max(1, len(sh)))
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for start in range(0, n_candidates, chunk_size):
+            stop = min(start + chunk_size, n_candidates)
+            basis = np.exp(exponents[start:stop] @ features.T)
+
+            # Held-out sums per fold, shape (chunk, n_folds)
+            test_fy = basis @ (folds * sh[:, None])
+            test_ff = (basis**2) @ folds
+
+            # Training sums are the totals minus the held-out fold
+            train_fy = test_fy.sum(axis=1, keepdims=True) - test_fy
+            train_ff = test_ff.sum(axis=1, keepdims=True) - test_ff
+            fold_a = np.clip(train_fy / train_ff, *a_bounds)
+
+            # Squared prediction error on each held-out fold
+            press = np.sum(test_yy - 2 * fold_a * test_fy + fold_a**2 * test_ff, axis=1)
+            a[start:stop] = fold_a
+            r2[start:stop] = 1 - press / ss_total
+
+    return {'a': a, 'r2': r2}
+
+
+def _random_search_chunk(args: Tuple) -> Tuple[int, np.ndarray, np.ndarray, np.ndarray]:
+    """Sample and fit one chunk of the random search; module level so it can run in a worker process."""
+    sh, features, model_type, start, size, entropy = args
+
+    # Each chunk draws from its own stream, so results do not depend on scheduling
+    rng = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(start,)))
+    exponents = sample_exponents(model_type, size, rng)
+    a, r2 = fit_coefficients(sh, features, exponents)
+    return start, exponents, a, r2
+
+
+def iter_random_search(
+    sh: np.ndarray,
+    features: np.ndarray,
+    model_type: int,
+    num_iterations: int,
+    seed: Optional[int] = None,
+    max_workers: Optional[int] = 1,
+    chunk_size: Optional[int] = None
+) -> Iterator[Tuple[int, np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Run the random exponent search in chunks, yielding each chunk as it completes.
+
+    Chunks are seeded from the seed and their start offset only, so for a
+    fixed seed the combined results are identical for any number of workers.
+
+    Args:
+        sh: Experimental Sherwood numbers, shape (n_points,)
+        features: Log features from log_features, shape (n_points, 4)
+        model_type: Model number (1-4)
+        num_iterations: Total number of candidate exponent sets
+        seed: Seed for the exponent draws; None draws fresh entropy
+        max_workers: Worker processes; None uses all cores, 1 runs in-process
+        chunk_size: Candidates per chunk; defaults to about 1/20 of the iterations
+
+    Yields:
+        Tuple of (start offset, exponents, a, r2) for each completed chunk
+    """
+    sh = np.asarray(sh, dtype=float)
+    entropy = np.random.SeedSequence(seed).entropy
+    chunk_size = chunk_size or max(1, num_iterations // 20)
+
+    tasks = [
+        (sh, features, model_type, start, min(chunk_size, num_iterations - start), entropy)
+        for start in range(0, num_iterations, chunk_size)
+    ]
+
+    if max_workers == 1 or len(tasks) == 1:
+        for task in tasks:
+            yield _random_search_chunk(task)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_random_search_chunk, task) for task in tasks]
+            for future in as_completed(futures):
+                yield future.result()
+
+
+def grid_search(
+    sh: np.ndarray,
+    features: np.ndarray,
+    model_type: int,
+    resolution: int = GRID_POINTS,
+    top_k: int = 100,
+    a_bounds: Tuple[float, float] = A_BOUNDS
+) -> Dict[str, np.ndarray]:
+    """
+    Evaluate every exponent combination on the X1 x X3 x X4 lattice.
+
+    The lattice is flattened in C order and fitted in blocks of combinations,
+    each one array computation of at most _CHUNK_ELEMENTS combinations x
+    data points, so memory stays bounded for any resolution. Axes not used
+    by the model collapse to zero.
+
+    Args:
+        sh: Experimental Sherwood numbers, shape (n_points,)
+        features: Log features from log_features, shape (n_points, 4)
+        model_type: Model number (1-4)
+        resolution: Number of grid points per exponent
+        top_k: Number of best combinations to return
+        a_bounds: Lower and upper bound for 'a'
+
+    Returns:
+        dict: 'x1', 'x3' and 'x4' axes, the 'a' and 'r2' surfaces of shape
+        (len(x1), len(x3), len(x4)), and a ResultStore of every combination
+        under 'results', ranked by R² for the top_k
+    """
+    sh = np.asarray(sh, dtype=float)
+    ss_total = np.sum((sh - sh.mean())**2)
+
+    x1_axis, x3_axis, x4_axis = exponent_grids(resolution)
+    if model_type not in [1, 2]:
+        x3_axis = np.zeros(1)
+    if model_type not in [1, 3]:
+        x4_axis = np.zeros(1)
+
+    shape = (len(x1_axis), len(x3_axis), len(x4_axis))
+    n_candidates = int(np.prod(shape))
+    results = ResultStore(model_type, top_k)
+    a_surface = np.empty(n_candidates)
+    r2_surface = np.empty(n_candidates)
+    chunk_size = max(1, _CHUNK_ELEMENTS // max(1, len(sh)))
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for start in range(0, n_candidates, chunk_size):
+            stop = min(start + chunk_size, n_candidates)
+
+            # Exponents of this block of the lattice, flattened in C order
+            i1, i3, i4 = np.unravel_index(np.arange(start, stop), shape)
+            exponents = np.column_stack([x1_axis[i1], np.full(stop - start, X2_VALUE), x3_axis[i3], x4_axis[i4]])
+
+            basis = np.exp(exponents @ features.T)
+            a_surface[start:stop], r2_surface[start:stop] = _fit_basis(sh, basis, ss_total, a_bounds)
+            results.add(start, exponents, a_surface[start:stop], r2_surface[start:stop])
+
+    return {
+        'x1': x1_axis,
+        'x3': x3_axis,
+        'x4': x4_axis,
+        'a': a_surface.reshape(shape),
+        'r2': r2_surface.reshape(shape),
+        'results': results
+    }
+
+
+def _correlation_residuals(free: np.ndarray, params: np.ndarray, free_idx: np.ndarray, sh: np.ndarray, features: np.ndarray) -> np.ndarray:
+    """Residuals a * exp(features @ x) - Sh for the free parameters."""
+    params = params.copy()
+    params[free_idx] = free
+    return params[0] * np.exp(features @ params[1:]) - sh
+
+
+def _correlation_jacobian(free: np.ndarray, params: np.ndarray, free_idx: np.ndarray, sh: np.ndarray, features: np.ndarray) -> np.ndarray:
+    """Analytic Jacobian of the residuals with respect to the free parameters."""
+    params = params.copy()
+    params[free_idx] = free
+    basis = np.exp(features @ params[1:])
+
+    # d/da = f, d/dXj = a * f * log(group j)
+    jacobian = np.column_stack([basis, (params[0] * basis)[:, None] * features])
+    return jacobian[:, free_idx]
+
+
+def _least_squares_from_start(args: Tuple) -> Tuple[np.ndarray, float, bool]:
+    """Run one bounded least-squares fit; module level so it can run in a worker process."""
+    x0, params, free_idx, lower, upper, sh, features = args
+    result = least_squares(
+        _correlation_residuals,
+        x0,
+        jac=_correlation_jacobian,
+        bounds=(lower, upper),
+        method='trf',
+        args=(params, free_idx, sh, features)
+    )
+    return result.x, result.cost, result.success
+
+
+def fit_free_exponents(
+    sh: np.ndarray,
+    features: np.ndarray,
+    model_type: int,
+    bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+    n_starts: int = 8,
+    max_workers: Optional[int] = 1,
+    seed: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Fit 'a' and all exponents of the model jointly within bounds.
+
+    Each start runs a trust-region least-squares solve using the analytic
+    Jacobian of the power-law correlation. Starts are spread uniformly over
+    the bounds and run across a process pool when max_workers > 1.
+    Parameters whose bounds collapse to a single value are held fixed.
+
+    Args:
+        sh: Experimental Sherwood numbers, shape (n_points,)
+        features: Log features from log_features, shape (n_points, 4)
+        model_type: Model number (1-4)
+        bounds: Lower and upper bound per parameter name; defaults to DEFAULT_BOUNDS
+        n_starts: Number of multi-start seeds
+        max_workers: Worker processes; None uses all cores, 1 runs in-process
+        seed: Seed for the start points
+
+    Returns:
+        dict: 'exponents' (n_starts, 4), 'a', 'r2' and 'success' per start,
+        ordered as the starts were drawn
+    """
+    sh = np.asarray(sh, dtype=float)
+    features = np.asarray(features, dtype=float)
+    bounds = {**DEFAULT_BOUNDS, **(bounds or {})}
+
+    # Exponents of groups the model does not use stay at zero
+    lower = np.array([bounds[name][0] for name in PARAMETER_NAMES], dtype=float)
+    upper = np.array([bounds[name][1] for name in PARAMETER_NAMES], dtype=float)
+    if model_type not in [1, 2]:
+        lower[3] = upper[3] = 0.0
+    if model_type not in [1, 3]:
+        lower[4] = upper[4] = 0.0
+
+    free_idx = np.flatnonzero(upper > lower)
+    params = lower.copy()
+
+    # First start at the centre of the bounds, the rest uniformly inside them
+    rng = np.random.default_rng(seed)
+    starts = rng.uniform(lower[free_idx], upper[free_idx], size=(n_starts, len(free_idx)))
+    starts[0] = (lower[free_idx] + upper[free_idx]) / 2
+
+    tasks = [(x0, params, free_idx, lower[free_idx], upper[free_idx], sh, features) for x0 in starts]
+
+    if max_workers == 1 or n_starts == 1:
+        fits = [_least_squares_from_start(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            fits = list(executor.map(_least_squares_from_start, tasks))
+
+    fitted = np.tile(params, (n_starts, 1))
+    fitted[:, free_idx] = np.array([fit[0] for fit in fits])
+    cost = np.array([fit[1] for fit in fits])
+    ss_total = np.sum((sh - sh.mean())**2)
+
+    return {
+        'exponents': fitted[:, 1:],
+        'a': fitted[:, 0],
+        'r2': 1 - 2 * cost / ss_total,
+        'success': np.array([fit[2] for fit in fits])
+    }
+
+
+def information_criteria(r2: np.ndarray, ss_total: float, n_points: int, n_params: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Akaike and Bayesian information criteria of least-squares fits.
+
+    Args:
+        r2: Coefficient of determination of each fit
+        ss_total: Total sum of squares of the experimental Sh
+        n_points: Number of data points
+        n_params: Number of fitted parameters
+
+    Returns:
+        Tuple containing:
+        - aic: n ln(RSS/n) + 2k
+        - bic: n ln(RSS/n) + k ln(n)
+    """
+    rss = np.maximum((1 - np.asarray(r2, dtype=float)) * ss_total, np.finfo(float).tiny)
+    log_likelihood_term = n_points * np.log(rss / n_points)
+    return log_likelihood_term + 2 * n_params, log_likelihood_term + n_params * np.log(n_points)
+
+
+def compare_models(
+    sh: np.ndarray,
+    data: pd.DataFrame,
+    num_iterations: int,
+    seed: Optional[int] = None,
+    top_k: int = DEFAULT_TOP_K,
+    a_bounds: Tuple[float, float] = A_BOUNDS
+) -> Tuple[pd.DataFrame, Dict[int, 'ResultStore']]:
+    """
+    Fit all four correlations in one shared pass over the exponent draws.
+
+    log(Re), log(Sc), log(We) and log(Eg) are computed once. Every model
+    evaluates the same random X1/X3/X4 draws with the exponents of its
+    unused groups set to zero, so the models are compared on equal terms.
+    Each exponent is drawn from a grid, so the factors exp(X1 log(Re) +
+    X2 log(Sc)), exp(X3 log(We)) and exp(X4 log(Eg)) take only a few
+    distinct rows. They are tabulated once and shared by all models; in
+    each chunk of draws, every model's correlation is the product of the
+    gathered rows of the factors it uses, with no per-candidate exp().
+
+    Args:
+        sh: Experimental Sherwood numbers, shape (n_points,)
+        data: Experimental data with Re, Sc, We and Eg
+        num_iterations: Number of candidate exponent sets per model
+        seed: Seed for the exponent draws
+        top_k: Number of best candidates ranked per model
+        a_bounds: Lower and upper bound for 'a'
+
+    Returns:
+        Tuple containing:
+        - comparison: One row per model with the best R², AIC, BIC and fit
+          time (including the shared factors it uses), sorted by AIC
+        - results: ResultStore of each model type
+    """
+    sh = np.asarray(sh, dtype=float)
+    features = log_features(data, 1)
+    draws = sample_exponents(1, num_iterations, np.random.default_rng(seed))
+    ss_total = np.sum((sh - sh.mean())**2)
+
+    # Exponents of each model, with those of its unused groups held at zero
+    model_exponents = {}
+    for model_type, terms in MODEL_TERMS.items():
+        model_exponents[model_type] = draws.copy()
+        for name in ['We', 'Eg']:
+            if name not in terms:
+                model_exponents[model_type][:, EXPONENT_INDEX[name]] = 0.0
+
+    results = {model_type: ResultStore(model_type, top_k) for model_type in MODEL_TERMS}
+    elapsed = dict.fromkeys(MODEL_TERMS, 0.0)
+    chunk_size = max(1, _CHUNK_ELEMENTS // max(1, len(sh)))
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        start_time = time.perf_counter()
+
+        # Factor of each group per distinct exponent value, shape (n_values, n_points);
+        # X2 is fixed at X2_VALUE in every draw
+        x1_values, x1_index = np.unique(draws[:, 0], return_inverse=True)
+        x3_values, x3_index = np.unique(draws[:, 2], return_inverse=True)
+        x4_values, x4_index = np.unique(draws[:, 3], return_inverse=True)
+        re_sc_table = np.exp(np.outer(x1_values, features[:, 0]) + X2_VALUE * features[:, 1])
+        we_table = np.exp(np.outer(x3_values, features[:, 2]))
+        eg_table = np.exp(np.outer(x4_values, features[:, 3]))
+
+        shared_time = time.perf_counter() - start_time
+
+        for start in range(0, num_iterations, chunk_size):
+            stop = min(start + chunk_size, num_iterations)
+            start_time = time.perf_counter()
+
+            # Factors of the chunk's draws, each shape (chunk, n_points)
+            re_sc = re_sc_table[x1_index[start:stop]]
+            we = we_table[x3_index[start:stop]]
+            eg = eg_table[x4_index[start:stop]]
+            re_sc_we = re_sc * we
+            shared_time += time.perf_counter() - start_time
+
+            # Correlations without 'a', built only while their model is fitted
+            bases = {1: lambda: re_sc_we * eg, 2: lambda: re_sc_we, 3: lambda: re_sc * eg, 4: lambda: re_sc}
+            for model_type, basis in bases.items():
+                start_time = time.perf_counter()
+                a, r2 = _fit_basis(sh, basis(), ss_total, a_bounds)
+                results[model_type].add(start, model_exponents[model_type][start:stop], a, r2)
+                elapsed[model_type] += time.perf_counter() - start_time
+
+    # The shared factors count towards every model's fit time
+    for model_type in elapsed:
+        elapsed[model_type] += shared_time
+
+    rows = []
+    for model_type, terms in MODEL_TERMS.items():
+        # 'a' and every searched exponent; X2 is fixed
+        n_params = len(terms)
+        best = results[model_type][0]
+        aic, bic = information_criteria(best['r2'], ss_total, len(sh), n_params)
+
+        rows.append({
+            'Model': f"Model {model_type}",
+            'Best Equation': best['model'],
+            'R²': best['r2'],
+            'AIC': float(aic),
+            'BIC': float(bic),
+            'Parameters': n_params,
+            'Fit Time (s)': elapsed[model_type]
+        })
+
+    comparison = pd.DataFrame(rows).sort_values('AIC', kind='stable').reset_index(drop=True)
+    return comparison, results
+
+
+class ResultStore:
+    """
+    Best fitted candidates of a search, kept in a bounded heap.
+
+    Only the top_k best candidates are stored, using a heap that is updated
+    one chunk at a time, and equation strings are only formatted for the
+    rows that are accessed. Every candidate's R² is counted in a fixed-bin
+    histogram, so memory does not grow with the number of candidates.
+    Candidates are ranked by rank_by, either the training 'r2' or the
+    cross-validated 'r2_cv'.
+    """
+
+    def __init__(self, model_type: int, top_k: int = DEFAULT_TOP_K, rank_by: str = 'r2'):
+        self.model_type = model_type
+        self.top_k = top_k
+        self.rank_by = rank_by
+        self.cross_validated = False
+        self.evaluated = 0
+        self.r2_counts = np.zeros(R2_HISTOGRAM_BINS, dtype=np.int64)
+        self.r2_below_range = 0
+        self._heap = []  # (score, -index), worst ranked candidate at the root
+        self._records = {}  # index -> record of every candidate in the heap
+        self._ranked = None
+
+    @classmethod
+    def from_arrays(cls, model_type: int, exponents: np.ndarray, a: np.ndarray, r2: np.ndarray, top_k: int = DEFAULT_TOP_K) -> 'ResultStore':
+        """Build a store from complete arrays of fitted candidates."""
+        store = cls(model_type, top_k)
+        store.add(0, exponents, a, r2)
+        return store
+
+    def add(self, start: int, exponents: np.ndarray, a: np.ndarray, r2: np.ndarray, r2_cv: Optional[np.ndarray] = None) -> None:
+        """
+        Rank a block of fitted candidates and count their R² values.
+
+        Args:
+            start: Index of the block's first candidate
+            exponents: Exponent sets of the block, shape (n, 4)
+            a: Fitted coefficient for each candidate
+            r2: Coefficient of determination for each candidate
+            r2_cv: Cross-validated R² for each candidate, if computed
+        """
+        r2 = np.asarray(r2, dtype=float)
+        finite = r2[np.isfinite(r2)]
+        self.r2_counts += np.histogram(finite, bins=R2_HISTOGRAM_BINS, range=R2_HISTOGRAM_RANGE)[0]
+        self.r2_below_range += int(np.count_nonzero(finite < R2_HISTOGRAM_RANGE[0]))
+        self.evaluated += len(r2)
+
+        if r2_cv is not None:
+            r2_cv = np.asarray(r2_cv, dtype=float)
+            self.cross_validated = True
+        score = r2 if self.rank_by == 'r2' else (r2_cv if r2_cv is not None else np.full(len(r2), np.nan))
+        score = np.nan_to_num(score, nan=-np.inf)
+
+        # Only the block's own top_k can enter the overall top_k; ties go to the lower index
+        candidates = np.arange(len(score))
+        if len(score) > self.top_k:
+            threshold = np.partition(score, len(score) - self.top_k)[len(score) - self.top_k]
+            candidates = np.flatnonzero(score >= threshold)
+        if len(self._heap) == self.top_k:
+            # Candidates scoring below the current worst ranked one cannot enter
+            candidates = candidates[score[candidates] >= self._heap[0][0]]
+        candidates = candidates[np.lexsort((candidates, -score[candidates]))][:self.top_k]
+
+        for i in candidates:
+            index = start + int(i)
+            item = (score[i], -index)
+            if len(self._heap) < self.top_k:
+                heapq.heappush(self._heap, item)
+            elif item > self._heap[0]:
+                _, evicted = heapq.heapreplace(self._heap, item)
+                del self._records[-evicted]
+            else:
+                continue
+
+            cv = r2_cv[i] if r2_cv is not None else np.nan
+            self._records[index] = np.array((a[i], *exponents[i], r2[i], cv), dtype=RESULT_DTYPE)
+
+        self._ranked = None
+
+    def ranked_indices(self) -> np.ndarray:
+        """Row indices of the ranked candidates, best first."""
+        if self._ranked is None:
+            self._ranked = np.array([-index for _, index in sorted(self._heap, reverse=True)], dtype=int)
+        return self._ranked
+
+    def ranked_records(self) -> np.ndarray:
+        """Structured array of the ranked candidates, best first."""
+        return np.array([self._records[index] for index in self.ranked_indices()], dtype=RESULT_DTYPE)
+
+    def r2_histogram(self, bins: int = 20) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Histogram of every candidate's R² over the occupied part of R2_HISTOGRAM_RANGE.
+
+        Args:
+            bins: Largest number of bars; neighbouring fixed bins are merged
+
+        Returns:
+            Tuple of the counts and the bin edges; candidates with R² below the
+            range are counted in r2_below_range instead
+        """
+        occupied = np.flatnonzero(self.r2_counts)
+        if len(occupied) == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(1)
+
+        # Merge groups of width fixed bins between the first and last occupied bin
+        low, high = occupied[0], occupied[-1] + 1
+        width = -(-(high - low) // bins)
+        starts = np.arange(low, high, width)
+        counts = np.add.reduceat(self.r2_counts[low:high], starts - low)
+
+        edges = np.linspace(*R2_HISTOGRAM_RANGE, R2_HISTOGRAM_BINS + 1)
+        return counts, edges[np.minimum(np.append(starts, starts[-1] + width), R2_HISTOGRAM_BINS)]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __getitem__(self, position: int) -> Dict:
+        """Ranked candidate as a dict with its equation, parameters, R², cross-validated R² and rank."""
+        record = self._records[self.ranked_indices()[position]]
+        x3 = float(record['x3']) if self.model_type in [1, 2] else None
+        x4 = float(record['x4']) if self.model_type in [1, 3] else None
+
+        return {
+            'model': format_model_equation(self.model_type, record['a'], record['x1'], record['x2'], x3, x4),
+            'a': float(record['a']),
+            'x1': float(record['x1']),
+            'x2': float(record['x2']),
+            'x3': x3,
+            'x4': x4,
+            'r2': float(record['r2']),
+            'r2_cv': float(record['r2_cv']) if self.cross_validated else None,
+            'rank': (position % len(self)) + 1
+        }
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield self[position]
+
+    def to_frame(self, start: int = 0, stop: Optional[int] = None) -> pd.DataFrame:
+        """Table of ranked candidates from start to stop with formatted equations."""
+        positions = range(len(self))[start:stop]
+        rows = [self[position] for position in positions]
+
+        frame = pd.DataFrame({
+            'Rank': [row['rank'] for row in rows],
+            'Regression Model': [row['model'] for row in rows],
+            'R²': [f"{row['r2']:.6f}" for row in rows]
+        })
+
+        if self.cross_validated:
+            frame['CV R²'] = [f"{row['r2_cv']:.6f}" for row in rows]
+
+        return frame
+
+
+def format_model_equation(model_type: int, a: float, x1: float, x2: float, x3: Optional[float], x4: Optional[float]) -> str:
+    """Format the fitted correlation as an equation string."""
+    if model_type == 1:  # Sh=a(Re^X1)*(Sc^X2)*(We^X3)*(Eg^x4)
+        return f"Sh = {a:.4f}(Re^{x1:.4f})(Sc^{x2:.4f})(We^{x3:.4f})(Eg^{x4:.4f})"
+    elif model_type == 2:  # Sh=a(Re^X1)*(Sc^X2)*(We^X3)
+        return f"Sh = {a:.4f}(Re^{x1:.4f})(Sc^{x2:.4f})(We^{x3:.4f})"
+    elif model_type == 3:  # Sh=a(Re^X1)*(Sc^X2)*(Eg^x4)
+        return f"Sh = {a:.4f}(Re^{x1:.4f})(Sc^{x2:.4f})(Eg^{x4:.4f})"
+    else:  # Sh=a(Re^X1)*(Sc^X2)
+        return f"Sh = {a:.4f}(Re^{x1:.4f})(Sc^{x2:.4f})"
@@ -0,0 +1,91 @@
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+from typing import Callable, Dict, Mapping, Tuple
+from .optimization import MAX_GRID_ELEMENTS
+
+# Points per axis of the precomputed response table
+RESPONSE_TABLE_POINTS = 20
+
+# Response tables kept per session before the least recently used are dropped
+RESPONSE_TABLE_CACHE_ENTRIES = 8
+
+
+class ResponseTable:
+    """Model response precomputed on a regular grid and interpolated between nodes."""
+
+    def __init__(
+        self,
+        predict: Callable[[Mapping[str, np.ndarray]], np.ndarray],
+        bounds: Dict[str, Tuple[float, float]],
+        resolution: int = RESPONSE_TABLE_POINTS,
+        log_space: bool = False
+    ):
+        """
+        Evaluate the model once on every grid node.
+
+        Args:
+            predict: Model taking a mapping from input name to 1-D arrays and
+                returning one prediction per element; correlations and fitted
+                surrogates are both called exactly once
+            bounds: Lower and upper bound of each input
+            resolution: Number of points per axis, reduced where needed to stay
+                within MAX_GRID_ELEMENTS nodes
+            log_space: Space the nodes geometrically and interpolate log(output)
+                against log(inputs), which is exact for power-law correlations;
+                requires positive inputs and outputs
+
+        Raises:
+            ValueError: If log_space is set and a tabulated input or the
+                output is not positive
+        """
+        self.bounds = dict(bounds)
+        self.log_space = log_space
+
+        # Inputs with a single value are held constant rather than tabulated
+        self.axis_names = [name for name, (low, high) in self.bounds.items() if high > low]
+        if log_space:
+            non_positive = [name for name in self.axis_names if self.bounds[name][0] <= 0]
+            if non_positive:
+                raise ValueError(f"Log-space tables need positive inputs: {', '.join(non_positive)} reach zero or below")
+        self.resolution = max(2, min(resolution, int(MAX_GRID_ELEMENTS ** (1 / max(len(self.axis_names), 1)))))
+        spacing = np.geomspace if log_space else np.linspace
+        axes = [spacing(*self.bounds[name], self.resolution) for name in self.axis_names]
+
+        shape = (self.resolution,) * len(axes)
+        mesh = np.meshgrid(*axes, indexing='ij')
+        inputs = {name: np.full(int(np.prod(shape)), low) for name, (low, _) in self.bounds.items()}
+        inputs.update((name, grid.ravel()) for name, grid in zip(self.axis_names, mesh))
+        self.values = np.asarray(predict(inputs), dtype=float).reshape(shape)
+
+        if log_space:
+            if not np.all(self.values > 0):
+                raise ValueError("Log-space tables need a positive model output at every node")
+            self._interpolator = RegularGridInterpolator([np.log(axis) for axis in axes], np.log(self.values)) if axes else None
+        else:
+            self._interpolator = RegularGridInterpolator(axes, self.values) if axes else None
+
+    def __len__(self) -> int:
+        return self.values.size
+
+    def __call__(self, values: Mapping) -> np.ndarray:
+        """
+        Interpolate the tabulated response.
+
+        Args:
+            values: Mapping from input name to scalars or arrays; inputs outside
+                the table bounds are clipped onto them
+
+        Returns:
+            numpy.ndarray: Interpolated output with the broadcast shape of the inputs
+        """
+        if self._interpolator is None:
+            return np.asarray(self.values)
+
+        columns = np.broadcast_arrays(*[
+            np.clip(np.asarray(values[name], dtype=float), *self.bounds[name]) for name in self.axis_names
+        ])
+        points = np.stack(columns, axis=-1)
+        if self.log_space:
+            points = np.log(points)
+        result = self._interpolator(points).reshape(columns[0].shape)
+        return np.exp(result) if self.log_space else result
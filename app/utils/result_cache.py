@@ -0,0 +1,117 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import numpy as np
+import pandas as pd
+from typing import Any, Optional
+
+# Cache location; override with the CHEME_CACHE_DIR environment variable
+DEFAULT_CACHE_DIR = os.environ.get('CHEME_CACHE_DIR', os.path.join('.cache', 'regression_results'))
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def dataframe_hash(data: pd.DataFrame) -> str:
+    """
+    Hash the contents of a DataFrame.
+
+    The hash covers column names, dtypes and values, so it is stable across
+    processes and restarts and changes whenever the data changes.
+
+    Args:
+        data: DataFrame to hash
+
+    Returns:
+        str: Hex digest of the DataFrame contents
+    """
+    digest = hashlib.sha256()
+    digest.update(repr([(str(col), str(dtype)) for col, dtype in data.dtypes.items()]).encode())
+    digest.update(np.ascontiguousarray(pd.util.hash_pandas_object(data, index=True).to_numpy()).tobytes())
+    return digest.hexdigest()
+
+
+def make_cache_key(data: pd.DataFrame, **params) -> str:
+    """Build a cache key from the DataFrame contents and the analysis settings."""
+    digest = hashlib.sha256(dataframe_hash(data).encode())
+    digest.update(repr(sorted(params.items())).encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Size-bounded, least-recently-used cache of pickled results on disk."""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if it is missing or unreadable."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+
+        # Mark as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value under key and evict least-recently-used entries over the size bound."""
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(payload) > self.max_bytes:
+            return
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # Write to a temporary file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, self._path(key))
+
+        self._evict()
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        for path, _, _ in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _entries(self):
+        if not os.path.isdir(self.cache_dir):
+            return []
+
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".pkl"):
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((path, stat.st_mtime, stat.st_size))
+        return entries
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+
+        for path, _, size in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
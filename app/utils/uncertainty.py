@@ -0,0 +1,384 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+from typing import Dict, Iterable, Iterator, Mapping, Optional, Tuple
+from .regression import MODEL_TERMS, EXPONENT_INDEX, PARAMETER_NAMES
+from .mass_transfer_calc import PowerLawCorrelation
+
+# Number of resamples drawn and fitted together by default
+BOOTSTRAP_CHUNK = 1000
+
+# Seconds between updates of a live bootstrap summary
+BOOTSTRAP_REFRESH_SECONDS = 1.0
+
+# Upper bound on resamples x data points held in memory at once
+_CHUNK_ELEMENTS = 1 << 21
+
+
+def log_design(features: np.ndarray, model_type: int, x2: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the log-linearized least-squares system of the correlation.
+
+    log(Sh) - X2 log(Sc) = log(a) + sum of Xj log(group j) over the fitted
+    exponents, with X2 held at its fitted value.
+
+    Args:
+        features: Log features from log_features, shape (n_points, 4)
+        model_type: Model number (1-4)
+        x2: Fixed Schmidt number exponent
+
+    Returns:
+        Tuple containing:
+        - design: Columns [1, log(Re), log(We), log(Eg)] used by the model
+        - offset: X2 log(Sc), subtracted from log(Sh) before fitting
+    """
+    fitted = [name for name in MODEL_TERMS[model_type] if name != 'Sc']
+    design = np.column_stack([np.ones(len(features))] + [features[:, EXPONENT_INDEX[name]] for name in fitted])
+    return design, x2 * features[:, EXPONENT_INDEX['Sc']]
+
+
+def _coef_to_params(coef: np.ndarray, model_type: int, x2: float) -> np.ndarray:
+    """Convert log-space coefficients to rows of (a, X1, X2, X3, X4); unused exponents are NaN."""
+    fitted = [name for name in MODEL_TERMS[model_type] if name != 'Sc']
+    params = np.full((len(coef), len(PARAMETER_NAMES)), np.nan)
+    params[:, 0] = np.exp(coef[:, 0])
+    params[:, 2] = x2
+    for column, name in enumerate(fitted, start=1):
+        params[:, 1 + EXPONENT_INDEX[name]] = coef[:, column]
+    return params
+
+
+def _fit_weighted(log_sh: np.ndarray, design: np.ndarray, offset: np.ndarray, sh: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Solve one weighted log-space least-squares fit per row of weights."""
+    target = log_sh - offset
+
+    # Normal equations for every resample at once, shape (B, p, p) and (B, p)
+    gram = np.einsum('bn,ni,nj->bij', weights, design, design)
+    moment = weights @ (design * target[:, None])
+    coef = np.einsum('bij,bj->bi', np.linalg.pinv(gram), moment)
+
+    # R² of the back-transformed correlation on each resample
+    predicted = np.exp(coef @ design.T + offset)
+    total = weights.sum(axis=1)
+    mean = (weights @ sh) / total
+    ss_total = weights @ sh**2 - total * mean**2
+    ss_residual = np.einsum('bn,bn->b', weights, (sh - predicted)**2)
+    return coef, 1 - ss_residual / ss_total
+
+
+def iter_bootstrap(
+    sh: np.ndarray,
+    features: np.ndarray,
+    model_type: int,
+    x2: float,
+    n_resamples: int,
+    seed: Optional[int] = None,
+    chunk_size: int = BOOTSTRAP_CHUNK,
+    start: int = 0
+) -> Iterator[Tuple[int, pd.DataFrame]]:
+    """
+    Fit bootstrap resamples of the data in chunks, yielding each chunk as it completes.
+
+    Each chunk is split into blocks of at most _CHUNK_ELEMENTS resampled
+    points. A block draws its index matrix, turns it into per-point resample
+    counts and fits all its resamples together as a weighted log-space
+    least-squares problem, so memory stays bounded for any n_resamples and
+    chunk_size. Chunks are seeded from the seed and their start offset only,
+    so resample i is the same however the run is split.
+
+    Args:
+        sh: Experimental Sherwood numbers, shape (n_points,)
+        features: Log features from log_features, shape (n_points, 4)
+        model_type: Model number (1-4)
+        x2: Fixed Schmidt number exponent
+        n_resamples: Index one past the last resample to fit
+        seed: Seed for the resampling; None draws fresh entropy
+        chunk_size: Resamples per chunk; reduced further if a chunk would exceed the memory bound
+        start: Index of the first resample to fit, a multiple of chunk_size
+
+    Yields:
+        Tuple of (start offset, DataFrame with 'a', 'x1'..'x4' and 'r2' per resample)
+    """
+    sh = np.asarray(sh, dtype=float)
+    n_points = len(sh)
+    design, offset = log_design(features, model_type, x2)
+    entropy = np.random.SeedSequence(seed).entropy
+
+    # Split each chunk further if needed, without changing the random streams
+    block_size = max(1, min(chunk_size, _CHUNK_ELEMENTS // max(1, n_points)))
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for chunk_start in range(start, n_resamples, chunk_size):
+            size = min(chunk_size, n_resamples - chunk_start)
+            rng = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(chunk_start,)))
+            params = np.empty((size, len(PARAMETER_NAMES)))
+            r2 = np.empty(size)
+            for block in range(0, size, block_size):
+                # Consecutive draws from the chunk's stream give the same indices as one draw of the whole chunk
+                rows = rng.integers(0, n_points, size=(min(block_size, size - block), n_points))
+
+                # Resample counts per data point, one row per resample
+                flat = rows + n_points * np.arange(len(rows))[:, None]
+                weights = np.bincount(flat.ravel(), minlength=len(rows) * n_points).reshape(len(rows), n_points).astype(float)
+
+                coef, r2[block:block + len(rows)] = _fit_weighted(np.log(sh), design, offset, sh, weights)
+                params[block:block + len(rows)] = _coef_to_params(coef, model_type, x2)
+
+            chunk = pd.DataFrame(params, columns=PARAMETER_NAMES)
+            chunk['r2'] = r2
+            yield chunk_start, chunk
+
+
+def bootstrap(
+    sh: np.ndarray,
+    features: np.ndarray,
+    model_type: int,
+    x2: float,
+    n_resamples: int = 10000,
+    seed: Optional[int] = None,
+    chunk_size: int = BOOTSTRAP_CHUNK
+) -> pd.DataFrame:
+    """Fit n_resamples bootstrap resamples and return one row of parameters and R² per resample."""
+    chunks = [chunk for _, chunk in iter_bootstrap(sh, features, model_type, x2, n_resamples, seed, chunk_size)]
+    return pd.concat(chunks, ignore_index=True)
+
+
+def bootstrap_summary(samples: pd.DataFrame, level: float = 0.95) -> pd.DataFrame:
+    """
+    Summarize bootstrap samples with percentile confidence intervals.
+
+    Args:
+        samples: Bootstrap parameters from bootstrap, one row per resample
+        level: Confidence level of the intervals
+
+    Returns:
+        pandas.DataFrame: Mean, standard deviation and percentile interval
+        of every column that was fitted, indexed by column name
+    """
+    samples = samples.dropna(axis=1, how='all')
+    tail = (1 - level) / 2 * 100
+
+    return pd.DataFrame({
+        'Mean': samples.mean(),
+        'Std': samples.std(),
+        'CI Lower': samples.apply(lambda column: np.nanpercentile(column, tail)),
+        'CI Upper': samples.apply(lambda column: np.nanpercentile(column, 100 - tail))
+    })
+
+
+def leave_one_out(sh: np.ndarray, features: np.ndarray, model_type: int, x2: float) -> Dict:
+    """
+    Leave-one-out fits and influence diagnostics of the log-linearized correlation.
+
+    Deleting point i changes the least-squares solution by the rank-one
+    update -(XᵀX)⁻¹ xᵢ eᵢ / (1 - hᵢ), so all n leave-one-out fits, the
+    leverages hᵢ and Cook's distances come from a single factorization
+    instead of n refits.
+
+    Args:
+        sh: Experimental Sherwood numbers, shape (n_points,)
+        features: Log features from log_features, shape (n_points, 4)
+        model_type: Model number (1-4)
+        x2: Fixed Schmidt number exponent
+
+    Returns:
+        dict: Full-data 'estimate' and jackknife 'bias' and 'std' (Series
+        indexed by parameter), the leave-one-out fits 'loo' (one row per
+        deleted point), and 'leverage' and 'cooks_distance' per point
+    """
+    sh = np.asarray(sh, dtype=float)
+    design, offset = log_design(features, model_type, x2)
+    target = np.log(sh) - offset
+    n_points, n_coef = design.shape
+
+    gram_inv = np.linalg.pinv(design.T @ design)
+    coef = gram_inv @ (design.T @ target)
+    residual = target - design @ coef
+    leverage = np.einsum('ij,jk,ik->i', design, gram_inv, design)
+    variance = residual @ residual / max(1, n_points - n_coef)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Rank-one update of the solution for every deleted point at once
+        loo_coef = coef - (design @ gram_inv) * (residual / (1 - leverage))[:, None]
+        cooks_distance = residual**2 / (n_coef * variance) * leverage / (1 - leverage)**2
+
+    estimate = pd.Series(_coef_to_params(coef[None, :], model_type, x2)[0], index=PARAMETER_NAMES)
+    loo = pd.DataFrame(_coef_to_params(loo_coef, model_type, x2), columns=PARAMETER_NAMES)
+    loo_mean = loo.mean()
+
+    return {
+        'estimate': estimate,
+        'loo': loo,
+        'bias': (n_points - 1) * (loo_mean - estimate),
+        'std': np.sqrt((n_points - 1) / n_points * ((loo - loo_mean)**2).sum(min_count=1)),
+        'leverage': leverage,
+        'cooks_distance': cooks_distance
+    }
+
+
+def bca_interval(samples: pd.DataFrame, jackknife: Dict, level: float = 0.95) -> pd.DataFrame:
+    """
+    Bias-corrected and accelerated (BCa) bootstrap confidence intervals.
+
+    The bias correction comes from the share of bootstrap samples below the
+    full-data estimate and the acceleration from the skewness of the
+    leave-one-out estimates.
+
+    Args:
+        samples: Bootstrap parameters from bootstrap, one row per resample
+        jackknife: Result of leave_one_out for the same data and model
+        level: Confidence level of the intervals
+
+    Returns:
+        pandas.DataFrame: 'Estimate', 'CI Lower' and 'CI Upper' of every
+        fitted parameter, indexed by parameter name
+    """
+    estimate = jackknife['estimate'].dropna()
+    loo = jackknife['loo']
+    tail = (1 - level) / 2
+    z = stats.norm.ppf([tail, 1 - tail])
+
+    rows = {}
+    for name, value in estimate.items():
+        boot = samples[name].dropna().to_numpy()
+        if len(boot) == 0 or np.ptp(boot) == 0:
+            rows[name] = (value, value, value)
+            continue
+
+        share = np.clip(np.mean(boot < value), 1 / (len(boot) + 1), len(boot) / (len(boot) + 1))
+        bias = stats.norm.ppf(share)
+
+        spread = loo[name].mean() - loo[name].to_numpy()
+        denominator = 6 * np.sum(spread**2)**1.5
+        acceleration = np.sum(spread**3) / denominator if denominator > 0 else 0.0
+
+        quantiles = stats.norm.cdf(bias + (bias + z) / (1 - acceleration * (bias + z)))
+        lower, upper = np.percentile(boot, quantiles * 100)
+        rows[name] = (value, lower, upper)
+
+    return pd.DataFrame.from_dict(rows, orient='index', columns=['Estimate', 'CI Lower', 'CI Upper'])
+
+
+def parameter_covariance(correlation: PowerLawCorrelation, data: Mapping, sh: np.ndarray, fixed: Iterable[str] = ('x2',)) -> Dict:
+    """
+    Estimate the covariance of the fitted correlation parameters.
+
+    Uses the Gauss-Newton approximation s² (JᵀJ)⁻¹, where J is the analytic
+    gradient of Sh at the data points and s² the residual variance.
+
+    Args:
+        correlation: Fitted correlation
+        data: Dimensionless groups of the data points (dict or DataFrame)
+        sh: Experimental Sherwood numbers, shape (n_points,)
+        fixed: Parameters that were held fixed during the fit
+
+    Returns:
+        dict: Fitted parameter 'names', their 'covariance' matrix, the
+        residual 'variance' and the residual degrees of freedom 'dof'
+    """
+    sh = np.asarray(sh, dtype=float)
+    names = [name for name in correlation.parameter_names if name not in fixed]
+    columns = [correlation.parameter_names.index(name) for name in names]
+
+    jacobian = correlation.gradient(data)[:, columns]
+    residual = sh - correlation.predict(data)
+    dof = max(1, len(sh) - len(names))
+    variance = residual @ residual / dof
+
+    return {
+        'names': names,
+        'covariance': variance * np.linalg.pinv(jacobian.T @ jacobian),
+        'variance': variance,
+        'dof': dof
+    }
+
+
+def prediction_interval(correlation: PowerLawCorrelation, covariance: Dict, values: Mapping, level: float = 0.95) -> Dict[str, np.ndarray]:
+    """
+    Delta-method confidence interval of the predicted Sh at many operating points.
+
+    The standard error of Sh at each point is sqrt(gᵀ C g), with g the
+    analytic gradient of Sh and C the parameter covariance, evaluated for
+    every point in one array operation.
+
+    Args:
+        correlation: Fitted correlation
+        covariance: Result of parameter_covariance
+        values: Mapping from group name to scalars or arrays of operating points
+        level: Confidence level of the interval
+
+    Returns:
+        dict: Predicted 'sh', its standard error 'std' and the interval
+        'lower' and 'upper' bounds, each with the broadcast shape of the inputs
+    """
+    columns = [correlation.parameter_names.index(name) for name in covariance['names']]
+    gradient = correlation.gradient(values)[..., columns]
+
+    std = np.sqrt(np.einsum('...i,ij,...j->...', gradient, covariance['covariance'], gradient))
+    sh = correlation.predict(values)
+    half_width = stats.t.ppf(0.5 + level / 2, covariance['dof']) * std
+
+    return {'sh': sh, 'std': std, 'lower': sh - half_width, 'upper': sh + half_width}
+
+
+class BootstrapRun:
+    """
+    Bootstrap samples of one dataset and model that can be extended later.
+
+    The run keeps its seed, so extending it from 1,000 to 5,000 resamples
+    only fits the 4,000 new draws and gives the same samples as a single
+    run of 5,000. Fitted chunks are appended to a list and only combined
+    into one DataFrame when the samples are read. Runs are plain picklable
+    objects and can be stored in a ResultCache between sessions.
+    """
+
+    def __init__(self, sh: np.ndarray, features: np.ndarray, model_type: int, x2: float, seed: Optional[int] = None, chunk_size: int = BOOTSTRAP_CHUNK):
+        self.sh = np.asarray(sh, dtype=float)
+        self.features = np.asarray(features, dtype=float)
+        self.model_type = model_type
+        self.x2 = x2
+        self.entropy = np.random.SeedSequence(seed).entropy
+        self.chunk_size = chunk_size
+        self._chunks = []  # one DataFrame per chunk; only the last may be partial
+        self._samples = None
+
+    def __len__(self) -> int:
+        return sum(len(chunk) for chunk in self._chunks)
+
+    def __getstate__(self) -> Dict:
+        # The combined samples are rebuilt from the chunks when read
+        return dict(self.__dict__, _samples=None)
+
+    @property
+    def samples(self) -> pd.DataFrame:
+        """All samples fitted so far, one row per resample."""
+        if self._samples is None:
+            self._samples = pd.concat(self._chunks, ignore_index=True) if self._chunks else pd.DataFrame(columns=PARAMETER_NAMES + ['r2'], dtype=float)
+            # Keep the chunks as views of the combined samples rather than second copies
+            self._chunks = [self._samples.iloc[start:start + self.chunk_size] for start in range(0, len(self._samples), self.chunk_size)]
+        return self._samples
+
+    def extend(self, n_resamples: int) -> Iterator[int]:
+        """
+        Fit resamples until the run holds n_resamples, yielding the count after each chunk.
+
+        A partially filled last chunk is refitted from its start so that the
+        random streams stay aligned with the chunk boundaries. Each chunk
+        is appended without copying earlier samples.
+
+        Args:
+            n_resamples: Total number of resamples wanted
+
+        Yields:
+            int: Number of samples fitted so far
+        """
+        if len(self) >= n_resamples:
+            return
+
+        if self._chunks and len(self._chunks[-1]) < self.chunk_size:
+            self._chunks.pop()
+        start = len(self._chunks) * self.chunk_size
+        for chunk_start, chunk in iter_bootstrap(self.sh, self.features, self.model_type, self.x2, n_resamples, self.entropy, self.chunk_size, start):
+            self._chunks.append(chunk)
+            self._samples = None
+            yield chunk_start + len(chunk)
@@ -1,7 +1,17 @@
 import plotly.graph_objects as go
 import plotly.express as px
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence
+
+# Traces with more points than this are drawn with WebGL
+WEBGL_THRESHOLD = 5000
+
+# Largest number of points sent to the browser per trace
+MAX_PLOT_POINTS = 10000
+
+# Default and largest number of points per axis of model surfaces
+SURFACE_POINTS = 50
+MAX_SURFACE_POINTS = 200
 
 def create_bubble_plot(
     image: np.ndarray,
@@ -51,3 +61,109 @@ def create_bubble_plot(
     )
     
     return fig
+
+
+def downsample_indices(x: Sequence, y: Sequence, max_points: int = MAX_PLOT_POINTS) -> np.ndarray:
+    """
+    Pick at most max_points points that preserve the shape of y over x.
+
+    Points are ordered by x and split into equal-count bins; the minimum and
+    maximum of each bin are kept along with the first and last point, so
+    peaks, dips and the overall envelope survive downsampling.
+
+    Args:
+        x: Horizontal values
+        y: Vertical values
+        max_points: Largest number of points to keep
+
+    Returns:
+        numpy.ndarray: Indices of the kept points, in increasing x order
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n)
+
+    order = np.argsort(np.asarray(x), kind='stable')
+    bin_size = -(-n // max(1, (max_points - 2) // 2))
+    n_bins = -(-n // bin_size)
+    padding = n_bins * bin_size - n
+
+    # NaNs and padding never win a bin
+    y_sorted = y[order]
+    low = np.concatenate([np.where(np.isnan(y_sorted), np.inf, y_sorted), np.full(padding, np.inf)])
+    high = np.concatenate([np.where(np.isnan(y_sorted), -np.inf, y_sorted), np.full(padding, -np.inf)])
+
+    offsets = np.arange(n_bins) * bin_size
+    keep = np.concatenate([
+        [0, n - 1],
+        offsets + np.argmin(low.reshape(n_bins, bin_size), axis=1),
+        offsets + np.argmax(high.reshape(n_bins, bin_size), axis=1)
+    ])
+    return order[np.unique(np.minimum(keep, n - 1))]
+
+
+def _subset(value, keep: np.ndarray, n: int):
+    """Subset per-point arrays (also inside dicts such as marker) to the kept points."""
+    if isinstance(value, dict):
+        return {key: _subset(item, keep, n) for key, item in value.items()}
+    if not isinstance(value, str) and hasattr(value, '__len__') and len(value) == n:
+        return np.asarray(value)[keep]
+    return value
+
+
+def downsampled_trace(
+    trace_type,
+    x: Sequence,
+    y: Sequence,
+    max_points: int = MAX_PLOT_POINTS,
+    hover_labels: Optional[Sequence] = None,
+    hover_format: str = "Data Point {}",
+    **kwargs
+):
+    """
+    Build a plotly trace from at most max_points shape-preserving points.
+
+    Every per-point argument (z, text, marker colors and sizes) is subset to
+    the same points, and hover text is only formatted for the points kept.
+
+    Args:
+        trace_type: Plotly trace class such as go.Scatter, go.Bar or go.Scatter3d
+        x: Horizontal values
+        y: Vertical values, used to choose the points
+        max_points: Largest number of points to send to the browser
+        hover_labels: Per-point labels formatted into the trace text
+        hover_format: Format string applied to each kept label
+        **kwargs: Other trace arguments
+
+    Returns:
+        Trace of the given type
+    """
+    x = np.asarray(x)
+    n = len(x)
+    keep = downsample_indices(x, y, max_points)
+
+    kwargs = {key: _subset(value, keep, n) for key, value in kwargs.items()}
+    if hover_labels is not None:
+        kwargs['text'] = [hover_format.format(label) for label in np.asarray(hover_labels)[keep]]
+
+    return trace_type(x=x[keep], y=np.asarray(y)[keep], **kwargs)
+
+
+def scatter_trace(
+    x: Sequence,
+    y: Sequence,
+    max_points: int = MAX_PLOT_POINTS,
+    webgl_threshold: int = WEBGL_THRESHOLD,
+    **kwargs
+):
+    """Scatter trace downsampled by downsampled_trace, drawn with WebGL above webgl_threshold points."""
+    trace_type = go.Scattergl if min(len(x), max_points) > webgl_threshold else go.Scatter
+    return downsampled_trace(trace_type, x, y, max_points, **kwargs)
+
+
+def histogram_trace(values: Sequence, bins: int = 20, density: bool = False, **kwargs) -> go.Bar:
+    """Histogram binned in NumPy and sent as bars, so the payload does not grow with the data."""
+    values = np.asarray(values, dtype=float)
+    counts, edges = np.histogram(values[np.isfinite(values)], bins=bins, density=density)
+    return go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges), **kwargs)
@@ -0,0 +1,28 @@
+# Views package initialization
+import importlib
+from typing import Callable, Dict, Tuple
+
+# Module and entry point of each page; a page is imported when first selected
+PAGES: Dict[str, Tuple[str, str]] = {
+    "Bubble Analysis": ("bubble_analysis", "app"),
+    "Mass Transfer Analysis": ("mass_transfer", "app"),
+}
+
+_loaded: Dict[str, Callable[[], None]] = {}
+
+
+def load_page(name: str) -> Callable[[], None]:
+    """
+    Import a page on first use and return its entry point.
+
+    Args:
+        name: Page name, a key of PAGES
+
+    Returns:
+        Callable: Function rendering the page; cached for later calls
+    """
+    if name not in _loaded:
+        module_name, entry_point = PAGES[name]
+        module = importlib.import_module(f".{module_name}", __name__)
+        _loaded[name] = getattr(module, entry_point)
+    return _loaded[name]
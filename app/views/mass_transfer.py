@@ -0,0 +1,2832 @@
+# ...existing code from t_1.py...
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+import time
+import pickle
+import os
+from streamlit_lottie import st_lottie
+import warnings
+from collections import OrderedDict
+from ..utils.regression import (
+    MAX_ITERATIONS,
+    MAX_DATA_POINTS,
+    GRID_POINTS,
+    X1_RANGE,
+    X2_VALUE,
+    X3_RANGE,
+    X4_RANGE,
+    A_BOUNDS,
+    DEFAULT_BOUNDS,
+    DEFAULT_TOP_K,
+    model_type_from_name,
+    log_features
+)
+from ..utils.analysis import AnalysisStages, SEARCH_MODES, model_parameters, required_columns, run_analysis, detailed_analysis
+from ..utils.assets import load_lottie
+from ..utils.result_cache import ResultCache, make_cache_key
+from ..utils.mass_transfer_calc import PowerLawCorrelation
+from ..utils.optimization import OPTIMUM_GRID_POINTS, REFINEMENT_LEVELS, evaluate_grid, optimize_conditions
+from ..utils.response_table import RESPONSE_TABLE_CACHE_ENTRIES, ResponseTable
+from ..utils.sensitivity import SOBOL_SAMPLES, sobol_indices
+from ..utils.visualization import SURFACE_POINTS, MAX_SURFACE_POINTS, downsample_indices, downsampled_trace, scatter_trace, histogram_trace
+from ..utils.uncertainty import BOOTSTRAP_REFRESH_SECONDS, bootstrap_summary, BootstrapRun, parameter_covariance, prediction_interval, leave_one_out, bca_interval
+
+def apply_styles():
+    """Apply the custom styling of the page"""
+    warnings.filterwarnings('ignore')
+    
+    # Custom CSS for better UI
+    st.markdown("""
+<style>
+    .main {
+        background-color: #f5f7f9;
+        color: #1e1e1e;
+    }
+    .stButton button {
+        background-color: #4CAF50;
+        color: white;
+        font-weight: bold;
+        border-radius: 8px;
+        padding: 10px 24px;
+        transition: all 0.3s;
+    }
+    .stButton button:hover {
+        background-color: #45a049;
+        box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
+    }
+    h1, h2, h3 {
+        color: #2c3e50;
+    }
+    .highlight {
+        background-color: #f0f7ff;
+        padding: 20px;
+        border-radius: 10px;
+        border-left: 5px solid #4CAF50;
+        margin: 10px 0;
+    }
+    .result-card {
+        background-color: white;
+        padding: 20px;
+        border-radius: 10px;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        margin: 10px 0;
+    }
+    .dark-mode {
+        background-color: #1e1e1e;
+        color: #f5f7f9;
+    }
+    .dark-mode h1, .dark-mode h2, .dark-mode h3 {
+        color: #f5f7f9;
+    }
+    .dark-mode .highlight {
+        background-color: #2c3e50;
+        border-left: 5px solid #45a049;
+    }
+    .dark-mode .result-card {
+        background-color: #2c3e50;
+        color: #f5f7f9;
+    }
+    .tooltip {
+        position: relative;
+        display: inline-block;
+        border-bottom: 1px dotted black;
+    }
+    .tooltip .tooltiptext {
+        visibility: hidden;
+        width: 120px;
+        background-color: black;
+        color: #fff;
+        text-align: center;
+        border-radius: 6px;
+        padding: 5px 0;
+        position: absolute;
+        z-index: 1;
+        bottom: 125%;
+        left: 50%;
+        margin-left: -60px;
+        opacity: 0;
+        transition: opacity 0.3s;
+    }
+    .tooltip:hover .tooltiptext {
+        visibility: visible;
+        opacity: 1;
+    }
+    .stProgress > div > div > div > div {
+        background-color: #4CAF50;
+    }
+</style>
+""", unsafe_allow_html=True)
+
+# Display a bundled animation; nothing is fetched when the page is imported
+def show_animation(name, key):
+    animation = load_lottie(name)
+    if animation is not None:
+        st_lottie(animation, height=200, key=key)
+
+# Persistent cache of regression results
+result_cache = ResultCache()
+
+def init_session_state():
+    """Initialize session state variables"""
+    if 'data' not in st.session_state:
+        st.session_state.data = None
+    if 'model_results' not in st.session_state:
+        st.session_state.model_results = None
+    if 'selected_model_data' not in st.session_state:
+        st.session_state.selected_model_data = None
+    if 'theme' not in st.session_state:
+        st.session_state.theme = 'light'
+    if 'history' not in st.session_state:
+        st.session_state.history = []
+    if 'r2_surface' not in st.session_state:
+        st.session_state.r2_surface = None
+    if 'model_comparison' not in st.session_state:
+        st.session_state.model_comparison = None
+    if 'detailed_analysis' not in st.session_state:
+        st.session_state.detailed_analysis = False
+    if 'analysis_stages' not in st.session_state:
+        st.session_state.analysis_stages = None
+    if 'response_tables' not in st.session_state:
+        st.session_state.response_tables = OrderedDict()
+
+def render_sidebar():
+    """Sidebar for theme toggle and history"""
+    with st.sidebar:
+        st.title("Settings")
+        
+        # Create tabs for settings and history
+        tab1, tab2 = st.tabs(["Settings", "History"])
+        
+        with tab1:
+            theme = st.radio("Choose Theme", ["Light", "Dark"], index=0 if st.session_state.theme == 'light' else 1)
+            st.session_state.theme = theme.lower()
+            
+            if st.session_state.theme == 'dark':
+                st.markdown("""
+                <script>
+                    document.body.classList.add('dark-mode');
+                </script>
+                """, unsafe_allow_html=True)
+            else:
+                st.markdown("""
+                <script>
+                    document.body.classList.remove('dark-mode');
+                </script>
+                """, unsafe_allow_html=True)
+        
+        with tab2:
+            st.header("Analysis History")
+            if len(st.session_state.history) > 0:
+                history_df = pd.DataFrame(st.session_state.history)
+                st.dataframe(history_df)
+            else:
+                st.info("No analysis history available yet.")
+
+# Main app
+def app():
+    """Render the page inside the analysis suite"""
+    apply_styles()
+    init_session_state()
+    render_sidebar()
+    
+    st.title("Advanced Mass Transfer Analysis Tool")
+    
+    # Description and options
+    st.markdown("""
+    ## Project Description
+    
+    This advanced tool is designed for comprehensive mass transfer analysis in chemical engineering applications. 
+    It utilizes cutting-edge machine learning algorithms to analyze experimental data and develop accurate predictive models 
+    for Sherwood number correlations. The tool can handle various dimensionless parameters including Reynolds number, 
+    Schmidt number, Weber number, and Eotvos number to predict mass transfer coefficients.
+    
+    The application employs multiple regression techniques, neural networks, and ensemble methods to provide 
+    robust analysis and visualization of mass transfer phenomena.
+    """)
+    
+    # Display lottie animation
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        show_animation("analysis", "analysis_animation")
+    
+    # Start mass transfer analysis directly
+    mass_transfer_analysis()
+
+def mass_transfer_analysis():
+    st.header("Mass Transfer Analysis")
+    
+    st.markdown("""
+    <div class="highlight">
+    <h3>About Mass Transfer Analysis</h3>
+    <p>Mass transfer analysis is crucial in chemical engineering for understanding the transport of chemical species within a system. 
+    This module uses dimensionless correlations to predict mass transfer coefficients based on experimental data.</p>
+    
+    <p>The analysis employs four different models based on the Sherwood number (Sh) correlation with Reynolds number (Re), 
+    Schmidt number (Sc), Weber number (We), and Eotvos number (Eg). Through regression analysis, the tool identifies 
+    the optimal model parameters that best fit your experimental data.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Model selection
+    st.subheader("Model Selection")
+    
+    model_descriptions = {
+        "Model 1": "Sh = a(Re^X1)(Sc^X2)(We^X3)(Eg^X4)",
+        "Model 2": "Sh = a(Re^X1)(Sc^X2)(We^X3)",
+        "Model 3": "Sh = a(Re^X1)(Sc^X2)(Eg^X4)",
+        "Model 4": "Sh = a(Re^X1)(Sc^X2)"
+    }
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        selected_model = st.selectbox("Select Model", list(model_descriptions.keys()))
+        st.markdown(f"**Selected Model Equation**: {model_descriptions[selected_model]}")
+        
+        st.markdown("""
+        **Parameter Ranges:**
+        - X1: 0.65 to 0.75 (step size depends on iterations)
+        - X2: fixed at 0.33
+        - X3: -0.5 to -0.2 (step size depends on iterations) - for Models 1 & 2
+        - X4: 0.1 to 0.15 (step size depends on iterations) - for Models 1 & 3
+        """)
+    
+    with col2:
+        # Display model visualization
+        fig = go.Figure()
+        
+        x = np.linspace(0, 10000, 100)
+        
+        # Sample visualization of how different models might look
+        fig.add_trace(go.Scatter(x=x, y=10*x**0.7*0.33**0.33, name="Model 4", line=dict(color='blue')))
+        fig.add_trace(go.Scatter(x=x, y=12*x**0.75*0.33**0.33*x**0.12, name="Model 3", line=dict(color='green')))
+        fig.add_trace(go.Scatter(x=x, y=8*x**0.68*0.33**0.33*x**(-0.3), name="Model 2", line=dict(color='red')))
+        fig.add_trace(go.Scatter(x=x, y=15*x**0.72*0.33**0.33*x**(-0.25)*x**0.13, name="Model 1", line=dict(color='purple')))
+        
+        fig.update_layout(
+            title="Visualization of Model Behavior",
+            xaxis_title="Reynolds Number (Re)",
+            yaxis_title="Sherwood Number (Sh)",
+            legend_title="Models",
+            height=300,
+            margin=dict(l=0, r=0, t=40, b=0)
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Data input section
+    st.subheader("Data Input")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        num_data_points = st.number_input("Number of Experimental Data Points", min_value=3, max_value=MAX_DATA_POINTS, value=10)
+    
+    with col2:
+        num_iterations = st.number_input("Number of Iterations for Analysis", min_value=1, max_value=MAX_ITERATIONS, value=100)
+    
+    # Search mode
+    search_mode = st.radio("Select Search Mode", SEARCH_MODES, horizontal=True)
+    
+    top_k = st.number_input("Number of Top Results to Keep", min_value=1, max_value=100000, value=DEFAULT_TOP_K)
+    
+    if search_mode == "Exhaustive Grid":
+        grid_resolution = st.number_input("Grid Points per Exponent", min_value=2, max_value=200, value=GRID_POINTS)
+    
+    elif search_mode == "Free-Exponent Fit":
+        fit_bounds = get_free_fit_bounds(selected_model)
+        n_starts = st.number_input("Number of Multi-Start Seeds", min_value=1, max_value=1000, value=8)
+    
+    else:
+        use_seed = st.checkbox("Use a fixed random seed")
+        seed = st.number_input("Random Seed", min_value=0, value=42) if use_seed else None
+    
+    n_folds = None
+    if search_mode == "Random Search":
+        if st.checkbox("Rank candidates by k-fold cross-validated RÂ²"):
+            n_folds = st.number_input("Number of Folds", min_value=2, max_value=20, value=5)
+    
+    max_workers = 1
+    if search_mode in ["Random Search", "Free-Exponent Fit"]:
+        max_workers = st.number_input("Worker Processes", min_value=1, max_value=os.cpu_count() or 1, value=1)
+    
+    # Settings that determine the results of the selected search
+    if search_mode == "Exhaustive Grid":
+        search_settings = {'grid_resolution': grid_resolution, 'top_k': top_k}
+    elif search_mode == "Free-Exponent Fit":
+        search_settings = {'bounds': fit_bounds, 'n_starts': n_starts, 'top_k': top_k}
+    else:
+        search_settings = {'num_iterations': num_iterations, 'seed': seed, 'top_k': top_k, 'n_folds': n_folds}
+    
+    if search_mode == "Compare All Models":
+        st.info("All four models are fitted to the same exponent draws. Your data needs Re, Sc, We and Eg columns.")
+    
+    use_cache = st.checkbox("Reuse cached results of identical analyses", value=True)
+    
+    # Columns the selected model and search mode need
+    model_type = model_type_from_name(selected_model)
+    required_cols = required_columns(model_type, search_mode)
+    
+    # Data input method
+    data_input_method = st.radio("Select Data Input Method", ["Upload Excel File", "Enter Data Manually", "Load Previous Data"])
+    
+    if data_input_method == "Upload Excel File":
+        uploaded_file = st.file_uploader("Upload Excel file with experimental data", type=["xlsx", "xls"])
+        
+        if uploaded_file is not None:
+            try:
+                df = pd.read_excel(uploaded_file)
+                st.success("File uploaded successfully!")
+                
+                # Check if the dataframe has the required columns
+                missing_cols = [col for col in required_cols if col not in df.columns]
+                
+                if missing_cols:
+                    st.error(f"Missing required columns: {', '.join(missing_cols)}")
+                    st.info("Please ensure your Excel file has columns for all parameters in the selected model.")
+                    
+                    # Show example format
+                    st.markdown("**Example format:**")
+                    example_df = pd.DataFrame({
+                        "Sh": [10.5, 15.2, 20.1],
+                        "Re": [1000, 2000, 3000],
+                        "Sc": [0.33, 0.33, 0.33],
+                        "We": [2.5, 3.5, 4.5],
+                        "Eg": [0.12, 0.15, 0.18]
+                    })
+                    st.dataframe(example_df)
+                else:
+                    st.session_state.data = df
+                    st.write("Preview of uploaded data:")
+                    st.dataframe(df)
+            except Exception as e:
+                st.error(f"Error reading file: {e}")
+    
+    elif data_input_method == "Enter Data Manually":
+        st.write("Enter your experimental data:")
+        
+        # Initialize empty dataframe with required columns
+        if st.session_state.data is None or st.session_state.data.shape[0] != num_data_points or not all(col in st.session_state.data.columns for col in required_cols):
+            data = {col: [0.0] * num_data_points for col in required_cols}
+            st.session_state.data = pd.DataFrame(data)
+        
+        # Create a form for data entry
+        with st.form("data_input_form"):
+            edited_df = st.experimental_data_editor(st.session_state.data, use_container_width=True)
+            submit_button = st.form_submit_button("Save Data")
+            
+            if submit_button:
+                st.session_state.data = edited_df
+                st.success("Data saved successfully!")
+    
+    elif data_input_method == "Load Previous Data":
+        if os.path.exists("previous_data.pkl"):
+            try:
+                with open("previous_data.pkl", "rb") as f:
+                    previous_data_dict = pickle.load(f)
+                
+                # Show available datasets
+                dataset_names = list(previous_data_dict.keys())
+                selected_dataset = st.selectbox("Select a previously saved dataset", dataset_names)
+                
+                if selected_dataset:
+                    st.session_state.data = previous_data_dict[selected_dataset]
+                    st.write("Preview of loaded data:")
+                    st.dataframe(st.session_state.data)
+                    st.success(f"Dataset '{selected_dataset}' loaded successfully!")
+            except Exception as e:
+                st.error(f"Error loading previous data: {e}")
+        else:
+            st.info("No previous data found. Please upload a file or enter data manually first.")
+    
+    # Save current data for future use
+    if st.session_state.data is not None and st.button("Save Current Data for Future Use"):
+        dataset_name = st.text_input("Enter a name for this dataset", "Dataset_" + time.strftime("%Y%m%d_%H%M%S"))
+        
+        if dataset_name:
+            try:
+                # Load existing data if available
+                previous_data_dict = {}
+                if os.path.exists("previous_data.pkl"):
+                    with open("previous_data.pkl", "rb") as f:
+                        previous_data_dict = pickle.load(f)
+                
+                # Add current data
+                previous_data_dict[dataset_name] = st.session_state.data
+                
+                # Save updated dictionary
+                with open("previous_data.pkl", "wb") as f:
+                    pickle.dump(previous_data_dict, f)
+                
+                st.success(f"Dataset '{dataset_name}' saved successfully!")
+            except Exception as e:
+                st.error(f"Error saving data: {e}")
+    
+    # Run analysis if data is available
+    if st.session_state.data is not None and st.button("Run Regression Analysis"):
+        with st.spinner("Running regression analysis..."):
+            # Display loading animation
+            show_animation("loading", "loading_animation")
+            
+            # Check if data has required columns
+            missing_cols = [col for col in required_cols if col not in st.session_state.data.columns]
+            
+            if missing_cols:
+                st.error(f"Missing required columns: {', '.join(missing_cols)}")
+            else:
+                # Reuse the results of an identical earlier analysis if available
+                cache_key = make_cache_key(
+                    st.session_state.data,
+                    search_mode=search_mode,
+                    model=selected_model,
+                    settings=sorted(search_settings.items()),
+                    ranges=(X1_RANGE, X2_VALUE, X3_RANGE, X4_RANGE, A_BOUNDS, GRID_POINTS),
+                    entry_format=4  # (results, RÂ² surface, model comparison)
+                )
+                cached = result_cache.get(cache_key) if use_cache else None
+                
+                if cached is not None:
+                    model_results, st.session_state.r2_surface, st.session_state.model_comparison = cached
+                    st.info("Loaded results of an identical previous analysis from the cache.")
+                else:
+                    # Run regression analysis
+                    analysis = run_search(st.session_state.data, model_type, search_mode, search_settings, max_workers)
+                    model_results = analysis['results']
+                    st.session_state.r2_surface = analysis['r2_surface']
+                    st.session_state.model_comparison = analysis['comparison']
+                    
+                    result_cache.set(cache_key, (model_results, st.session_state.r2_surface, st.session_state.model_comparison))
+                
+                st.session_state.model_results = model_results
+                st.session_state.detailed_analysis = False
+                
+                # Show success animation
+                show_animation("success", "success_animation")
+                st.success("Analysis completed successfully!")
+    
+    # Display results if available
+    if st.session_state.model_results is not None:
+        display_regression_results(st.session_state.data, st.session_state.model_results, selected_model, num_iterations)
+
+def run_search(data, model_type, search_mode, search_settings, max_workers=1):
+    """Run the selected search, showing progress and the best models found so far"""
+    
+    # Progress bar and running table of the best models so far
+    progress_bar = st.progress(0)
+    leaderboard = st.empty()
+    
+    def show_progress(completed, results):
+        progress_bar.progress(completed / search_settings['num_iterations'])
+        leaderboard.dataframe(results.to_frame(0, 10))
+    
+    analysis = run_analysis(data, model_type, search_mode, search_settings, max_workers, progress=show_progress)
+    
+    progress_bar.empty()
+    leaderboard.empty()
+    
+    if not analysis['converged']:
+        st.warning("None of the starting points converged. Consider widening the parameter bounds.")
+    
+    return analysis
+
+def get_free_fit_bounds(selected_model):
+    """Get parameter bounds for the free-exponent fit from user input"""
+    parameters = model_parameters(model_type_from_name(selected_model))
+    
+    st.markdown("**Parameter Bounds** (set lower = upper to hold a parameter fixed)")
+    
+    bounds = {}
+    for param, col in zip(parameters, st.columns(len(parameters))):
+        with col:
+            lower, upper = DEFAULT_BOUNDS[param]
+            lower = st.number_input(f"{param} lower", value=float(lower), format="%.4f")
+            upper = st.number_input(f"{param} upper", value=float(upper), format="%.4f")
+            bounds[param] = (lower, max(lower, upper))
+    
+    return bounds
+
+def display_regression_results(data, model_results, selected_model, num_iterations):
+    """Display regression analysis results"""
+    st.header("Regression Analysis Results")
+    
+    # Display input data
+    st.subheader("Input Data")
+    st.dataframe(data)
+    
+    # Display model parameters
+    st.subheader("Model Parameters")
+    
+    # Create a table of parameters used in the model
+    model_type = int(selected_model.split(" ")[1])
+    
+    params_df = pd.DataFrame({
+        'Parameter': ['X1', 'X2', 'X3', 'X4'],
+        'Range/Value': [
+            '0.65 to 0.75', 
+            'Fixed at 0.33', 
+            '-0.5 to -0.2' if model_type in [1, 2] else 'Not used',
+            '0.1 to 0.15' if model_type in [1, 3] else 'Not used'
+        ],
+        'Description': [
+            'Reynolds number exponent', 
+            'Schmidt number exponent', 
+            'Weber number exponent' if model_type in [1, 2] else 'Not applicable',
+            'Eotvos number exponent' if model_type in [1, 3] else 'Not applicable'
+        ]
+    })
+    
+    st.table(params_df)
+    
+    # Compare the fitted models when all four were run
+    if st.session_state.model_comparison is not None:
+        display_model_comparison(st.session_state.model_comparison)
+    
+    # Display all regression results
+    st.subheader("All Regression Results")
+    
+    # Equations are only formatted for the ranked results shown here
+    results_df = model_results.to_frame()
+    
+    st.dataframe(results_df)
+    
+    # Plot RÂ² distribution over every evaluated candidate
+    counts, edges = model_results.r2_histogram()
+    
+    fig = go.Figure(
+        go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
+            marker=dict(color='#4CAF50')
+        )
+    )
+    
+    fig.update_layout(
+        title='Distribution of RÂ² Values',
+        xaxis_title='RÂ² Value',
+        yaxis_title='Frequency',
+        bargap=0.1
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+    
+    if model_results.r2_below_range:
+        st.caption(f"{model_results.r2_below_range} of {model_results.evaluated} candidates with RÂ² below 0 are not shown.")
+    
+    # Plot RÂ² surface from the exhaustive grid search
+    if st.session_state.r2_surface is not None:
+        display_r2_surface(st.session_state.r2_surface, model_type)
+    
+    # Select model for further analysis
+    st.subheader("Further Analysis")
+    
+    selected_rank = st.number_input(
+        "Enter the rank of the model you want to analyze further:", 
+        min_value=1, 
+        max_value=len(model_results), 
+        value=1
+    )
+    
+    selected_model_data = model_results[selected_rank - 1]
+    st.session_state.selected_model_data = selected_model_data
+    
+    st.write(f"Selected Model: **{selected_model_data['model']}**")
+    st.write(f"RÂ² Value: **{selected_model_data['r2']:.6f}**")
+    if selected_model_data['r2_cv'] is not None:
+        st.write(f"Cross-Validated RÂ² Value: **{selected_model_data['r2_cv']:.6f}**")
+    
+    # Input for further analysis
+    st.subheader("Mass Transfer Coefficient Calculation")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        char_length = st.number_input("Characteristic Length (m):", min_value=1e-6, max_value=1.0, value=0.01, format="%.6f")
+    
+    with col2:
+        diffusivity = st.number_input("Diffusivity (mÂ²/s):", min_value=1e-12, max_value=1e-5, value=1e-9, format="%.2e")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        w_min = st.number_input("Minimum W (rpm):", min_value=0, max_value=10000, value=100)
+        w_max = st.number_input("Maximum W (rpm):", min_value=0, max_value=10000, value=1000)
+    
+    with col2:
+        i_min = st.number_input("Minimum I (A):", min_value=0.0, max_value=1000.0, value=1.0)
+        i_max = st.number_input("Maximum I (A):", min_value=0.0, max_value=1000.0, value=10.0)
+    
+    if st.button("Proceed with Analysis"):
+        # Save to history
+        history_entry = {
+            'Date': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'Model': selected_model,
+            'Data Points': len(data),
+            'Iterations': num_iterations,
+            'Selected Model': selected_model_data['model'],
+            'RÂ²': selected_model_data['r2'],
+            'Char Length': char_length,
+            'Diffusivity': diffusivity,
+            'W Range': f"{w_min}-{w_max}",
+            'I Range': f"{i_min}-{i_max}"
+        }
+        st.session_state.history.append(history_entry)
+        st.session_state.detailed_analysis = True
+    
+    # Stays open while widgets inside it rerun the page
+    if st.session_state.detailed_analysis:
+        perform_detailed_analysis(data, selected_model_data, char_length, diffusivity, w_min, w_max, i_min, i_max, len(data), model_type)
+
+def display_model_comparison(comparison):
+    """Display the AIC/BIC comparison of all four models"""
+    st.subheader("Model Comparison")
+    
+    st.dataframe(comparison.style.format({
+        'R²': '{:.6f}',
+        'AIC': '{:.2f}',
+        'BIC': '{:.2f}',
+        'Fit Time (s)': '{:.4f}'
+    }))
+    
+    st.markdown(f"**{comparison['Model'][0]}** has the lowest AIC. Lower AIC and BIC indicate a better balance between fit quality and number of parameters.")
+
+def display_r2_surface(surface, model_type):
+    """Display the RÂ² surface of an exhaustive grid search"""
+    st.subheader("RÂ² Surface")
+    
+    r2 = surface['r2']
+    
+    if model_type == 4:
+        fig = go.Figure(go.Scatter(x=surface['x1'], y=r2[:, 0, 0], mode='lines+markers', line=dict(color='#4CAF50')))
+        fig.update_layout(xaxis_title='X1', yaxis_title='RÂ² Value')
+    else:
+        # Best RÂ² over X4 against X1 and X3, or the single remaining exponent
+        if model_type == 3:
+            z, x, x_title = r2[:, 0, :], surface['x4'], 'X4'
+        else:
+            z, x, x_title = np.nanmax(r2, axis=2), surface['x3'], 'X3'
+        
+        fig = go.Figure(go.Heatmap(z=z, x=x, y=surface['x1'], colorscale='Viridis', colorbar=dict(title='RÂ²')))
+        fig.update_layout(xaxis_title=x_title, yaxis_title='X1')
+    
+    fig.update_layout(
+        title='RÂ² Across the Exponent Grid' + (' (best over X4)' if model_type == 1 else ''),
+        height=500
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+
+def correlation_from_items(a, exponents):
+    """Rebuild a correlation from its coefficient and (group, exponent) pairs"""
+    exponents = dict(exponents)
+    return PowerLawCorrelation(a, *[exponents.get(group) for group in PowerLawCorrelation.GROUPS])
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def predicted_surface(a, exponents, axis_bounds, resolution, fixed):
+    """
+    Evaluate the correlation over two groups, cached per model, axes and fixed values.
+
+    Args:
+        a: Correlation coefficient
+        exponents: Tuple of (group, exponent) pairs of the correlation
+        axis_bounds: Tuple of (group, (min, max)) pairs for the X and Y axes
+        resolution: Number of points per axis
+        fixed: Tuple of (group, value) pairs held constant
+
+    Returns:
+        Tuple of the X and Y axis values and Sh with shape (len(Y), len(X))
+    """
+    axes, sh = evaluate_grid(correlation_from_items(a, exponents), dict(axis_bounds), resolution, dict(fixed))
+    x_values, y_values = axes.values()
+    return x_values, y_values, sh.T
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_sobol_indices(a, exponents, bounds, n_samples):
+    """Sobol indices of the correlation, cached per model, bounds and sample count"""
+    return sobol_indices(correlation_from_items(a, exponents), dict(bounds), n_samples=n_samples, seed=0)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_optimal_conditions(a, exponents, bounds, resolution, levels):
+    """Optimal operating conditions of the correlation, cached per model and search settings"""
+    return optimize_conditions(correlation_from_items(a, exponents), dict(bounds), resolution=resolution, levels=levels)
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def fit_random_forest(data):
+    """Fit the Random Forest surrogate of Sh, cached per dataset"""
+    # scikit-learn is imported only once the surrogate is needed
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.metrics import r2_score
+    from sklearn.model_selection import train_test_split
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import StandardScaler
+    
+    X = data.drop('Sh', axis=1)
+    y = data['Sh']
+    
+    # Split data for training and validation
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    
+    # Create a pipeline with preprocessing and the model
+    pipeline = Pipeline([
+        ('scaler', StandardScaler()),
+        ('model', RandomForestRegressor(random_state=42))
+    ])
+    
+    pipeline.fit(X_train, y_train)
+    
+    return pipeline, r2_score(y_test, pipeline.predict(X_test))
+
+def perform_detailed_analysis(data, model_data, char_length, diffusivity, w_min, w_max, i_min, i_max, num_points, model_type):
+    """Perform detailed analysis for the selected model"""
+    st.header("Detailed Analysis Results")
+    
+    # Extract model parameters
+    a = model_data['a']
+    x1 = model_data['x1']
+    x2 = model_data['x2']
+    x3 = model_data['x3']
+    x4 = model_data['x4']
+    
+    # Stage cache of this dataset, kept across reruns so that a changed input
+    # recomputes only the stages downstream of it
+    stages = st.session_state.analysis_stages
+    if stages is None or stages.data is not data:
+        stages = AnalysisStages(data)
+        st.session_state.analysis_stages = stages
+    
+    # Correlation, the column-wise comparison table and its error summary
+    analysis = detailed_analysis(data, model_data, model_type, char_length, diffusivity, (w_min, w_max), (i_min, i_max), stages)
+    stage_keys = analysis['keys']
+    correlation = analysis['correlation']
+    results_df = analysis['comparison']
+    observed_sh = results_df['Observed Sh'].to_numpy()
+    
+    # Display results table
+    st.subheader("Comparison of Experimental and Model Results")
+    st.dataframe(results_df)
+    
+    mean_error = analysis['mean_error']
+    max_error = analysis['max_error']
+    
+    st.write(f"Mean Absolute Percentage Error: **{mean_error:.2f}%**")
+    st.write(f"Maximum Absolute Percentage Error: **{max_error:.2f}%**")
+    
+    # Check if errors are within acceptable range
+    if not analysis['within_threshold']:
+        st.warning("Some percentage errors exceed 10%. Consider selecting a different model or refining your data.")
+    else:
+        st.success("All percentage errors are within the acceptable range (â‰¤10%).")
+    
+    # Visualization options
+    st.subheader("Visualization Options")
+    
+    # Points sent to the parity plots; the MTC is proportional to Sh, so one selection serves both
+    _, parity_indices = stages.run(
+        'parity_points', (), (stage_keys['predictions'],),
+        lambda: downsample_indices(results_df['Experimental Sh'], results_df['Observed Sh'])
+    )
+    parity_df = results_df.iloc[parity_indices]
+    
+    # Create tabs for different visualizations
+    viz_tabs = st.tabs([
+        "Sh Comparison", 
+        "MTC Comparison", 
+        "Sh vs Data Points", 
+        "MTC vs Data Points",
+        "Sh & MTC Relationships",
+        "Current & RPM Effects",
+        "Error Analysis"
+    ])
+    
+    # Sh Comparison
+    with viz_tabs[0]:
+        def build_figure():
+            fig = px.scatter(
+                parity_df, 
+                x='Experimental Sh', 
+                y='Observed Sh',
+                title='Comparison of Experimental vs. Model Sherwood Number',
+                labels={'Experimental Sh': 'Experimental Sh', 'Observed Sh': 'Model Sh'},
+                color='Percentage Error (%)',
+                color_continuous_scale='RdYlGn_r',
+                hover_data=['Data Point', 'Percentage Error (%)']
+            )
+            
+            # Add diagonal line (perfect prediction)
+            min_val = min(results_df['Experimental Sh'].min(), results_df['Observed Sh'].min())
+            max_val = max(results_df['Experimental Sh'].max(), results_df['Observed Sh'].max())
+            
+            fig.add_trace(
+                go.Scatter(
+                    x=[min_val, max_val],
+                    y=[min_val, max_val],
+                    mode='lines',
+                    line=dict(color='black', dash='dash'),
+                    name='Perfect Prediction'
+                )
+            )
+            
+            # Add Â±10% error bands
+            fig.add_trace(
+                go.Scatter(
+                    x=[min_val, max_val],
+                    y=[min_val*0.9, max_val*0.9],
+                    mode='lines',
+                    line=dict(color='red', dash='dot'),
+                    name='-10% Error'
+                )
+            )
+            
+            fig.add_trace(
+                go.Scatter(
+                    x=[min_val, max_val],
+                    y=[min_val*1.1, max_val*1.1],
+                    mode='lines',
+                    line=dict(color='red', dash='dot'),
+                    name='+10% Error'
+                )
+            )
+            
+            fig.update_layout(
+                xaxis_title='Experimental Sh',
+                yaxis_title='Model Sh',
+                legend_title='',
+                height=600
+            )
+            
+            return fig
+        
+        # Rebuilt only when the stages it plots change
+        fig = stages.run('sh_parity', (), (stage_keys['errors'],), build_figure)[1]
+        
+        st.plotly_chart(fig, use_container_width=True)
+            # MTC Comparison
+    with viz_tabs[1]:
+        def build_figure():
+            fig = px.scatter(
+                parity_df, 
+                x='Experimental MTC (m/s)', 
+                y='Observed MTC (m/s)',
+                title='Comparison of Experimental vs. Model Mass Transfer Coefficient',
+                labels={'Experimental MTC (m/s)': 'Experimental MTC (m/s)', 'Observed MTC (m/s)': 'Model MTC (m/s)'},
+                color='Percentage Error (%)',
+                color_continuous_scale='RdYlGn_r',
+                hover_data=['Data Point', 'Percentage Error (%)']
+            )
+            
+            # Add diagonal line (perfect prediction)
+            min_val = min(results_df['Experimental MTC (m/s)'].min(), results_df['Observed MTC (m/s)'].min())
+            max_val = max(results_df['Experimental MTC (m/s)'].max(), results_df['Observed MTC (m/s)'].max())
+            
+            fig.add_trace(
+                go.Scatter(
+                    x=[min_val, max_val],
+                    y=[min_val, max_val],
+                    mode='lines',
+                    line=dict(color='black', dash='dash'),
+                    name='Perfect Prediction'
+                )
+            )
+            
+            # Add Â±10% error bands
+            fig.add_trace(
+                go.Scatter(
+                    x=[min_val, max_val],
+                    y=[min_val*0.9, max_val*0.9],
+                    mode='lines',
+                    line=dict(color='red', dash='dot'),
+                    name='-10% Error'
+                )
+            )
+            
+            fig.add_trace(
+                go.Scatter(
+                    x=[min_val, max_val],
+                    y=[min_val*1.1, max_val*1.1],
+                    mode='lines',
+                    line=dict(color='red', dash='dot'),
+                    name='+10% Error'
+                )
+            )
+            
+            fig.update_layout(
+                xaxis_title='Experimental MTC (m/s)',
+                yaxis_title='Model MTC (m/s)',
+                legend_title='',
+                height=600
+            )
+            
+            return fig
+        
+        # Rebuilt only when the stages it plots change
+        fig = stages.run('mtc_parity', (), (stage_keys['errors'], stage_keys['mtc']), build_figure)[1]
+        
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Sh vs Data Points
+    with viz_tabs[2]:
+        def build_figure():
+            fig = go.Figure()
+            
+            fig.add_trace(
+                scatter_trace(
+                    x=results_df['Data Point'],
+                    y=results_df['Experimental Sh'],
+                    mode='lines+markers',
+                    name='Experimental Sh',
+                    line=dict(color='blue', width=2),
+                    marker=dict(size=10, symbol='circle')
+                )
+            )
+            
+            fig.add_trace(
+                scatter_trace(
+                    x=results_df['Data Point'],
+                    y=results_df['Observed Sh'],
+                    mode='lines+markers',
+                    name='Model Sh',
+                    line=dict(color='green', width=2),
+                    marker=dict(size=10, symbol='diamond')
+                )
+            )
+            
+            # Add error bands
+            upper_bound = results_df['Experimental Sh'] * 1.1
+            lower_bound = results_df['Experimental Sh'] * 0.9
+            
+            fig.add_trace(
+                scatter_trace(
+                    x=results_df['Data Point'],
+                    y=upper_bound,
+                    mode='lines',
+                    line=dict(color='rgba(255, 0, 0, 0.2)'),
+                    name='+10% Error Band',
+                    showlegend=True
+                )
+            )
+            
+            fig.add_trace(
+                scatter_trace(
+                    x=results_df['Data Point'],
+                    y=lower_bound,
+                    mode='lines',
+                    line=dict(color='rgba(255, 0, 0, 0.2)'),
+                    name='-10% Error Band',
+                    fill='tonexty',
+                    fillcolor='rgba(255, 0, 0, 0.1)',
+                    showlegend=True
+                )
+            )
+            
+            fig.update_layout(
+                title='Comparison of Sherwood Number Across Data Points',
+                xaxis_title='Data Point',
+                yaxis_title='Sherwood Number (Sh)',
+                legend_title='',
+                height=600,
+                hovermode='x unified',
+                legend=dict(
+                    orientation="h",
+                    yanchor="bottom",
+                    y=1.02,
+                    xanchor="right",
+                    x=1
+                )
+            )
+            
+            return fig
+        
+        # Rebuilt only when the stages it plots change
+        fig = stages.run('sh_series', (), (stage_keys['predictions'],), build_figure)[1]
+        
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # MTC vs Data Points
+    with viz_tabs[3]:
+        def build_figure():
+            fig = go.Figure()
+            
+            fig.add_trace(
+                scatter_trace(
+                    x=results_df['Data Point'],
+                    y=results_df['Experimental MTC (m/s)'],
+                    mode='lines+markers',
+                    name='Experimental MTC',
+                    line=dict(color='purple', width=2),
+                    marker=dict(size=10, symbol='circle')
+                )
+            )
+            
+            fig.add_trace(
+                scatter_trace(
+                    x=results_df['Data Point'],
+                    y=results_df['Observed MTC (m/s)'],
+                    mode='lines+markers',
+                    name='Model MTC',
+                    line=dict(color='orange', width=2),
+                    marker=dict(size=10, symbol='diamond')
+                )
+            )
+            
+            # Add error bands
+            upper_bound = results_df['Experimental MTC (m/s)'] * 1.1
+            lower_bound = results_df['Experimental MTC (m/s)'] * 0.9
+            
+            fig.add_trace(
+                scatter_trace(
+                    x=results_df['Data Point'],
+                    y=upper_bound,
+                    mode='lines',
+                    line=dict(color='rgba(255, 0, 0, 0.2)'),
+                    name='+10% Error Band',
+                    showlegend=True
+                )
+            )
+            
+            fig.add_trace(
+                scatter_trace(
+                    x=results_df['Data Point'],
+                    y=lower_bound,
+                    mode='lines',
+                    line=dict(color='rgba(255, 0, 0, 0.2)'),
+                    name='-10% Error Band',
+                    fill='tonexty',
+                    fillcolor='rgba(255, 0, 0, 0.1)',
+                    showlegend=True
+                )
+            )
+            
+            fig.update_layout(
+                title='Comparison of Mass Transfer Coefficient Across Data Points',
+                xaxis_title='Data Point',
+                yaxis_title='Mass Transfer Coefficient (m/s)',
+                legend_title='',
+                height=600,
+                hovermode='x unified',
+                legend=dict(
+                    orientation="h",
+                    yanchor="bottom",
+                    y=1.02,
+                    xanchor="right",
+                    x=1
+                )
+            )
+            
+            return fig
+        
+        # Rebuilt only when the stages it plots change
+        fig = stages.run('mtc_series', (), (stage_keys['mtc'],), build_figure)[1]
+        
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Sh & MTC Relationships
+    with viz_tabs[4]:
+        # Create subplot with 2 rows and 1 column
+        def build_figure():
+            fig = make_subplots(
+                rows=2, 
+                cols=1,
+                subplot_titles=('Experimental Sh vs MTC', 'Model Sh vs MTC'),
+                vertical_spacing=0.15
+            )
+            
+            # Experimental values
+            fig.add_trace(
+                scatter_trace(
+                    x=results_df['Experimental Sh'],
+                    y=results_df['Experimental MTC (m/s)'],
+                    mode='markers',
+                    name='Experimental Values',
+                    marker=dict(
+                        size=12,
+                        color=results_df['Data Point'],
+                        colorscale='Viridis',
+                        showscale=True,
+                        colorbar=dict(title='Data Point')
+                    ),
+                    hover_labels=results_df['Data Point'],
+                    hovertemplate='<b>%{text}</b><br>Sh: %{x:.2f}<br>MTC: %{y:.2e} m/s<extra></extra>'
+                ),
+                row=1, col=1
+            )
+            
+            # Model values
+            fig.add_trace(
+                scatter_trace(
+                    x=results_df['Observed Sh'],
+                    y=results_df['Observed MTC (m/s)'],
+                    mode='markers',
+                    name='Model Values',
+                    marker=dict(
+                        size=12,
+                        color=results_df['Data Point'],
+                        colorscale='Viridis',
+                        showscale=False
+                    ),
+                    hover_labels=results_df['Data Point'],
+                    hovertemplate='<b>%{text}</b><br>Sh: %{x:.2f}<br>MTC: %{y:.2e} m/s<extra></extra>'
+                ),
+                row=2, col=1
+            )
+            
+            # Add trend lines
+            x_exp = results_df['Experimental Sh']
+            y_exp = results_df['Experimental MTC (m/s)']
+            z_exp = np.polyfit(x_exp, y_exp, 1)
+            p_exp = np.poly1d(z_exp)
+            
+            x_mod = results_df['Observed Sh']
+            y_mod = results_df['Observed MTC (m/s)']
+            z_mod = np.polyfit(x_mod, y_mod, 1)
+            p_mod = np.poly1d(z_mod)
+            
+            # Add equation text
+            exp_eq = f"MTC = {z_exp[0]:.2e} Ã— Sh + {z_exp[1]:.2e}"
+            mod_eq = f"MTC = {z_mod[0]:.2e} Ã— Sh + {z_mod[1]:.2e}"
+            
+            fig.add_trace(
+                go.Scatter(
+                    x=[min(x_exp), max(x_exp)],
+                    y=[p_exp(min(x_exp)), p_exp(max(x_exp))],
+                    mode='lines',
+                    name='Experimental Trend',
+                    line=dict(color='red', dash='dash')
+                ),
+                row=1, col=1
+            )
+            
+            fig.add_trace(
+                go.Scatter(
+                    x=[min(x_mod), max(x_mod)],
+                    y=[p_mod(min(x_mod)), p_mod(max(x_mod))],
+                    mode='lines',
+                    name='Model Trend',
+                    line=dict(color='red', dash='dash')
+                ),
+                row=2, col=1
+            )
+            
+            # Add annotations for equations
+            fig.add_annotation(
+                x=0.95,
+                y=0.15,
+                xref="paper",
+                yref="paper",
+                text=exp_eq,
+                showarrow=False,
+                font=dict(size=12, color="red"),
+                align="right",
+                bgcolor="rgba(255, 255, 255, 0.7)",
+                bordercolor="red",
+                borderwidth=1,
+                borderpad=4,
+                row=1,
+                col=1
+            )
+            
+            fig.add_annotation(
+                x=0.95,
+                y=0.15,
+                xref="paper",
+                yref="paper",
+                text=mod_eq,
+                showarrow=False,
+                font=dict(size=12, color="red"),
+                align="right",
+                bgcolor="rgba(255, 255, 255, 0.7)",
+                bordercolor="red",
+                borderwidth=1,
+                borderpad=4,
+                row=2,
+                col=1
+            )
+            
+            fig.update_layout(
+                height=800,
+                title_text='Relationship Between Sherwood Number and Mass Transfer Coefficient',
+                showlegend=True,
+                legend=dict(
+                    orientation="h",
+                    yanchor="bottom",
+                    y=1.02,
+                    xanchor="right",
+                    x=1
+                )
+            )
+            
+            # Update xaxis properties
+            fig.update_xaxes(title_text='Sherwood Number (Sh)', row=1, col=1)
+            fig.update_xaxes(title_text='Sherwood Number (Sh)', row=2, col=1)
+            
+            # Update yaxis properties
+            fig.update_yaxes(title_text='Mass Transfer Coefficient (m/s)', row=1, col=1)
+            fig.update_yaxes(title_text='Mass Transfer Coefficient (m/s)', row=2, col=1)
+            
+            return fig
+        
+        # Rebuilt only when the stages it plots change
+        fig = stages.run('sh_mtc_relationship', (), (stage_keys['mtc'],), build_figure)[1]
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Add theoretical explanation
+        st.markdown("""
+        ### Theoretical Relationship
+        
+        The relationship between Sherwood number (Sh) and Mass Transfer Coefficient (MTC) is given by:
+        
+        $$ MTC = \frac{Sh \times D}{L} $$
+        
+        Where:
+        - MTC is the Mass Transfer Coefficient (m/s)
+        - Sh is the Sherwood number (dimensionless)
+        - D is the Diffusivity (mÂ²/s)
+        - L is the Characteristic Length (m)
+        
+        The linear relationship observed in the plots confirms this theoretical relationship with the slope approximately equal to D/L.
+        """)
+    
+    # Current & RPM Effects
+    with viz_tabs[5]:
+        # Create subplot with 2 rows and 2 columns
+        def build_figure():
+            fig = make_subplots(
+                rows=2, 
+                cols=2,
+                subplot_titles=(
+                    'Experimental MTC vs Current', 
+                    'Model MTC vs Current',
+                    'Experimental MTC vs RPM', 
+                    'Model MTC vs RPM'
+                ),
+                vertical_spacing=0.15,
+                horizontal_spacing=0.1
+            )
+            
+            # Experimental MTC vs Current
+            fig.add_trace(
+                scatter_trace(
+                    x=results_df['I (A)'],
+                    y=results_df['Experimental MTC (m/s)'],
+                    mode='markers+lines',
+                    name='Experimental MTC vs I',
+                    marker=dict(
+                        size=10, 
+                        color=results_df['Data Point'],
+                        colorscale='Viridis',
+                        showscale=False
+                    ),
+                    line=dict(color='blue')
+                ),
+                row=1, col=1
+            )
+            
+            # Model MTC vs Current
+            fig.add_trace(
+                scatter_trace(
+                    x=results_df['I (A)'],
+                    y=results_df['Observed MTC (m/s)'],
+                    mode='markers+lines',
+                    name='Model MTC vs I',
+                    marker=dict(
+                        size=10, 
+                        color=results_df['Data Point'],
+                        colorscale='Viridis',
+                        showscale=False
+                    ),
+                    line=dict(color='green')
+                ),
+                row=1, col=2
+            )
+            
+            # Experimental MTC vs RPM
+            fig.add_trace(
+                scatter_trace(
+                    x=results_df['W (rpm)'],
+                    y=results_df['Experimental MTC (m/s)'],
+                    mode='markers+lines',
+                    name='Experimental MTC vs W',
+                    marker=dict(
+                        size=10, 
+                        color=results_df['Data Point'],
+                        colorscale='Viridis',
+                        showscale=False
+                    ),
+                    line=dict(color='purple')
+                ),
+                row=2, col=1
+            )
+            
+            # Model MTC vs RPM
+            fig.add_trace(
+                scatter_trace(
+                    x=results_df['W (rpm)'],
+                    y=results_df['Observed MTC (m/s)'],
+                    mode='markers+lines',
+                    name='Model MTC vs W',
+                    marker=dict(
+                        size=10, 
+                        color=results_df['Data Point'],
+                        colorscale='Viridis',
+                        showscale=False
+                    ),
+                    line=dict(color='orange')
+                ),
+                row=2, col=2
+            )
+            
+            # Add trend lines
+            # Current vs Experimental MTC
+            x = results_df['I (A)']
+            y = results_df['Experimental MTC (m/s)']
+            z = np.polyfit(x, y, 2)  # Quadratic fit
+            p = np.poly1d(z)
+            
+            x_range = np.linspace(min(x), max(x), 100)
+            fig.add_trace(
+                go.Scatter(
+                    x=x_range,
+                    y=p(x_range),
+                    mode='lines',
+                    line=dict(color='red', dash='dash'),
+                    name='Trend (Exp MTC vs I)',
+                    showlegend=False
+                ),
+                row=1, col=1
+            )
+            
+            # Current vs Model MTC
+            y = results_df['Observed MTC (m/s)']
+            z = np.polyfit(x, y, 2)  # Quadratic fit
+            p = np.poly1d(z)
+            
+            fig.add_trace(
+                go.Scatter(
+                    x=x_range,
+                    y=p(x_range),
+                    mode='lines',
+                    line=dict(color='red', dash='dash'),
+                    name='Trend (Model MTC vs I)',
+                    showlegend=False
+                ),
+                row=1, col=2
+            )
+            
+            # RPM vs Experimental MTC
+            x = results_df['W (rpm)']
+            y = results_df['Experimental MTC (m/s)']
+            z = np.polyfit(x, y, 2)  # Quadratic fit
+            p = np.poly1d(z)
+            
+            x_range = np.linspace(min(x), max(x), 100)
+            fig.add_trace(
+                go.Scatter(
+                    x=x_range,
+                    y=p(x_range),
+                    mode='lines',
+                    line=dict(color='red', dash='dash'),
+                    name='Trend (Exp MTC vs W)',
+                    showlegend=False
+                ),
+                row=2, col=1
+            )
+            
+            # RPM vs Model MTC
+            y = results_df['Observed MTC (m/s)']
+            z = np.polyfit(x, y, 2)  # Quadratic fit
+            p = np.poly1d(z)
+            
+            fig.add_trace(
+                go.Scatter(
+                    x=x_range,
+                    y=p(x_range),
+                    mode='lines',
+                    line=dict(color='red', dash='dash'),
+                    name='Trend (Model MTC vs W)',
+                    showlegend=False
+                ),
+                row=2, col=2
+            )
+            
+            fig.update_layout(
+                height=800,
+                title_text='Effect of Current and RPM on Mass Transfer Coefficient',
+                showlegend=True,
+                legend=dict(
+                    orientation="h",
+                    yanchor="bottom",
+                    y=1.02,
+                    xanchor="right",
+                    x=1
+                )
+            )
+            
+            # Update xaxis properties
+            fig.update_xaxes(title_text='Current (A)', row=1, col=1)
+            fig.update_xaxes(title_text='Current (A)', row=1, col=2)
+            fig.update_xaxes(title_text='RPM (W)', row=2, col=1)
+            fig.update_xaxes(title_text='RPM (W)', row=2, col=2)
+            
+            # Update yaxis properties
+            fig.update_yaxes(title_text='Mass Transfer Coefficient (m/s)', row=1, col=1)
+            fig.update_yaxes(title_text='Mass Transfer Coefficient (m/s)', row=1, col=2)
+            fig.update_yaxes(title_text='Mass Transfer Coefficient (m/s)', row=2, col=1)
+            fig.update_yaxes(title_text='Mass Transfer Coefficient (m/s)', row=2, col=2)
+            
+            return fig
+        
+        # Rebuilt only when the stages it plots change
+        fig = stages.run('current_rpm_trends', (), (stage_keys['comparison'],), build_figure)[1]
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Add interactive 3D plot
+        st.subheader("Interactive 3D Visualization of Current, RPM, and MTC")
+        
+        def build_figure():
+            fig = go.Figure(data=[
+                downsampled_trace(
+                    go.Scatter3d,
+                    x=results_df['I (A)'],
+                    y=results_df['W (rpm)'],
+                    z=results_df['Experimental MTC (m/s)'],
+                    mode='markers',
+                    name='Experimental MTC',
+                    marker=dict(
+                        size=8,
+                        color='blue',
+                        opacity=0.8
+                    ),
+                    hover_labels=results_df['Data Point'],
+                    hovertemplate='<b>%{text}</b><br>Current: %{x} A<br>RPM: %{y}<br>MTC: %{z:.2e} m/s<extra></extra>'
+                ),
+                downsampled_trace(
+                    go.Scatter3d,
+                    x=results_df['I (A)'],
+                    y=results_df['W (rpm)'],
+                    z=results_df['Observed MTC (m/s)'],
+                    mode='markers',
+                    name='Model MTC',
+                    marker=dict(
+                        size=8,
+                        color='green',
+                        opacity=0.8
+                    ),
+                    hover_labels=results_df['Data Point'],
+                    hovertemplate='<b>%{text}</b><br>Current: %{x} A<br>RPM: %{y}<br>MTC: %{z:.2e} m/s<extra></extra>'
+                )
+            ])
+            
+            fig.update_layout(
+                scene=dict(
+                    xaxis_title='Current (A)',
+                    yaxis_title='RPM (W)',
+                    zaxis_title='Mass Transfer Coefficient (m/s)'
+                ),
+                height=700,
+                margin=dict(l=0, r=0, b=0, t=30)
+            )
+            
+            return fig
+        
+        # Rebuilt only when the stages it plots change
+        fig = stages.run('current_rpm_mtc_3d', (), (stage_keys['comparison'],), build_figure)[1]
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+        st.markdown("""
+        ### Effect of Operating Parameters
+        
+        The plots above show how the mass transfer coefficient is affected by:
+        
+        1. **Current (I)**: Higher current generally leads to increased mass transfer rates due to enhanced electrochemical reactions.
+        
+        2. **Rotational Speed (W)**: Higher RPM typically improves mass transfer by reducing boundary layer thickness and enhancing mixing.
+        
+        The 3D visualization helps identify optimal operating conditions where both parameters can be adjusted to achieve desired mass transfer rates.
+        """)
+    
+    # Error Analysis
+    with viz_tabs[6]:
+        # Create subplot with 2 rows and 1 column
+        def build_figure():
+            fig = make_subplots(
+                rows=2, 
+                cols=1,
+                subplot_titles=('Percentage Error Across Data Points', 'Error Distribution'),
+                vertical_spacing=0.15
+            )
+            
+            # Percentage error across data points
+            fig.add_trace(
+                downsampled_trace(
+                    go.Bar,
+                    x=results_df['Data Point'],
+                    y=results_df['Percentage Error (%)'],
+                    name='Percentage Error',
+                    marker=dict(
+                        color=results_df['Percentage Error (%)'],
+                        colorscale='RdBu_r',
+                        cmin=-results_df['Percentage Error (%)'].abs().max(),
+                        cmax=results_df['Percentage Error (%)'].abs().max(),
+                        colorbar=dict(title='Error (%)')
+                    ),
+                    texttemplate='%{y:.2f}%',
+                    textposition='auto'
+                ),
+                row=1, col=1
+            )
+            
+            # Add zero line
+            fig.add_trace(
+                go.Scatter(
+                    x=[0, len(results_df) + 1],
+                    y=[0, 0],
+                    mode='lines',
+                    line=dict(color='black', dash='dash'),
+                    showlegend=False
+                ),
+                row=1, col=1
+            )
+            
+            # Add Â±10% error lines
+            fig.add_trace(
+                go.Scatter(
+                    x=[0, len(results_df) + 1],
+                    y=[10, 10],
+                    mode='lines',
+                    line=dict(color='red', dash='dot'),
+                    name='+10% Error Limit',
+                    showlegend=True
+                ),
+                row=1, col=1
+            )
+            
+            fig.add_trace(
+                go.Scatter(
+                    x=[0, len(results_df) + 1],
+                    y=[-10, -10],
+                    mode='lines',
+                    line=dict(color='red', dash='dot'),
+                    name='-10% Error Limit',
+                    showlegend=True
+                ),
+                row=1, col=1
+            )
+            
+            # Error distribution
+            fig.add_trace(
+                histogram_trace(
+                    results_df['Percentage Error (%)'],
+                    bins=20,
+                    density=True,
+                    name='Error Distribution',
+                    marker=dict(
+                        color='rgba(0, 128, 255, 0.7)',
+                        line=dict(color='rgba(0, 128, 255, 1)', width=1)
+                    )
+                ),
+                row=2, col=1
+            )
+            
+            # Add vertical line at zero
+            fig.add_trace(
+                go.Scatter(
+                    x=[0, 0],
+                    y=[0, 1],  # Will be adjusted with update_yaxes
+                    mode='lines',
+                    line=dict(color='black', dash='dash'),
+                    name='Zero Error',
+                    showlegend=False
+                ),
+                row=2, col=1
+            )
+            
+            # Add vertical lines at Â±10%
+            fig.add_trace(
+                go.Scatter(
+                    x=[10, 10],
+                    y=[0, 1],
+                    mode='lines',
+                    line=dict(color='red', dash='dot'),
+                    name='+10% Error',
+                    showlegend=False
+                ),
+                row=2, col=1
+            )
+            
+            fig.add_trace(
+                go.Scatter(
+                    x=[-10, -10],
+                    y=[0, 1],
+                    mode='lines',
+                    line=dict(color='red', dash='dot'),
+                    name='-10% Error',
+                    showlegend=False
+                ),
+                row=2, col=1
+            )
+            
+            # Fit normal distribution to errors
+            from scipy import stats
+            
+            errors = results_df['Percentage Error (%)']
+            mu, sigma = stats.norm.fit(errors)
+            
+            x = np.linspace(min(errors) - 5, max(errors) + 5, 100)
+            y = stats.norm.pdf(x, mu, sigma)
+            
+            fig.add_trace(
+                go.Scatter(
+                    x=x,
+                    y=y,
+                    mode='lines',
+                    line=dict(color='green', width=2),
+                    name=f'Normal Distribution (Î¼={mu:.2f}, Ïƒ={sigma:.2f})'
+                ),
+                row=2, col=1
+            )
+            
+            fig.update_layout(
+                height=800,
+                title_text='Error Analysis',
+                showlegend=True,
+                legend=dict(
+                    orientation="h",
+                    yanchor="bottom",
+                    y=1.02,
+                    xanchor="right",
+                    x=1
+                )
+            )
+            
+            # Update xaxis properties
+            fig.update_xaxes(title_text='Data Point', row=1, col=1)
+            fig.update_xaxes(title_text='Percentage Error (%)', row=2, col=1)
+            
+            # Update yaxis properties
+            fig.update_yaxes(title_text='Percentage Error (%)', row=1, col=1)
+            fig.update_yaxes(title_text='Probability Density', row=2, col=1, autorange=True)
+            
+            return fig
+        
+        # Rebuilt only when the stages it plots change
+        fig = stages.run('error_analysis', (), (stage_keys['errors'],), build_figure)[1]
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Error statistics
+        st.subheader("Error Statistics")
+        
+        errors = results_df['Percentage Error (%)']
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric("Mean Error (%)", f"{np.mean(errors):.2f}")
+        
+        with col2:
+            st.metric("Standard Deviation (%)", f"{np.std(errors):.2f}")
+        
+        with col3:
+            # Calculate percentage of points within Â±10% error
+            within_limit = (errors.abs() <= 10).sum()
+            percentage_within = (within_limit / len(errors)) * 100
+            st.metric("Points Within Â±10% Error", f"{percentage_within:.1f}%")
+        
+        # Error analysis explanation
+        st.markdown("""
+        ### Error Analysis Interpretation
+        
+        The error analysis provides insights into the model's accuracy:
+        
+        - **Error Distribution**: Shows how errors are distributed around zero. A normal distribution centered near zero indicates a well-balanced model.
+        
+        - **Points Within Â±10% Error**: Industry standard often requires at least 90% of predictions to fall within Â±10% error.
+        
+        - **Systematic Bias**: If errors consistently trend positive or negative, it suggests a systematic bias in the model.
+        
+        - **Outliers**: Data points with errors significantly outside the normal range may indicate experimental anomalies or limitations of the model.
+        """)
+    
+    # Advanced AI Analysis
+    st.subheader("Advanced AI Analysis")
+    
+    # Analyses are computed only once opened; their expensive steps are memoized
+    open_analyses = st.multiselect(
+        "Open Analyses",
+        [
+            "Parameter Sensitivity", 
+            "Optimization Suggestions", 
+            "3D Visualization",
+            "Neural Network Prediction",
+            "Uncertainty Analysis"
+        ],
+        default=[]
+    )
+    
+    # Parameter Sensitivity Analysis
+    if "Parameter Sensitivity" in open_analyses:
+        st.write("### Parameter Sensitivity Analysis")
+        st.write("This analysis shows how sensitive the model is to changes in each parameter.")
+        
+        # Hold every group at its mean and sweep one group at a time
+        mean_values = {group: data[group].mean() for group in correlation.terms}
+        base_sh = correlation.predict(mean_values)
+        
+        # Sensitivity to Re
+        re_values = np.linspace(data['Re'].min() * 0.5, data['Re'].max() * 1.5, 100)
+        re_sh_values = correlation.predict({**mean_values, 'Re': re_values})
+        
+        # Sensitivity to Sc (if it varies in the data)
+        sc_values = np.linspace(data['Sc'].min() * 0.5, data['Sc'].max() * 1.5, 100)
+        sc_sh_values = correlation.predict({**mean_values, 'Sc': sc_values})
+        
+        # Create sensitivity plot
+        fig = go.Figure()
+        
+        fig.add_trace(
+            go.Scatter(
+                x=re_values / data['Re'].mean(),
+                y=re_sh_values / base_sh,
+                mode='lines',
+                name='Sensitivity to Re',
+                line=dict(color='blue', width=3)
+            )
+        )
+        
+        fig.add_trace(
+            go.Scatter(
+                x=sc_values / data['Sc'].mean(),
+                y=sc_sh_values / base_sh,
+                mode='lines',
+                name='Sensitivity to Sc',
+                line=dict(color='green', width=3)
+            )
+        )
+        
+        # Add We sensitivity if applicable
+        if 'We' in correlation.terms:
+            we_values = np.linspace(data['We'].min() * 0.5, data['We'].max() * 1.5, 100)
+            we_sh_values = correlation.predict({**mean_values, 'We': we_values})
+                
+            fig.add_trace(
+                go.Scatter(
+                    x=we_values / data['We'].mean(),
+                    y=we_sh_values / base_sh,
+                    mode='lines',
+                    name='Sensitivity to We',
+                    line=dict(color='red', width=3)
+                )
+            )
+        
+        # Add Eg sensitivity if applicable
+        if 'Eg' in correlation.terms:
+            eg_values = np.linspace(data['Eg'].min() * 0.5, data['Eg'].max() * 1.5, 100)
+            eg_sh_values = correlation.predict({**mean_values, 'Eg': eg_values})
+                
+            fig.add_trace(
+                go.Scatter(
+                    x=eg_values / data['Eg'].mean(),
+                    y=eg_sh_values / base_sh,
+                    mode='lines',
+                    name='Sensitivity to Eg',
+                    line=dict(color='purple', width=3)
+                )
+            )
+        
+        fig.update_layout(
+            title='Parameter Sensitivity Analysis',
+            xaxis_title='Normalized Parameter Value (Parameter/Mean)',
+            yaxis_title='Normalized Sh (Sh/Base Sh)',
+            legend_title='Parameter',
+            height=600
+        )
+        
+        # Add reference line
+        fig.add_shape(
+            type="line",
+            x0=0.5,
+            y0=1,
+            x1=1.5,
+            y1=1,
+            line=dict(
+                color="black",
+                width=2,
+                dash="dash",
+            )
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+                # Parameter importance
+        st.write("### Parameter Importance")
+        
+        # Calculate parameter importance based on exponents
+        importance = {}
+        importance['Re'] = abs(x1)
+        importance['Sc'] = abs(x2)
+        
+        if x3 is not None and model_type in [1, 2]:
+            importance['We'] = abs(x3)
+            
+        if x4 is not None and model_type in [1, 3]:
+            importance['Eg'] = abs(x4)
+            
+        # Normalize importance
+        total = sum(importance.values())
+        for key in importance:
+            importance[key] = importance[key] / total * 100
+            
+        # Create bar chart
+        fig = px.bar(
+            x=list(importance.keys()),
+            y=list(importance.values()),
+            labels={'x': 'Parameter', 'y': 'Relative Importance (%)'},
+            title='Parameter Importance in the Model',
+            color=list(importance.values()),
+            color_continuous_scale='Viridis'
+        )
+        
+        fig.update_layout(
+            xaxis_title='Parameter',
+            yaxis_title='Relative Importance (%)',
+            height=500
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Variance-based global sensitivity over the observed ranges
+        st.write("### Global Sensitivity Analysis (Sobol Indices)")
+        st.write("First-order indices show the share of the variance in Sh caused by each group alone; total indices include its interactions with the other groups.")
+        
+        n_sobol = st.number_input("Number of Saltelli Base Samples", min_value=1000, max_value=1000000, value=SOBOL_SAMPLES, step=10000)
+        
+        sobol_bounds = {group: (float(data[group].min()), float(data[group].max())) for group in correlation.terms}
+        sobol_df = cached_sobol_indices(correlation.a, tuple(correlation.exponents.items()), tuple(sobol_bounds.items()), n_sobol)
+        
+        fig = go.Figure()
+        
+        fig.add_trace(
+            go.Bar(
+                x=sobol_df.index,
+                y=sobol_df['S1'],
+                error_y=dict(type='data', array=sobol_df['S1 CI']),
+                name='First-Order Index (S1)',
+                marker=dict(color='blue')
+            )
+        )
+        
+        fig.add_trace(
+            go.Bar(
+                x=sobol_df.index,
+                y=sobol_df['ST'],
+                error_y=dict(type='data', array=sobol_df['ST CI']),
+                name='Total Index (ST)',
+                marker=dict(color='orange')
+            )
+        )
+        
+        fig.update_layout(
+            title='Sobol Sensitivity Indices with 95% Confidence Intervals',
+            xaxis_title='Parameter',
+            yaxis_title='Sobol Index',
+            barmode='group',
+            height=500
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+        st.dataframe(sobol_df.style.format('{:.4f}'))
+        
+        # Parameter recommendations
+        st.write("### Parameter Recommendations")
+        st.write("""
+        Based on the sensitivity analysis, here are some recommendations for optimizing your mass transfer process:
+        """)
+        
+        # Generate recommendations based on model parameters
+        recommendations = []
+        
+        if 'Re' in importance and importance['Re'] > 20:
+            recommendations.append("- **Reynolds Number (Re)**: This parameter has significant influence on mass transfer. Consider optimizing fluid velocity or characteristic length to achieve optimal Reynolds numbers.")
+        
+        if 'Sc' in importance and importance['Sc'] > 20:
+            recommendations.append("- **Schmidt Number (Sc)**: This parameter is important for mass transfer. Consider adjusting fluid properties to optimize diffusion.")
+        
+        if 'We' in importance and x3 is not None and x3 < -0.3:
+            recommendations.append("- **Weber Number (We)**: The negative exponent suggests that lower Weber numbers improve mass transfer. Consider reducing interfacial tension or adjusting fluid velocity.")
+        
+        if 'Eg' in importance and x4 is not None and x4 > 0.12:
+            recommendations.append("- **Eotvos Number (Eg)**: The positive exponent indicates that increasing Eotvos number enhances mass transfer. Consider adjusting density difference or characteristic length.")
+        
+        for rec in recommendations:
+            st.markdown(rec)
+    
+    # Optimization Suggestions
+    if "Optimization Suggestions" in open_analyses:
+        st.write("### Model Optimization Suggestions")
+        
+        # Surrogate fitted once per dataset
+        pipeline, r2 = fit_random_forest(data)
+        
+        st.write(f"Machine Learning Model RÂ²: **{r2:.6f}**")
+        
+        # Compare with regression model
+        st.write(f"Current Regression Model RÂ²: **{model_data['r2']:.6f}**")
+        
+        if r2 > model_data['r2']:
+            st.success("The machine learning model outperforms the current regression model. Consider using more advanced modeling techniques for better predictions.")
+        else:
+            st.info("The current regression model performs well. The simpler model is preferred for interpretability.")
+        
+        # Feature importance from Random Forest
+        if hasattr(pipeline['model'], 'feature_importances_'):
+            importances = pipeline['model'].feature_importances_
+            feature_names = pipeline.feature_names_in_
+            
+            # Create feature importance dataframe
+            feature_importance = pd.DataFrame({
+                'Feature': feature_names,
+                'Importance': importances
+            }).sort_values('Importance', ascending=False)
+            
+            # Plot feature importance
+            fig = px.bar(
+                feature_importance,
+                x='Feature',
+                y='Importance',
+                title='Feature Importance from Random Forest',
+                color='Importance',
+                color_continuous_scale='Viridis'
+            )
+            
+            fig.update_layout(
+                xaxis_title='Feature',
+                yaxis_title='Importance',
+                height=500
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+            
+            # Recommendations based on feature importance
+            st.write("### Optimization Recommendations")
+            st.write("Based on the machine learning analysis, here are recommendations for optimizing your model:")
+            
+            for i, row in feature_importance.iterrows():
+                if row['Importance'] > 0.2:
+                    st.markdown(f"- **{row['Feature']}**: High importance ({row['Importance']:.2f}). Focus on accurate measurement and control of this parameter.")
+                elif row['Importance'] > 0.1:
+                    st.markdown(f"- **{row['Feature']}**: Moderate importance ({row['Importance']:.2f}). Consider including this parameter in your model.")
+                else:
+                    st.markdown(f"- **{row['Feature']}**: Low importance ({row['Importance']:.2f}). This parameter has less impact on the model.")
+        
+        # Optimal operating conditions
+        st.write("### Optimal Operating Conditions")
+        
+        # Search the observed range of every model group for the highest Sh
+        if 'Re' in data.columns and 'Sc' in data.columns:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                grid_resolution = st.number_input("Grid Points per Axis", min_value=5, max_value=500, value=OPTIMUM_GRID_POINTS, step=5)
+            
+            with col2:
+                refinement_levels = st.number_input("Grid Refinement Levels", min_value=0, max_value=10, value=REFINEMENT_LEVELS, step=1)
+            
+            optimum_bounds = {group: (float(data[group].min()), float(data[group].max())) for group in correlation.terms}
+            optimal_conditions, optimal_sh = cached_optimal_conditions(
+                correlation.a,
+                tuple(correlation.exponents.items()),
+                tuple(optimum_bounds.items()),
+                grid_resolution,
+                refinement_levels
+            )
+            
+            st.write("Based on the model, the optimal operating conditions are:")
+            
+            for group, value in optimal_conditions.items():
+                st.write(f"- **{group}**: {value:.2f}")
+            
+            st.write(f"- **Predicted Sherwood Number**: {optimal_sh:.2f}")
+            
+            # Re-Sc map with the remaining groups held at their optimal values
+            axes, grid_sh = evaluate_grid(
+                correlation,
+                {'Re': optimum_bounds['Re'], 'Sc': optimum_bounds['Sc']},
+                resolution=grid_resolution,
+                fixed={group: value for group, value in optimal_conditions.items() if group not in ['Re', 'Sc']}
+            )
+            
+            # Create contour plot
+            if 'Re' in data.columns and 'Sc' in data.columns:
+                fig = go.Figure(data=
+                    go.Contour(
+                        z=grid_sh,
+                        x=axes['Sc'],  # Sc values
+                        y=axes['Re'],  # Re values
+                        colorscale='Viridis',
+                        contours=dict(
+                            showlabels=True,
+                            labelfont=dict(size=12, color='white')
+                        ),
+                        colorbar=dict(title='Predicted Sh')
+                    )
+                )
+                
+                # Mark optimal point
+                fig.add_trace(
+                    go.Scatter(
+                        x=[optimal_conditions['Sc']],
+                        y=[optimal_conditions['Re']],
+                        mode='markers',
+                        marker=dict(
+                            symbol='star',
+                            size=15,
+                            color='red',
+                            line=dict(width=2, color='black')
+                        ),
+                        name='Optimal Conditions'
+                    )
+                )
+                
+                # Mark experimental points
+                fig.add_trace(
+                    go.Scatter(
+                        x=data['Sc'],
+                        y=data['Re'],
+                        mode='markers',
+                        marker=dict(
+                            size=10,
+                            color='white',
+                            line=dict(width=1, color='black')
+                        ),
+                        name='Experimental Points'
+                    )
+                )
+                
+                fig.update_layout(
+                    title='Predicted Sherwood Number Contour Map',
+                    xaxis_title='Schmidt Number (Sc)',
+                    yaxis_title='Reynolds Number (Re)',
+                    height=600
+                )
+                
+                st.plotly_chart(fig, use_container_width=True)
+    
+    # 3D Visualization
+    if "3D Visualization" in open_analyses:
+        st.write("### 3D Visualization of Parameter Relationships")
+        
+        # Select parameters for 3D plot
+        available_params = list(data.columns)
+        available_params.remove('Sh')  # Remove target variable
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            x_param = st.selectbox("Select X-axis parameter", available_params, index=0)
+        
+        with col2:
+            y_param = st.selectbox("Select Y-axis parameter", available_params, index=min(1, len(available_params)-1))
+        
+        # Create 3D scatter plot
+        fig = go.Figure(data=[
+            downsampled_trace(
+                go.Scatter3d,
+                x=data[x_param],
+                y=data[y_param],
+                z=data['Sh'],
+                mode='markers',
+                marker=dict(
+                    size=10,
+                    color=data['Sh'],
+                    colorscale='Viridis',
+                    opacity=0.8,
+                    colorbar=dict(title='Sh')
+                ),
+                hover_labels=np.arange(1, len(data) + 1),
+                hovertemplate=
+                    f"<b>%{{text}}</b><br>" +
+                    f"{x_param}: %{{x}}<br>" +
+                    f"{y_param}: %{{y}}<br>" +
+                    "Sh: %{z}<br>" +
+                    "<extra></extra>"
+            )
+        ])
+        
+        # Create surface plot if enough data points
+        if len(data) >= 10 and x_param != y_param:
+            surface_resolution = st.slider("Surface Resolution (points per axis)", min_value=10, max_value=MAX_SURFACE_POINTS, value=SURFACE_POINTS, step=10)
+            
+            try:
+                # Other columns are held at their mean values
+                x_surface, y_surface, z_surface = predicted_surface(
+                    correlation.a,
+                    tuple(correlation.exponents.items()),
+                    ((x_param, (float(data[x_param].min()), float(data[x_param].max()))),
+                     (y_param, (float(data[y_param].min()), float(data[y_param].max())))),
+                    surface_resolution,
+                    tuple((col, float(data[col].mean())) for col in available_params if col not in [x_param, y_param])
+                )
+                
+                # Add surface plot
+                fig.add_trace(
+                    go.Surface(
+                        x=x_surface,
+                        y=y_surface,
+                        z=z_surface,
+                        opacity=0.7,
+                        colorscale='Viridis',
+                        showscale=False
+                    )
+                )
+            except Exception as e:
+                st.warning(f"Could not create surface plot: {e}")
+        
+        fig.update_layout(
+            title=f'3D Visualization of Sh vs {x_param} and {y_param}',
+            scene=dict(
+                xaxis_title=x_param,
+                yaxis_title=y_param,
+                zaxis_title='Sh'
+            ),
+            height=700,
+            margin=dict(l=0, r=0, b=0, t=30)
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Add explanation
+        st.write("""
+        This 3D visualization shows the relationship between Sherwood number and two selected parameters. 
+        The colored points represent actual experimental data, while the surface (if shown) represents the model prediction.
+        
+        You can:
+        - Rotate the plot by clicking and dragging
+        - Zoom in/out using the scroll wheel
+        - Select different parameters for the X and Y axes
+        - Hover over points to see detailed information
+        """)
+        
+        # Add interactive sliders for exploring parameter space
+        st.write("### Interactive Parameter Space Explorer")
+        
+        explorer_model = st.radio("Prediction Model", ["Regression Correlation", "Random Forest Surrogate"], horizontal=True)
+        
+        # Tabulate the model once over the slider ranges; slider moves only interpolate
+        table_key = make_cache_key(
+            data,
+            analysis='response_table',
+            explorer_model=explorer_model,
+            coefficients=(correlation.a, tuple(correlation.exponents.items()))
+        )
+        
+        # Most recently used tables last; the oldest are dropped beyond the cap
+        response_tables = st.session_state.response_tables
+        response_table = response_tables.get(table_key)
+        
+        if response_table is None:
+            try:
+                with st.spinner("Precomputing the response table..."):
+                    if explorer_model == "Regression Correlation":
+                        # The correlation only varies with the groups it uses
+                        table_bounds = {param: (float(data[param].min()), float(data[param].max())) for param in correlation.terms}
+                        response_table = ResponseTable(correlation.predict, table_bounds, log_space=True)
+                    else:
+                        table_bounds = {param: (float(data[param].min()), float(data[param].max())) for param in available_params}
+                        surrogate, _ = fit_random_forest(data)
+                        response_table = ResponseTable(
+                            lambda values: surrogate.predict(pd.DataFrame(values)[surrogate.feature_names_in_]),
+                            table_bounds
+                        )
+                
+                response_tables[table_key] = response_table
+                while len(response_tables) > RESPONSE_TABLE_CACHE_ENTRIES:
+                    response_tables.popitem(last=False)
+            except Exception as e:
+                st.warning(f"Could not build the response table: {e}")
+        else:
+            response_tables.move_to_end(table_key)
+        
+        # Create sliders for each parameter
+        slider_values = {}
+        
+        for param in available_params:
+            if param not in [x_param, y_param]:
+                min_val = float(data[param].min())
+                max_val = float(data[param].max())
+                mean_val = float(data[param].mean())
+                
+                step = (max_val - min_val) / 100
+                slider_values[param] = st.slider(
+                    f"{param} Value", 
+                    min_value=min_val,
+                    max_value=max_val,
+                    value=mean_val,
+                    step=step
+                )
+        
+        # Calculate Sh for the current parameter values
+        if slider_values and response_table is not None:
+            # Create a point with the current slider values
+            point = {param: value for param, value in slider_values.items()}
+            point[x_param] = data[x_param].mean()
+            point[y_param] = data[y_param].mean()
+            
+            # Interpolate Sh from the response table
+            sh_val = float(response_table(point))
+            
+            # Display the calculated Sh
+            st.metric("Predicted Sherwood Number", f"{sh_val:.2f}")
+            
+            # Calculate MTC
+            mtc = sh_val * diffusivity / char_length
+            st.metric("Predicted Mass Transfer Coefficient", f"{mtc:.2e} m/s")
+            
+            st.caption(f"Interpolated from {len(response_table):,} precomputed model evaluations.")
+    
+    # Neural Network Prediction
+    if "Neural Network Prediction" in open_analyses:
+        st.write("### Neural Network Prediction")
+        
+        # Create and train a neural network
+        if st.button("Train Neural Network Model"):
+            with st.spinner("Training neural network..."):
+                # TensorFlow and scikit-learn are only needed once training is requested
+                from sklearn.metrics import r2_score
+                from sklearn.model_selection import train_test_split
+                from sklearn.neural_network import MLPRegressor
+                from sklearn.pipeline import Pipeline
+                from sklearn.preprocessing import StandardScaler
+                from tensorflow.keras.callbacks import EarlyStopping
+                from tensorflow.keras.layers import Dense, Dropout
+                from tensorflow.keras.models import Sequential
+                
+                # Prepare data
+                X = data.drop('Sh', axis=1)
+                y = data['Sh']
+                
+                # Split data
+                X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+                
+                # Scale data
+                scaler = StandardScaler()
+                X_train_scaled = scaler.fit_transform(X_train)
+                X_test_scaled = scaler.transform(X_test)
+                
+                # Create neural network model
+                model = Sequential([
+                    Dense(64, activation='relu', input_shape=(X_train.shape[1],)),
+                    Dropout(0.2),
+                    Dense(32, activation='relu'),
+                    Dropout(0.2),
+                    Dense(16, activation='relu'),
+                    Dense(1)
+                ])
+                
+                # Compile model
+                model.compile(optimizer='adam', loss='mse', metrics=['mae'])
+                
+                # Early stopping
+                early_stopping = EarlyStopping(
+                    monitor='val_loss',
+                    patience=20,
+                    restore_best_weights=True
+                )
+                
+                # Train model
+                history = model.fit(
+                    X_train_scaled, y_train,
+                    validation_split=0.2,
+                    epochs=200,
+                    batch_size=8,
+                    callbacks=[early_stopping],
+                    verbose=0
+                )
+                
+                # Evaluate model
+                y_pred = model.predict(X_test_scaled)
+                nn_r2 = r2_score(y_test, y_pred)
+                
+                # Plot training history
+                fig = go.Figure()
+                
+                fig.add_trace(
+                    go.Scatter(
+                        x=list(range(1, len(history.history['loss']) + 1)),
+                        y=history.history['loss'],
+                        mode='lines',
+                        name='Training Loss',
+                        line=dict(color='blue', width=2)
+                    )
+                )
+                
+                fig.add_trace(
+                    go.Scatter(
+                        x=list(range(1, len(history.history['val_loss']) + 1)),
+                        y=history.history['val_loss'],
+                        mode='lines',
+                        name='Validation Loss',
+                        line=dict(color='red', width=2)
+                    )
+                )
+                
+                fig.update_layout(
+                    title='Neural Network Training History',
+                    xaxis_title='Epoch',
+                    yaxis_title='Loss',
+                    legend_title='',
+                    height=400
+                )
+                
+                st.plotly_chart(fig, use_container_width=True)
+                
+                # Compare with regression model
+                st.write(f"Neural Network Model RÂ²: **{nn_r2:.6f}**")
+                st.write(f"Current Regression Model RÂ²: **{model_data['r2']:.6f}**")
+                
+                if nn_r2 > model_data['r2']:
+                    st.success("The neural network outperforms the current regression model. Consider using neural networks for more accurate predictions.")
+                else:
+                    st.info("The current regression model performs well. The simpler model is preferred for interpretability.")
+                
+                # Make predictions on all data
+                X_all_scaled = scaler.transform(X)
+                y_all_pred = model.predict(X_all_scaled)
+                
+                # Create comparison plot
+                fig = go.Figure()
+                
+                fig.add_trace(
+                    go.Scatter(
+                        x=data.index,
+                        y=data['Sh'],
+                        mode='lines+markers',
+                        name='Experimental Sh',
+                        line=dict(color='blue'),
+                        marker=dict(size=10)
+                    )
+                )
+                
+                fig.add_trace(
+                    go.Scatter(
+                        x=data.index,
+                        y=y_all_pred.flatten(),
+                        mode='lines+markers',
+                        name='Neural Network Prediction',
+                        line=dict(color='green'),
+                        marker=dict(size=10)
+                    )
+                )
+                
+                fig.add_trace(
+                    go.Scatter(
+                        x=data.index,
+                        y=observed_sh,
+                        mode='lines+markers',
+                        name='Regression Model Prediction',
+                        line=dict(color='red'),
+                        marker=dict(size=10)
+                    )
+                )
+                
+                fig.update_layout(
+                    title='Comparison of Experimental Data with Model Predictions',
+                    xaxis_title='Data Point',
+                    yaxis_title='Sherwood Number (Sh)',
+                    legend_title='',
+                    height=500,
+                    hovermode='x unified'
+                )
+                
+                st.plotly_chart(fig, use_container_width=True)
+                
+                # Feature importance using permutation importance
+                from sklearn.inspection import permutation_importance
+                
+                # Create a pipeline with the neural network
+                nn_pipeline = Pipeline([
+                    ('scaler', StandardScaler()),
+                    ('nn', MLPRegressor(
+                        hidden_layer_sizes=(64, 32, 16),
+                        activation='relu',
+                        solver='adam',
+                        random_state=42,
+                        max_iter=1000
+                    ))
+                ])
+                
+                # Fit the pipeline
+                nn_pipeline.fit(X_train, y_train)
+                
+                # Calculate permutation importance
+                result = permutation_importance(
+                    nn_pipeline, X_test, y_test,
+                    n_repeats=10,
+                    random_state=42
+                )
+                
+                # Create importance dataframe
+                importance_df = pd.DataFrame({
+                    'Feature': X.columns,
+                    'Importance': result.importances_mean
+                }).sort_values('Importance', ascending=False)
+                
+                # Plot feature importance
+                fig = px.bar(
+                    importance_df,
+                    x='Feature',
+                    y='Importance',
+                    title='Neural Network Feature Importance',
+                    color='Importance',
+                    color_continuous_scale='Viridis'
+                )
+                
+                fig.update_layout(
+                    xaxis_title='Feature',
+                    yaxis_title='Importance',
+                    height=400
+                )
+                
+                st.plotly_chart(fig, use_container_width=True)
+    
+    # Uncertainty Analysis
+    if "Uncertainty Analysis" in open_analyses:
+        st.write("### Uncertainty Analysis")
+        
+        # Bootstrap analysis for parameter uncertainty
+        st.write("#### Parameter Uncertainty Analysis")
+        
+        n_bootstrap = st.number_input("Number of Bootstrap Resamples", min_value=100, max_value=1000000, value=10000, step=1000)
+        
+        # Earlier resamples of this dataset and model are reused and extended
+        bootstrap_key = make_cache_key(data, analysis='bootstrap', model_type=model_type, x2=x2, entry_format=2)
+        bootstrap_run = result_cache.get(bootstrap_key)
+        if bootstrap_run is None:
+            bootstrap_run = BootstrapRun(data['Sh'].values, log_features(data, model_type), model_type, x2)
+        
+        if len(bootstrap_run) > 0:
+            st.caption(f"{len(bootstrap_run)} resamples of this model are cached; only additional resamples are fitted.")
+        
+        if st.button("Run Bootstrap Analysis"):
+            with st.spinner("Running bootstrap analysis..."):
+                # Progress bar and intervals that update as each batch completes
+                progress_bar = st.progress(0)
+                live_summary = st.empty()
+                
+                # The summary is refreshed at most once per interval, and the run is
+                # stored once it completes or is interrupted so that it can resume
+                last_refresh = time.monotonic()
+                try:
+                    for n_fitted in bootstrap_run.extend(n_bootstrap):
+                        progress_bar.progress(min(1.0, n_fitted / n_bootstrap))
+                        if time.monotonic() - last_refresh >= BOOTSTRAP_REFRESH_SECONDS:
+                            live_summary.dataframe(bootstrap_summary(bootstrap_run.samples))
+                            last_refresh = time.monotonic()
+                finally:
+                    result_cache.set(bootstrap_key, bootstrap_run)
+                
+                live_summary.empty()
+        
+        if len(bootstrap_run) > 0:
+            # Convert to dataframe
+            bootstrap_df = bootstrap_run.samples.iloc[:n_bootstrap]
+            summary = bootstrap_summary(bootstrap_df)
+            
+            # Calculate confidence intervals
+            a_mean, a_std, a_ci_lower, a_ci_upper = summary.loc['a']
+            x1_mean, x1_std, x1_ci_lower, x1_ci_upper = summary.loc['x1']
+            r2_mean, r2_std, r2_ci_lower, r2_ci_upper = summary.loc['r2']
+            
+            # Display results
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.metric("Mean 'a' Value", f"{a_mean:.4f}")
+                st.metric("'a' Standard Deviation", f"{a_std:.4f}")
+                st.write(f"95% Confidence Interval for 'a': [{a_ci_lower:.4f}, {a_ci_upper:.4f}]")
+            
+            with col2:
+                st.metric("Mean 'x1' Value", f"{x1_mean:.4f}")
+                st.metric("'x1' Standard Deviation", f"{x1_std:.4f}")
+                st.write(f"95% Confidence Interval for 'x1': [{x1_ci_lower:.4f}, {x1_ci_upper:.4f}]")
+            
+            with col3:
+                st.metric("Mean RÂ² Value", f"{r2_mean:.4f}")
+                st.metric("RÂ² Standard Deviation", f"{r2_std:.4f}")
+                st.write(f"95% Confidence Interval for RÂ²: [{r2_ci_lower:.4f}, {r2_ci_upper:.4f}]")
+            
+            # Plot parameter distributions
+            fig = make_subplots(
+                rows=1, 
+                cols=3,
+                subplot_titles=("Distribution of 'a' Parameter", "Distribution of 'x1' Parameter", "Distribution of RÂ² Values")
+            )
+            
+            # 'a' distribution
+            fig.add_trace(
+                go.Histogram(
+                    x=bootstrap_df['a'],
+                    name="'a' Parameter",
+                    marker=dict(color='blue'),
+                    opacity=0.7,
+                    nbinsx=20
+                ),
+                row=1, col=1
+            )
+            
+            # Add vertical line for mean and CI
+            fig.add_trace(
+                go.Scatter(
+                    x=[a_mean, a_mean],
+                    y=[0, bootstrap_df['a'].value_counts().max()],
+                    mode='lines',
+                    line=dict(color='red', width=2, dash='dash'),
+                    name='Mean',
+                    showlegend=False
+                ),
+                row=1, col=1
+            )
+            
+            # 'x1' distribution
+            fig.add_trace(
+                go.Histogram(
+                    x=bootstrap_df['x1'],
+                    name="'x1' Parameter",
+                    marker=dict(color='green'),
+                    opacity=0.7,
+                    nbinsx=20
+                ),
+                row=1, col=2
+            )
+            
+            # Add vertical line for mean and CI
+            fig.add_trace(
+                go.Scatter(
+                    x=[x1_mean, x1_mean],
+                    y=[0, bootstrap_df['x1'].value_counts().max()],
+                    mode='lines',
+                    line=dict(color='red', width=2, dash='dash'),
+                    name='Mean',
+                    showlegend=False
+                ),
+                row=1, col=2
+            )
+            
+            # RÂ² distribution
+            fig.add_trace(
+                go.Histogram(
+                    x=bootstrap_df['r2'],
+                    name="RÂ² Value",
+                    marker=dict(color='purple'),
+                    opacity=0.7,
+                    nbinsx=20
+                ),
+                row=1, col=3
+            )
+            
+            # Add vertical line for mean and CI
+            fig.add_trace(
+                go.Scatter(
+                    x=[r2_mean, r2_mean],
+                    y=[0, bootstrap_df['r2'].value_counts().max()],
+                    mode='lines',
+                    line=dict(color='red', width=2, dash='dash'),
+                    name='Mean',
+                    showlegend=False
+                ),
+                row=1, col=3
+            )
+            
+            fig.update_layout(
+                height=400,
+                showlegend=False
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+            
+            st.write("""
+            ### Uncertainty Analysis Interpretation
+            
+            The bootstrap analysis provides insights into the uncertainty of the model parameters:
+            
+            - **Parameter 'a'**: The coefficient in the Sherwood number correlation. The 95% confidence interval shows the range of likely values.
+            
+            - **Parameter 'x1'**: The Reynolds number exponent. The confidence interval indicates the stability of this parameter.
+            
+            - **RÂ² Value**: The goodness of fit measure. The confidence interval indicates the stability of the model's predictive power.
+            
+            A narrow confidence interval suggests high confidence in the parameter estimates, while a wide interval indicates greater uncertainty.
+            """)
+        
+        # Leave-one-out analysis from rank-one updates of the log-linearized fit
+        st.write("#### Leave-One-Out Influence Diagnostics")
+        
+        jackknife = leave_one_out(data['Sh'].values, log_features(data, model_type), model_type, x2)
+        
+        jackknife_df = pd.DataFrame({
+            'Estimate': jackknife['estimate'],
+            'Jackknife Bias': jackknife['bias'],
+            'Jackknife Std': jackknife['std']
+        }).dropna()
+        
+        # BCa intervals need the bootstrap samples of the same model
+        if len(bootstrap_run) > 0:
+            bca = bca_interval(bootstrap_run.samples.iloc[:n_bootstrap], jackknife)
+            jackknife_df['BCa CI Lower'] = bca['CI Lower']
+            jackknife_df['BCa CI Upper'] = bca['CI Upper']
+        else:
+            st.info("Run the bootstrap analysis above to add BCa-corrected confidence intervals.")
+        
+        st.dataframe(jackknife_df.style.format('{:.4f}'))
+        
+        influence_df = pd.DataFrame({
+            'Data Point': np.arange(1, len(data) + 1),
+            'Leverage': jackknife['leverage'],
+            "Cook's Distance": jackknife['cooks_distance']
+        })
+        
+        # Common rule of thumb for influential points
+        cooks_threshold = 4 / len(data)
+        
+        fig = make_subplots(rows=1, cols=2, subplot_titles=("Cook's Distance", "Leverage"))
+        
+        fig.add_trace(
+            go.Bar(
+                x=influence_df['Data Point'],
+                y=influence_df["Cook's Distance"],
+                marker=dict(color=np.where(influence_df["Cook's Distance"] > cooks_threshold, 'red', 'blue'))
+            ),
+            row=1, col=1
+        )
+        
+        fig.add_hline(y=cooks_threshold, line_dash='dash', line_color='red', row=1, col=1)
+        
+        fig.add_trace(
+            go.Bar(
+                x=influence_df['Data Point'],
+                y=influence_df['Leverage'],
+                marker=dict(color='green')
+            ),
+            row=1, col=2
+        )
+        
+        fig.update_layout(
+            height=400,
+            showlegend=False
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+        influential = influence_df[influence_df["Cook's Distance"] > cooks_threshold]
+        if len(influential) > 0:
+            st.write(f"**{len(influential)} influential data points** (Cook's distance above 4/n = {cooks_threshold:.3f}):")
+            st.dataframe(influential.sort_values("Cook's Distance", ascending=False))
+        else:
+            st.success("No single data point has a strong influence on the correlation.")
+        
+        # Prediction uncertainty
+        st.write("#### Prediction Uncertainty Analysis")
+        
+        # Create sliders for input parameters
+        st.write("Enter parameter values to analyze prediction uncertainty:")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            re_value = st.number_input("Reynolds Number (Re):", min_value=0.1, max_value=100000.0, value=float(data['Re'].mean()))
+        
+        with col2:
+            sc_value = st.number_input("Schmidt Number (Sc):", min_value=0.1, max_value=10000.0, value=float(data['Sc'].mean()))
+        
+        extra_params = {}
+        
+        if model_type in [1, 2] and 'We' in data.columns:
+            extra_params['We'] = st.number_input("Weber Number (We):", min_value=0.01, max_value=1000.0, value=float(data['We'].mean()))
+        
+        if model_type in [1, 3] and 'Eg' in data.columns:
+            extra_params['Eg'] = st.number_input("Eotvos Number (Eg):", min_value=0.01, max_value=1000.0, value=float(data['Eg'].mean()))
+        
+        if st.button("Calculate Prediction Uncertainty"):
+            # Parameter covariance from the analytic Jacobian of the fitted correlation
+            covariance = parameter_covariance(correlation, data, data['Sh'].values)
+            
+            # Calculate predicted Sh and its delta-method standard error
+            point = {'Re': re_value, 'Sc': sc_value, **extra_params}
+            interval = prediction_interval(correlation, covariance, point)
+            sh_pred = float(interval['sh'])
+            sh_uncertainty = float(interval['std'])
+            
+            # Calculate MTC
+            mtc_pred = sh_pred * diffusivity / char_length
+            mtc_uncertainty = sh_uncertainty * diffusivity / char_length
+            
+            # Display results
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.metric("Predicted Sherwood Number", f"{sh_pred:.2f} Â± {sh_uncertainty:.2f}")
+            
+            with col2:
+                st.metric("Predicted Mass Transfer Coefficient", f"{mtc_pred:.2e} Â± {mtc_uncertainty:.2e} m/s")
+            
+            # Create visualization of uncertainty
+            fig = go.Figure()
+            
+            # Sh prediction with uncertainty
+            fig.add_trace(
+                go.Scatter(
+                    x=['Sherwood Number', 'Mass Transfer Coefficient'],
+                    y=[sh_pred, mtc_pred],
+                    mode='markers',
+                    marker=dict(size=15, color='blue'),
+                    name='Predicted Value'
+                )
+            )
+            
+            # Error bars
+            fig.add_trace(
+                go.Scatter(
+                    x=['Sherwood Number', 'Mass Transfer Coefficient'],
+                    y=[sh_pred, mtc_pred],
+                    error_y=dict(
+                        type='data',
+                        array=[sh_uncertainty, mtc_uncertainty],
+                        visible=True,
+                        color='red',
+                        thickness=1.5,
+                        width=5
+                    ),
+                    mode='markers',
+                    marker=dict(size=15, color='blue'),
+                    name='Uncertainty'
+                )
+            )
+            
+            fig.update_layout(
+                title='Prediction with Uncertainty',
+                xaxis_title='Parameter',
+                yaxis_title='Value',
+                height=500,
+                yaxis=dict(type='log')
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+            
+            st.write(f"95% Confidence Interval for Sh: [{float(interval['lower']):.2f}, {float(interval['upper']):.2f}]")
+            
+            # 95% confidence band across the Reynolds number range, other groups as entered
+            re_band = np.linspace(data['Re'].min(), data['Re'].max(), 200)
+            band = prediction_interval(correlation, covariance, {**point, 'Re': re_band})
+            
+            fig = go.Figure()
+            
+            fig.add_trace(
+                go.Scatter(
+                    x=np.concatenate([re_band, re_band[::-1]]),
+                    y=np.concatenate([band['upper'], band['lower'][::-1]]),
+                    fill='toself',
+                    fillcolor='rgba(0, 0, 255, 0.2)',
+                    line=dict(color='rgba(0, 0, 255, 0)'),
+                    name='95% Confidence Band'
+                )
+            )
+            
+            fig.add_trace(
+                go.Scatter(
+                    x=re_band,
+                    y=band['sh'],
+                    mode='lines',
+                    line=dict(color='blue', width=2),
+                    name='Predicted Sh'
+                )
+            )
+            
+            fig.update_layout(
+                title='Predicted Sherwood Number with 95% Confidence Band',
+                xaxis_title='Reynolds Number (Re)',
+                yaxis_title='Sherwood Number (Sh)',
+                height=500
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+            
+            st.write("""
+            ### Prediction Uncertainty Interpretation
+            
+            The prediction uncertainty represents the range within which the true value is likely to fall. 
+            Factors contributing to uncertainty include:
+            
+            - Parameter estimation uncertainty
+            - Model structural uncertainty
+            - Measurement errors in the experimental data
+            
+            For engineering applications, it's important to consider this uncertainty when making design decisions.
+            """)
+
+#streamlit run /workspaces/Algorithmic_Trading_K25/MAJOR_PROJECT/t_1.py --server.enableCORS false --server.enableXsrfProtection false
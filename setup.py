@@ -4,6 +4,7 @@ setup(
     name="cheme_analysis_suite",
     version="0.1.0",
     packages=find_packages(),
+    package_data={"app": ["assets/lottie/*.json"]},
     install_requires=[
         "streamlit>=1.24.0",
         "numpy>=1.24.3",
@@ -0,0 +1,137 @@
+import os
+import subprocess
+import sys
+import tracemalloc
+import unittest
+import numpy as np
+import pandas as pd
+from app.utils.analysis import AnalysisStages, detailed_analysis, required_columns, run_analysis
+from app.utils.mass_transfer_calc import PowerLawCorrelation, compare_with_experiment
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+class TestAnalysis(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.data = pd.DataFrame({
+            'Re': rng.uniform(1000, 5000, 15),
+            'Sc': rng.uniform(0.5, 2.0, 15),
+            'We': rng.uniform(1.0, 5.0, 15),
+            'Eg': rng.uniform(0.1, 0.3, 15)
+        })
+        self.data['Sh'] = 2.5 * self.data['Re']**0.7 * self.data['Sc']**0.33 * self.data['We']**-0.3 * self.data['Eg']**0.12
+
+    def test_required_columns(self):
+        self.assertEqual(required_columns(4), ['Sh', 'Re', 'Sc'])
+        self.assertEqual(required_columns(4, "Compare All Models"), ['Sh', 'Re', 'Sc', 'We', 'Eg'])
+
+    def test_random_search_reports_progress(self):
+        progress = []
+        output = run_analysis(
+            self.data, 2, "Random Search", {'num_iterations': 500, 'seed': 0, 'top_k': 10},
+            progress=lambda completed, results: progress.append(completed)
+        )
+        self.assertEqual(progress[-1], 500)
+        self.assertEqual(len(output['results']), 10)
+        self.assertIsNone(output['r2_surface'])
+
+    def test_each_search_mode_returns_plain_results(self):
+        grid = run_analysis(self.data, 1, "Exhaustive Grid", {'grid_resolution': 5, 'top_k': 5})
+        self.assertIsNotNone(grid['r2_surface'])
+
+        comparison = run_analysis(self.data, 3, "Compare All Models", {'num_iterations': 200, 'seed': 1, 'top_k': 5})
+        self.assertEqual(len(comparison['comparison']), 4)
+        self.assertEqual(comparison['results'].model_type, 3)
+
+        free = run_analysis(
+            self.data, 1, "Free-Exponent Fit",
+            {'bounds': {'a': (0.1, 10.0), 'x1': (0.5, 1.0), 'x2': (0.33, 0.33), 'x3': (-1.0, 0.0), 'x4': (0.0, 0.5)}, 'n_starts': 2, 'top_k': 2}
+        )
+        self.assertTrue(free['converged'])
+        self.assertAlmostEqual(free['results'][0]['r2'], 1.0, places=6)
+
+    def test_missing_columns_raise(self):
+        with self.assertRaises(ValueError):
+            run_analysis(self.data.drop(columns='Eg'), 1, "Random Search", {'num_iterations': 10})
+
+    def test_detailed_analysis_summarizes_errors(self):
+        model_data = {'a': 2.5, 'x1': 0.7, 'x2': 0.33, 'x3': -0.3, 'x4': 0.12}
+        output = detailed_analysis(self.data, model_data, 1, 0.01, 1e-9, (100, 500), (1, 5))
+        self.assertEqual(len(output['comparison']), 15)
+        self.assertAlmostEqual(output['max_error'], 0.0, places=8)
+        self.assertTrue(output['within_threshold'])
+
+    def test_stages_match_compare_with_experiment(self):
+        correlation = PowerLawCorrelation(2.0, 0.7, 0.33, -0.3, 0.12)
+        _, comparison = AnalysisStages(self.data).comparison(correlation, 0.01, 1e-9, (100, 500), (1, 5))
+        expected = compare_with_experiment(self.data, correlation, 0.01, 1e-9, (100, 500), (1, 5))
+        pd.testing.assert_frame_equal(comparison, expected)
+
+    def test_comparison_reads_the_mtc_stage(self):
+        correlation = PowerLawCorrelation(2.0, 0.7, 0.33, -0.3, 0.12)
+        stages = AnalysisStages(self.data)
+        _, mtc = stages.mtc(correlation, 0.01, 1e-9)
+        _, comparison = stages.comparison(correlation, 0.01, 1e-9, (100, 500), (1, 5))
+        self.assertEqual(stages.evaluations['mtc'], 1)
+        np.testing.assert_array_equal(comparison['Experimental MTC (m/s)'], mtc['experimental'])
+        np.testing.assert_array_equal(comparison['Observed MTC (m/s)'], mtc['model'])
+
+    def test_changed_input_recomputes_only_downstream_stages(self):
+        model_data = {'a': 2.5, 'x1': 0.7, 'x2': 0.33, 'x3': -0.3, 'x4': 0.12}
+        stages = AnalysisStages(self.data)
+        first = detailed_analysis(self.data, model_data, 1, 0.01, 1e-9, (100, 500), (1, 5), stages)
+
+        # A new characteristic length reuses the predictions and errors
+        second = detailed_analysis(self.data, model_data, 1, 0.02, 1e-9, (100, 500), (1, 5), stages)
+        self.assertEqual(stages.evaluations, {'predictions': 1, 'errors': 1, 'mtc': 2, 'comparison': 2})
+        self.assertEqual(first['keys']['errors'], second['keys']['errors'])
+        np.testing.assert_allclose(second['comparison']['Observed MTC (m/s)'], first['comparison']['Observed MTC (m/s)'] / 2)
+
+        # Only the table depends on the W range, and repeated inputs are served from the cache
+        detailed_analysis(self.data, model_data, 1, 0.02, 1e-9, (200, 500), (1, 5), stages)
+        detailed_analysis(self.data, model_data, 1, 0.01, 1e-9, (100, 500), (1, 5), stages)
+        self.assertEqual(stages.evaluations, {'predictions': 1, 'errors': 1, 'mtc': 2, 'comparison': 3})
+
+        # New coefficients invalidate every stage
+        detailed_analysis(self.data, dict(model_data, a=2.0), 1, 0.01, 1e-9, (100, 500), (1, 5), stages)
+        self.assertEqual(stages.evaluations, {'predictions': 2, 'errors': 2, 'mtc': 3, 'comparison': 4})
+
+    def test_detailed_analysis_scales_to_a_million_rows(self):
+        n = 1_000_000
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame({
+            'Sh': rng.uniform(10, 100, n),
+            'Re': rng.uniform(1000, 5000, n),
+            'Sc': rng.uniform(0.5, 2.0, n),
+            'We': rng.uniform(1.0, 5.0, n),
+            'Eg': rng.uniform(0.1, 0.3, n)
+        })
+        model_data = {'a': 1.5, 'x1': 0.7, 'x2': 0.33, 'x3': -0.3, 'x4': 0.12}
+
+        tracemalloc.start()
+        analysis = detailed_analysis(data, model_data, 1, 0.01, 1e-9, (100, 1000), (1.0, 10.0))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        # The stages hold a dozen float columns, with no per-row Python objects
+        self.assertEqual(len(analysis['comparison']), n)
+        self.assertLess(peak, 24 * 8 * n)
+
+    def test_stage_cache_is_bounded(self):
+        stages = AnalysisStages(self.data, max_entries=2)
+        for value in range(5):
+            stages.run('figure', value, (), lambda: object())
+        self.assertEqual(len(stages._values), 2)
+        stages.run('figure', 4, (), lambda: object())
+        self.assertEqual(stages.evaluations['figure'], 5)
+
+    def test_engine_imports_without_streamlit(self):
+        script = "import sys, app.utils.analysis; print('streamlit' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, '-c', script], cwd=ROOT, env=dict(os.environ, PYTHONPATH=ROOT),
+            capture_output=True, text=True, check=True
+        )
+        self.assertEqual(result.stdout.strip(), 'False')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from app.utils import assets
+from app.utils.assets import LOTTIE_URLS, load_lottie
+
+class TestAssets(unittest.TestCase):
+    def setUp(self):
+        load_lottie.cache_clear()
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        load_lottie.cache_clear()
+        self.tmp.cleanup()
+
+    def test_bundled_animations_load_without_network(self):
+        with mock.patch('requests.get', side_effect=AssertionError("network used")):
+            for name in LOTTIE_URLS:
+                animation = load_lottie(name)
+                self.assertIsInstance(animation, dict)
+                self.assertIn('layers', animation)
+
+    def test_missing_animation_is_not_fetched_by_default(self):
+        with mock.patch('requests.get', side_effect=AssertionError("network used")):
+            self.assertIsNone(load_lottie('analysis', asset_dir=self.tmp.name))
+
+    def test_fetched_animation_is_stored_locally(self):
+        response = mock.Mock()
+        response.json.return_value = {'layers': []}
+        with mock.patch('requests.get', return_value=response) as get:
+            self.assertEqual(load_lottie('success', asset_dir=self.tmp.name, fetch=True, timeout=1.5), {'layers': []})
+        self.assertEqual(get.call_args.kwargs['timeout'], 1.5)
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, 'success.json')))
+
+    def test_failed_fetch_returns_none(self):
+        import requests
+        with mock.patch('requests.get', side_effect=requests.ConnectionError):
+            self.assertIsNone(load_lottie('loading', asset_dir=self.tmp.name, fetch=True))
+
+    def test_asset_dir_is_inside_app(self):
+        self.assertTrue(os.path.isdir(assets.DEFAULT_ASSET_DIR))
+
+if __name__ == '__main__':
+    unittest.main()
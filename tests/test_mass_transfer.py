@@ -1,7 +1,92 @@
+import tracemalloc
 import unittest
+import numpy as np
+import pandas as pd
 from app.utils import mass_transfer_calc
+from app.utils.mass_transfer_calc import PowerLawCorrelation, compare_with_experiment
 
 class TestMassTransfer(unittest.TestCase):
+    def setUp(self):
+        self.data = pd.DataFrame({
+            'Re': [1000.0, 2000.0, 3000.0],
+            'Sc': [0.7, 0.8, 0.9],
+            'We': [2.5, 3.5, 4.5],
+            'Eg': [0.12, 0.15, 0.18]
+        })
+        self.model_data = {'a': 1.5, 'x1': 0.7, 'x2': 0.33, 'x3': -0.3, 'x4': 0.12}
+
     def test_mass_transfer_calculation(self):
         # Add test cases
         pass
+
+    def test_predict_matches_power_law(self):
+        correlation = PowerLawCorrelation.from_model_data(self.model_data, 1)
+        expected = 1.5 * self.data['Re']**0.7 * self.data['Sc']**0.33 * self.data['We']**-0.3 * self.data['Eg']**0.12
+        np.testing.assert_allclose(correlation.predict(self.data), expected)
+
+    def test_from_model_data_drops_unused_groups(self):
+        self.assertEqual(PowerLawCorrelation.from_model_data(self.model_data, 3).terms, ['Re', 'Sc', 'Eg'])
+        self.assertEqual(PowerLawCorrelation.from_model_data(self.model_data, 1, ['Re', 'Sc', 'We']).terms, ['Re', 'Sc', 'We'])
+
+    def test_predict_broadcasts_grids(self):
+        correlation = PowerLawCorrelation(2.0, 0.5, 0.33)
+        re_grid, sc_grid = np.meshgrid([100.0, 400.0], [1.0, 8.0, 27.0])
+        sh = correlation.predict({'Re': re_grid, 'Sc': sc_grid})
+        self.assertEqual(sh.shape, (3, 2))
+        self.assertAlmostEqual(sh[0, 1], 40.0)
+
+    def test_gradient_matches_finite_differences(self):
+        correlation = PowerLawCorrelation.from_model_data(self.model_data, 1)
+        gradient = correlation.gradient(self.data)
+        self.assertEqual(gradient.shape, (3, 5))
+        self.assertEqual(correlation.parameter_names, ['a', 'x1', 'x2', 'x3', 'x4'])
+
+        params = [1.5, 0.7, 0.33, -0.3, 0.12]
+        for j in range(5):
+            step = np.zeros(5)
+            step[j] = 1e-6
+            upper = PowerLawCorrelation(*(np.array(params) + step)).predict(self.data)
+            lower = PowerLawCorrelation(*(np.array(params) - step)).predict(self.data)
+            np.testing.assert_allclose(gradient[:, j], (upper - lower) / 2e-6, rtol=1e-5)
+
+    def test_calculate_sherwood_number(self):
+        sh = mass_transfer_calc.calculate_sherwood_number(100.0, 8.0, [2.0, 0.5, 1 / 3])
+        self.assertIsInstance(sh, float)
+        self.assertAlmostEqual(sh, 40.0)
+
+    def test_compare_with_experiment(self):
+        data = self.data.assign(Sh=[20.0, 30.0, 40.0])
+        correlation = PowerLawCorrelation.from_model_data(self.model_data, 2, data.columns)
+        results = compare_with_experiment(data, correlation, 0.01, 1e-9, (100, 300), (1.0, 3.0))
+
+        model_sh = correlation.predict(data)
+        np.testing.assert_allclose(results['Observed Sh'], model_sh)
+        np.testing.assert_allclose(results['Observed MTC (m/s)'], model_sh * 1e-7)
+        np.testing.assert_allclose(results['Experimental MTC (m/s)'], [2e-6, 3e-6, 4e-6])
+        np.testing.assert_allclose(results['Percentage Error (%)'], (data['Sh'] / model_sh - 1) * 100)
+        np.testing.assert_allclose(results['W (rpm)'], [100, 200, 300])
+        self.assertEqual(list(results['Data Point']), [1, 2, 3])
+
+    def test_compare_with_experiment_scales_to_a_million_rows(self):
+        n = 1_000_000
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame({
+            'Sh': rng.uniform(10, 100, n),
+            'Re': rng.uniform(1000, 5000, n),
+            'Sc': rng.uniform(0.5, 2.0, n),
+            'We': rng.uniform(1.0, 5.0, n),
+            'Eg': rng.uniform(0.1, 0.3, n)
+        })
+        correlation = PowerLawCorrelation.from_model_data(self.model_data, 1)
+
+        tracemalloc.start()
+        results = compare_with_experiment(data, correlation, 0.01, 1e-9, (100, 1000), (1.0, 10.0))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        # A few float columns of working memory, no per-row Python objects
+        self.assertEqual(len(results), n)
+        self.assertLess(peak, 20 * 8 * n)
+
+if __name__ == '__main__':
+    unittest.main()
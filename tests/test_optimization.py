@@ -0,0 +1,57 @@
+import time
+import unittest
+import numpy as np
+from app.utils.mass_transfer_calc import PowerLawCorrelation
+from app.utils.optimization import evaluate_grid, optimize_conditions, refine_grid_optimum
+
+class TestOptimization(unittest.TestCase):
+    def setUp(self):
+        self.correlation = PowerLawCorrelation(2.0, 0.7, 0.33, -0.3)
+        self.bounds = {'Re': (1000.0, 5000.0), 'Sc': (0.5, 2.0), 'We': (1.0, 5.0)}
+
+    def test_evaluate_grid_matches_pointwise_predictions(self):
+        axes, sh = evaluate_grid(self.correlation, {'Re': (1000.0, 5000.0), 'Sc': (0.5, 2.0)}, resolution=7, fixed={'We': 2.0})
+        self.assertEqual(sh.shape, (7, 7))
+        expected = self.correlation.predict({'Re': axes['Re'][3], 'Sc': axes['Sc'][5], 'We': 2.0})
+        self.assertAlmostEqual(sh[3, 5], float(expected))
+
+    def test_transposed_grid_matches_xy_meshgrid(self):
+        bounds = {'Re': (1000.0, 5000.0), 'Sc': (0.5, 2.0)}
+        axes, sh = evaluate_grid(self.correlation, bounds, resolution=200, fixed={'We': 2.0})
+        re_grid, sc_grid = np.meshgrid(axes['Re'], axes['Sc'])
+        expected = self.correlation.predict({'Re': re_grid, 'Sc': sc_grid, 'We': 2.0})
+        np.testing.assert_allclose(sh.T, expected)
+
+    def test_large_grid_is_fast(self):
+        start = time.perf_counter()
+        _, sh = evaluate_grid(self.correlation, self.bounds, resolution=200)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(sh.shape, (200, 200, 200))
+
+    def test_refinement_narrows_towards_optimum(self):
+        correlation = PowerLawCorrelation(1.0, 1.0, 1.0)
+        bounds = {'Re': (1000.0, 5000.0), 'Sc': (0.5, 2.0)}
+        point, sh = refine_grid_optimum(correlation, bounds, resolution=5, levels=3)
+        self.assertEqual(point, {'Re': 5000.0, 'Sc': 2.0})
+        self.assertAlmostEqual(sh, 10000.0)
+
+    def test_optimize_conditions_reaches_exact_bounds(self):
+        point, sh = optimize_conditions(self.correlation, self.bounds)
+        self.assertEqual(point['Re'], 5000.0)
+        self.assertEqual(point['Sc'], 2.0)
+        self.assertEqual(point['We'], 1.0)
+        self.assertAlmostEqual(sh, float(self.correlation.predict(point)))
+
+    def test_fine_resolution_is_capped_in_high_dimensions(self):
+        correlation = PowerLawCorrelation(2.0, 0.7, 0.33, -0.3, 0.1)
+        bounds = dict(self.bounds, Eg=(0.1, 1.0))
+        point, sh = optimize_conditions(correlation, bounds, resolution=500)
+        self.assertEqual(point, {'Re': 5000.0, 'Sc': 2.0, 'We': 1.0, 'Eg': 1.0})
+
+    def test_optimize_conditions_holds_fixed_groups(self):
+        point, sh = optimize_conditions(self.correlation, {'Re': (1000.0, 5000.0)}, fixed={'Sc': 1.0, 'We': 2.0})
+        self.assertEqual(list(point), ['Re'])
+        self.assertAlmostEqual(sh, float(self.correlation.predict({'Re': 5000.0, 'Sc': 1.0, 'We': 2.0})))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Report which page modules are imported after loading the requested pages in a fresh interpreter
+LOAD_SCRIPT = """
+import json, sys
+from app.views import load_page
+entry_points = [load_page(name) for name in sys.argv[1:]]
+cached = all(load_page(name) is entry for name, entry in zip(sys.argv[1:], entry_points))
+print(json.dumps({'cached': cached, 'modules': sorted(name for name in sys.modules if name.startswith('app.views.'))}))
+"""
+
+def load_pages(*names):
+    result = subprocess.run(
+        [sys.executable, '-c', LOAD_SCRIPT, *names],
+        cwd=ROOT,
+        env=dict(os.environ, PYTHONPATH=ROOT),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+class TestPages(unittest.TestCase):
+    def test_registry_imports_no_pages(self):
+        self.assertEqual(load_pages()['modules'], [])
+
+    def test_bubble_analysis_does_not_import_mass_transfer(self):
+        report = load_pages("Bubble Analysis")
+        self.assertEqual(report['modules'], ['app.views.bubble_analysis'])
+
+    def test_loaded_pages_are_cached(self):
+        report = load_pages("Mass Transfer Analysis", "Bubble Analysis")
+        self.assertTrue(report['cached'])
+        self.assertEqual(report['modules'], ['app.views.bubble_analysis', 'app.views.mass_transfer'])
+
+if __name__ == '__main__':
+    unittest.main()
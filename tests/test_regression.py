@@ -0,0 +1,205 @@
+import pickle
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+from scipy.optimize import minimize
+from app.utils import regression
+from app.utils.regression import log_features, sample_exponents, fit_coefficients, grid_search, fit_free_exponents, iter_random_search, ResultStore, compare_models, information_criteria, kfold_masks, cross_validate
+
+class TestRegression(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.data = pd.DataFrame({
+            'Re': rng.uniform(1000, 5000, 15),
+            'Sc': rng.uniform(0.5, 2.0, 15),
+            'We': rng.uniform(1.0, 5.0, 15),
+            'Eg': rng.uniform(0.1, 0.3, 15)
+        })
+        self.data['Sh'] = 2.5 * self.data['Re']**0.7 * self.data['Sc']**0.33 * self.data['We']**-0.3 * self.data['Eg']**0.12
+
+    def test_fit_coefficients_recovers_exact_model(self):
+        features = log_features(self.data, 1)
+        a, r2 = fit_coefficients(self.data['Sh'].values, features, np.array([[0.7, 0.33, -0.3, 0.12]]))
+        self.assertAlmostEqual(a[0], 2.5)
+        self.assertAlmostEqual(r2[0], 1.0)
+
+    def test_fit_coefficients_matches_bounded_minimize(self):
+        features = log_features(self.data, 2)
+        exponents = sample_exponents(2, 5, np.random.default_rng(1))
+        a, _ = fit_coefficients(self.data['Sh'].values, features, exponents)
+
+        Sh = self.data['Sh'].values
+        for coef, (x1, x2, x3, _) in zip(a, exponents):
+            basis = self.data['Re'].values**x1 * self.data['Sc'].values**x2 * self.data['We'].values**x3
+            result = minimize(lambda p: np.sum((Sh - p[0] * basis)**2), [1.0], method='L-BFGS-B', bounds=[(0.1, 10.0)])
+            self.assertAlmostEqual(coef, result.x[0], places=4)
+
+    def test_sample_exponents_respects_model_terms(self):
+        exponents = sample_exponents(4, 100, np.random.default_rng(2))
+        self.assertEqual(exponents.shape, (100, 4))
+        self.assertTrue(np.all(exponents[:, 2:] == 0))
+        self.assertTrue(np.all((exponents[:, 0] >= 0.65) & (exponents[:, 0] <= 0.75)))
+
+    def test_grid_search_covers_full_lattice(self):
+        features = log_features(self.data, 1)
+        surface = grid_search(self.data['Sh'].values, features, 1, resolution=5, top_k=10)
+        self.assertEqual(surface['r2'].shape, (5, 5, 5))
+
+        top = surface['results'].ranked_records()
+        self.assertEqual(len(top), 10)
+        self.assertTrue(np.all(np.diff(top['r2']) <= 0))
+        self.assertEqual(top['r2'][0], np.max(surface['r2']))
+
+        # Each lattice point matches the batched fit of the same exponents
+        exponents = np.column_stack([top['x1'], top['x2'], top['x3'], top['x4']])
+        a, r2 = fit_coefficients(self.data['Sh'].values, features, exponents)
+        np.testing.assert_allclose(a, top['a'])
+        np.testing.assert_allclose(r2, top['r2'])
+
+    def test_grid_search_blocks_are_bounded(self):
+        features = log_features(self.data, 1)
+        Sh = self.data['Sh'].values
+        expected = grid_search(Sh, features, 1, resolution=30, top_k=5)
+
+        chunk_elements = 50 * len(Sh)
+        with mock.patch.object(regression, '_CHUNK_ELEMENTS', chunk_elements), \
+                mock.patch.object(regression, '_fit_basis', wraps=regression._fit_basis) as fit_basis:
+            surface = grid_search(Sh, features, 1, resolution=30, top_k=5)
+
+        self.assertEqual(fit_basis.call_count, 30**3 // 50)
+        self.assertLessEqual(max(call.args[1].size for call in fit_basis.call_args_list), chunk_elements)
+        np.testing.assert_allclose(surface['r2'], expected['r2'])
+        np.testing.assert_array_equal(surface['results'].ranked_indices(), expected['results'].ranked_indices())
+
+    def test_grid_search_collapses_unused_axes(self):
+        surface = grid_search(self.data['Sh'].values, log_features(self.data, 3), 3, resolution=4)
+        self.assertEqual(surface['r2'].shape, (4, 1, 4))
+
+    def test_fit_free_exponents_recovers_all_parameters(self):
+        bounds = {'a': (0.1, 10.0), 'x1': (0.5, 0.9), 'x2': (0.2, 0.5), 'x3': (-0.6, 0.0), 'x4': (0.0, 0.3)}
+        fit = fit_free_exponents(self.data['Sh'].values, log_features(self.data, 1), 1, bounds=bounds, n_starts=4, seed=0)
+        best = np.argmax(fit['r2'])
+        self.assertAlmostEqual(fit['r2'][best], 1.0, places=6)
+        self.assertAlmostEqual(fit['a'][best], 2.5, places=3)
+        np.testing.assert_allclose(fit['exponents'][best], [0.7, 0.33, -0.3, 0.12], atol=1e-4)
+
+    def test_fit_free_exponents_holds_unused_terms_at_zero(self):
+        fit = fit_free_exponents(self.data['Sh'].values, log_features(self.data, 4), 4, n_starts=2, max_workers=2, seed=0)
+        self.assertTrue(np.all(fit['exponents'][:, 2:] == 0))
+        self.assertTrue(np.all(fit['exponents'][:, 1] == 0.33))
+
+    def test_random_search_is_independent_of_worker_count(self):
+        features = log_features(self.data, 1)
+        runs = []
+        for workers in [1, 3]:
+            r2 = np.empty(1000)
+            for start, exponents, a, chunk_r2 in iter_random_search(self.data['Sh'].values, features, 1, 1000, seed=7, max_workers=workers):
+                r2[start:start + len(chunk_r2)] = chunk_r2
+            runs.append(r2)
+        np.testing.assert_array_equal(runs[0], runs[1])
+
+    def test_result_store_keeps_top_k_across_chunks(self):
+        rng = np.random.default_rng(3)
+        exponents = sample_exponents(1, 500, rng)
+        r2 = rng.uniform(0, 1, 500)
+        r2[10] = np.nan
+
+        store = ResultStore(1, top_k=20)
+        for start in range(0, 500, 64):
+            stop = min(start + 64, 500)
+            store.add(start, exponents[start:stop], np.ones(stop - start), r2[start:stop])
+
+        expected = np.argsort(-np.nan_to_num(r2, nan=-np.inf), kind='stable')[:20]
+        np.testing.assert_array_equal(store.ranked_indices(), expected)
+        self.assertEqual(len(store), 20)
+        self.assertEqual(store[0]['rank'], 1)
+        self.assertEqual(store[0]['r2'], r2[expected[0]])
+        self.assertEqual(len(store.to_frame(0, 5)), 5)
+        np.testing.assert_array_equal(store.ranked_records()['x1'], exponents[expected, 0])
+
+        # Every finite R² is counted, whether or not it was ranked
+        counts, edges = store.r2_histogram(bins=10)
+        self.assertEqual(counts.sum(), 499)
+        self.assertLessEqual(len(counts), 10)
+        self.assertEqual(store.evaluated, 500)
+        self.assertTrue(np.all(np.diff(edges) > 0))
+
+    def test_result_store_memory_does_not_grow_with_candidates(self):
+        store = ResultStore(1, top_k=10)
+        rng = np.random.default_rng(6)
+        for start in range(0, 200000, 10000):
+            r2 = rng.uniform(-0.5, 1, 10000)
+            store.add(start, sample_exponents(1, 10000, rng), np.ones(10000), r2)
+
+        self.assertEqual(len(store._records), 10)
+        self.assertEqual(store.r2_counts.sum() + store.r2_below_range, 200000)
+        self.assertLess(len(pickle.dumps(store)), 50000)
+
+    def test_compare_models_ranks_by_aic(self):
+        comparison, results = compare_models(self.data['Sh'].values, self.data, 2000, seed=0, top_k=5)
+        self.assertEqual(sorted(comparison['Model']), ['Model 1', 'Model 2', 'Model 3', 'Model 4'])
+        self.assertTrue(np.all(np.diff(comparison['AIC']) >= 0))
+        self.assertEqual(comparison['Model'][0], 'Model 1')
+        self.assertEqual(dict(zip(comparison['Model'], comparison['Parameters']))['Model 4'], 2)
+
+        # Unused exponents are held at zero in each model's results
+        self.assertTrue(np.all(results[4].ranked_records()['x3'] == 0))
+        self.assertTrue(np.all(results[4].ranked_records()['x4'] == 0))
+        self.assertTrue(np.all(results[2].ranked_records()['x4'] == 0))
+        self.assertEqual(results[3][0]['r2'], comparison.set_index('Model').loc['Model 3', 'R²'])
+
+    def test_compare_models_matches_separate_fits(self):
+        Sh = self.data['Sh'].values
+        _, results = compare_models(Sh, self.data, 300, seed=1, top_k=3)
+        draws = sample_exponents(1, 300, np.random.default_rng(1))
+
+        for model_type, unused in [(1, []), (2, [3]), (3, [2]), (4, [2, 3])]:
+            exponents = draws.copy()
+            exponents[:, unused] = 0.0
+            a, r2 = fit_coefficients(Sh, log_features(self.data, 1), exponents)
+            best = int(np.nanargmax(r2))
+            self.assertEqual(results[model_type].ranked_indices()[0], best)
+            self.assertAlmostEqual(results[model_type][0]['r2'], r2[best])
+            self.assertAlmostEqual(results[model_type][0]['a'], a[best])
+
+    def test_information_criteria_penalise_parameters(self):
+        aic, bic = information_criteria(np.array([0.9, 0.9]), 10.0, 20, 2)
+        aic_more, bic_more = information_criteria(np.array([0.9]), 10.0, 20, 3)
+        self.assertAlmostEqual(aic_more[0] - aic[0], 2.0)
+        self.assertAlmostEqual(bic_more[0] - bic[0], np.log(20))
+
+    def test_kfold_masks_partition_points(self):
+        folds = kfold_masks(15, 4, seed=0)
+        self.assertEqual(folds.shape, (15, 4))
+        np.testing.assert_array_equal(folds.sum(axis=1), 1)
+        self.assertEqual(sorted(folds.sum(axis=0)), [3, 4, 4, 4])
+        with self.assertRaises(ValueError):
+            kfold_masks(15, 16)
+
+    def test_cross_validate_matches_per_fold_refits(self):
+        features = log_features(self.data, 1)
+        Sh = self.data['Sh'].values
+        exponents = sample_exponents(1, 6, np.random.default_rng(4))
+        folds = kfold_masks(len(Sh), 5, seed=1)
+        cv = cross_validate(Sh, features, exponents, folds)
+
+        for i, candidate in enumerate(exponents):
+            press = 0.0
+            for k in range(folds.shape[1]):
+                train, test = ~folds[:, k], folds[:, k]
+                a, _ = fit_coefficients(Sh[train], features[train], candidate[None, :])
+                self.assertAlmostEqual(cv['a'][i, k], a[0])
+                press += np.sum((Sh[test] - a[0] * np.exp(features[test] @ candidate))**2)
+            self.assertAlmostEqual(cv['r2'][i], 1 - press / np.sum((Sh - Sh.mean())**2))
+
+    def test_result_store_ranks_by_cross_validated_r2(self):
+        exponents = sample_exponents(1, 4, np.random.default_rng(5))
+        store = ResultStore(1, top_k=4, rank_by='r2_cv')
+        store.add(0, exponents, np.ones(4), np.array([0.9, 0.8, 0.7, 0.6]), np.array([0.1, 0.5, 0.3, 0.2]))
+        np.testing.assert_array_equal(store.ranked_indices(), [1, 2, 3, 0])
+        self.assertEqual(store[0]['r2_cv'], 0.5)
+        self.assertIn('CV R²', store.to_frame().columns)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import numpy as np
+import pandas as pd
+from app.utils.mass_transfer_calc import PowerLawCorrelation
+from app.utils.response_table import ResponseTable
+
+class TestResponseTable(unittest.TestCase):
+    def setUp(self):
+        self.correlation = PowerLawCorrelation(2.0, 0.7, 0.33, -0.3)
+        self.bounds = {'Re': (1000.0, 5000.0), 'Sc': (0.5, 2.0), 'We': (1.0, 5.0)}
+
+    def test_log_space_table_is_exact_for_power_law(self):
+        table = ResponseTable(self.correlation.predict, self.bounds, resolution=5, log_space=True)
+        point = {'Re': 2345.6, 'Sc': 1.234, 'We': 3.21}
+        self.assertAlmostEqual(float(table(point)), float(self.correlation.predict(point)), places=8)
+
+    def test_predict_is_called_once_on_all_nodes(self):
+        calls = []
+
+        def surrogate(values):
+            calls.append(len(values['Re']))
+            return pd.DataFrame(values).sum(axis=1).to_numpy()
+
+        table = ResponseTable(surrogate, self.bounds, resolution=10)
+        self.assertEqual(calls, [1000])
+        self.assertEqual(len(table), 1000)
+        # A linear surrogate is reproduced exactly by linear interpolation
+        self.assertAlmostEqual(float(table({'Re': 1500.0, 'Sc': 1.0, 'We': 2.0})), 1503.0)
+
+    def test_constant_inputs_and_clipping(self):
+        bounds = dict(self.bounds, We=(2.0, 2.0))
+        table = ResponseTable(self.correlation.predict, bounds, resolution=8, log_space=True)
+        self.assertEqual(table.axis_names, ['Re', 'Sc'])
+        outside = float(table({'Re': 9000.0, 'Sc': 1.0, 'We': 2.0}))
+        self.assertAlmostEqual(outside, float(self.correlation.predict({'Re': 5000.0, 'Sc': 1.0, 'We': 2.0})))
+
+    def test_log_space_rejects_non_positive_axes(self):
+        with self.assertRaisesRegex(ValueError, 'Sc'):
+            ResponseTable(self.correlation.predict, dict(self.bounds, Sc=(-1.0, 2.0)), resolution=4, log_space=True)
+
+        # Linear tables and constant inputs accept any values
+        ResponseTable(self.correlation.predict, dict(self.bounds, We=(0.0, 0.0)), resolution=4, log_space=True)
+        ResponseTable(lambda values: values['Re'], dict(self.bounds, Sc=(-1.0, 2.0)), resolution=4)
+
+    def test_array_queries_broadcast(self):
+        table = ResponseTable(self.correlation.predict, self.bounds, resolution=6, log_space=True)
+        result = table({'Re': np.array([1000.0, 3000.0, 5000.0]), 'Sc': 1.0, 'We': 2.0})
+        self.assertEqual(result.shape, (3,))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+from app.utils.result_cache import ResultCache, dataframe_hash, make_cache_key
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.data = pd.DataFrame({
+            'Re': [100, 200, 300],
+            'Sc': [0.7, 0.7, 0.7],
+            'Sh': [10, 15, 20]
+        })
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_dataframe_hash_tracks_contents(self):
+        self.assertEqual(dataframe_hash(self.data), dataframe_hash(self.data.copy()))
+        changed = self.data.copy()
+        changed.loc[0, 'Sh'] = 11
+        self.assertNotEqual(dataframe_hash(self.data), dataframe_hash(changed))
+
+    def test_make_cache_key_includes_settings(self):
+        key = make_cache_key(self.data, model='Model 4', num_iterations=100)
+        self.assertEqual(key, make_cache_key(self.data, num_iterations=100, model='Model 4'))
+        self.assertNotEqual(key, make_cache_key(self.data, model='Model 4', num_iterations=200))
+
+    def test_round_trip_across_instances(self):
+        ResultCache(self.tmp_dir.name).set('key', [{'r2': 0.9}])
+        self.assertEqual(ResultCache(self.tmp_dir.name).get('key'), [{'r2': 0.9}])
+        self.assertIsNone(ResultCache(self.tmp_dir.name).get('missing'))
+
+    def test_evicts_least_recently_used(self):
+        cache = ResultCache(self.tmp_dir.name, max_bytes=2500)
+        cache.set('old', b'x' * 1000)
+        cache.set('new', b'x' * 1000)
+        os.utime(cache._path('old'), (0, 0))
+        os.utime(cache._path('new'), (1, 1))
+        cache.get('old')  # refreshes 'old'
+        cache.set('newest', b'x' * 1000)
+        self.assertIsNotNone(cache.get('old'))
+        self.assertIsNone(cache.get('new'))
+        self.assertIsNotNone(cache.get('newest'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import time
+import unittest
+import numpy as np
+from app.utils.mass_transfer_calc import PowerLawCorrelation
+from app.utils.sensitivity import saltelli_sample, sobol_indices
+
+class TestSensitivity(unittest.TestCase):
+    def setUp(self):
+        self.bounds = {'Re': (1000.0, 5000.0), 'Sc': (0.5, 2.0), 'We': (1.0, 5.0)}
+
+    def test_saltelli_sample_respects_bounds(self):
+        sample_a, sample_b = saltelli_sample(self.bounds, 1000, seed=0)
+        self.assertEqual(sample_a.shape, (1000, 3))
+        self.assertTrue(np.all(sample_a[:, 0] >= 1000) and np.all(sample_a[:, 0] <= 5000))
+        self.assertFalse(np.allclose(sample_a, sample_b))
+
+    def test_sobol_indices_of_additive_log_model(self):
+        # With only Re and a constant Sc, all variance comes from Re
+        correlation = PowerLawCorrelation(2.0, 0.7, 0.33)
+        indices = sobol_indices(correlation, {'Re': (1000.0, 5000.0), 'Sc': (1.0, 1.0)}, n_samples=200000, seed=1)
+        self.assertAlmostEqual(indices.loc['Re', 'S1'], 1.0, delta=0.05)
+        self.assertAlmostEqual(indices.loc['Re', 'ST'], 1.0, delta=0.05)
+        self.assertEqual(indices.loc['Sc', 'ST'], 0.0)
+
+    def test_sobol_indices_rank_groups_and_run_fast(self):
+        correlation = PowerLawCorrelation(2.0, 0.7, 0.33, -0.3)
+        start = time.perf_counter()
+        indices = sobol_indices(correlation, self.bounds, n_samples=100000, seed=2)
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+        self.assertEqual(list(indices.index), ['Re', 'Sc', 'We'])
+        self.assertEqual(indices['ST'].idxmax(), 'Re')
+        self.assertTrue(np.all(indices['S1'] <= indices['ST'] + indices['ST CI'] + indices['S1 CI']))
+        self.assertTrue(np.all(indices['S1 CI'] > 0))
+        self.assertAlmostEqual(indices['S1'].sum(), 1.0, delta=0.1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Seconds allowed for a cold import of the mass transfer page
+STARTUP_BUDGET = 4.0
+
+HEAVY_MODULES = ['tensorflow', 'sklearn', 'matplotlib', 'seaborn', 'altair']
+
+# Run in a fresh interpreter so earlier imports of the test session do not hide the cost.
+# Sockets refuse to connect and Streamlit refuses to render, so any network
+# I/O or page output during import fails the test.
+IMPORT_SCRIPT = """
+import json, socket, sys, time
+import streamlit
+
+def forbidden(*args, **kwargs):
+    raise RuntimeError("side effect during import")
+
+socket.socket.connect = forbidden
+socket.create_connection = forbidden
+streamlit.set_page_config = forbidden
+streamlit.markdown = forbidden
+streamlit.sidebar = None
+start = time.perf_counter()
+import app.views.mass_transfer
+elapsed = time.perf_counter() - start
+print(json.dumps({'elapsed': elapsed, 'modules': sorted(name for name in sys.modules if '.' not in name)}))
+"""
+
+class TestStartup(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        result = subprocess.run(
+            [sys.executable, '-c', IMPORT_SCRIPT],
+            cwd=ROOT,
+            env=dict(os.environ, PYTHONPATH=ROOT),
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        cls.report = json.loads(result.stdout.strip().splitlines()[-1])
+
+    def test_heavy_dependencies_are_not_imported(self):
+        loaded = set(self.report['modules'])
+        self.assertEqual([name for name in HEAVY_MODULES if name in loaded], [])
+
+    def test_import_succeeds_offline(self):
+        self.assertIn('app', self.report['modules'])
+
+    def test_import_within_budget(self):
+        self.assertLess(self.report['elapsed'], STARTUP_BUDGET)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+import pickle
+import tracemalloc
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+from app.utils import uncertainty
+from app.utils.regression import log_features
+from app.utils.uncertainty import log_design, iter_bootstrap, bootstrap, bootstrap_summary, BootstrapRun, parameter_covariance, prediction_interval, leave_one_out, bca_interval
+from app.utils.mass_transfer_calc import PowerLawCorrelation
+
+class TestUncertainty(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.data = pd.DataFrame({
+            'Re': rng.uniform(1000, 5000, 25),
+            'Sc': rng.uniform(0.5, 2.0, 25),
+            'We': rng.uniform(1.0, 5.0, 25),
+            'Eg': rng.uniform(0.1, 0.3, 25)
+        })
+        noise = rng.lognormal(0, 0.05, 25)
+        self.data['Sh'] = 2.5 * self.data['Re']**0.7 * self.data['Sc']**0.33 * self.data['We']**-0.3 * self.data['Eg']**0.12 * noise
+        self.sh = self.data['Sh'].values
+
+    def test_bootstrap_matches_per_resample_lstsq(self):
+        features = log_features(self.data, 2)
+        design, offset = log_design(features, 2, 0.33)
+        samples = bootstrap(self.sh, features, 2, 0.33, n_resamples=7, seed=3, chunk_size=4)
+        self.assertEqual(len(samples), 7)
+        self.assertTrue(samples['x4'].isna().all())
+        self.assertTrue(np.all(samples['x2'] == 0.33))
+
+        # Redraw the resample indices of the second chunk and refit one by one
+        rng = np.random.default_rng(np.random.SeedSequence(np.random.SeedSequence(3).entropy, spawn_key=(4,)))
+        indices = rng.integers(0, len(self.sh), size=(3, len(self.sh)))
+        for row, idx in zip(samples.iloc[4:].itertuples(), indices):
+            coef = np.linalg.lstsq(design[idx], np.log(self.sh[idx]) - offset[idx], rcond=None)[0]
+            self.assertAlmostEqual(row.a, np.exp(coef[0]))
+            self.assertAlmostEqual(row.x1, coef[1])
+            self.assertAlmostEqual(row.x3, coef[2])
+
+            predicted = np.exp(design[idx] @ coef + offset[idx])
+            r2 = 1 - np.sum((self.sh[idx] - predicted)**2) / np.sum((self.sh[idx] - self.sh[idx].mean())**2)
+            self.assertAlmostEqual(row.r2, r2)
+
+    def test_bootstrap_is_independent_of_memory_blocks(self):
+        features = log_features(self.data, 1)
+        chunks = list(iter_bootstrap(self.sh, features, 1, 0.33, 300, seed=1, chunk_size=100))
+        self.assertEqual([start for start, _ in chunks], [0, 100, 200])
+
+        resumed = list(iter_bootstrap(self.sh, features, 1, 0.33, 300, seed=1, chunk_size=100, start=200))
+        pd.testing.assert_frame_equal(resumed[0][1], chunks[2][1])
+
+    def test_bootstrap_blocks_do_not_change_resamples(self):
+        features = log_features(self.data, 1)
+        whole = bootstrap(self.sh, features, 1, 0.33, n_resamples=50, seed=4, chunk_size=50)
+        with mock.patch.object(uncertainty, '_CHUNK_ELEMENTS', 3 * len(self.sh)):
+            blocked = bootstrap(self.sh, features, 1, 0.33, n_resamples=50, seed=4, chunk_size=50)
+        pd.testing.assert_frame_equal(blocked, whole)
+
+    def test_bootstrap_memory_is_bounded_for_large_chunks(self):
+        rng = np.random.default_rng(1)
+        n_points = 50000
+        data = pd.DataFrame({name: rng.uniform(1.0, 10.0, n_points) for name in ['Re', 'Sc', 'We', 'Eg']})
+        sh = 2.0 * data['Re']**0.7 * data['Sc']**0.33 * rng.lognormal(0, 0.05, n_points)
+        features = log_features(data, 4)
+
+        # A block holds a few arrays of _CHUNK_ELEMENTS values; a whole-chunk
+        # index matrix alone would take 300 * 50000 * 8 bytes = 120 MB
+        tracemalloc.start()
+        try:
+            for _ in iter_bootstrap(sh.to_numpy(), features, 4, 0.33, 300, seed=0, chunk_size=300):
+                pass
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, 8 * 8 * uncertainty._CHUNK_ELEMENTS)
+
+    def test_bootstrap_summary_brackets_estimate(self):
+        features = log_features(self.data, 1)
+        design, offset = log_design(features, 1, 0.33)
+        estimate = np.linalg.lstsq(design, np.log(self.sh) - offset, rcond=None)[0]
+
+        summary = bootstrap_summary(bootstrap(self.sh, features, 1, 0.33, n_resamples=2000, seed=0))
+        self.assertEqual(list(summary.index), ['a', 'x1', 'x2', 'x3', 'x4', 'r2'])
+        for name, value in zip(['x1', 'x3', 'x4'], estimate[1:]):
+            self.assertTrue(summary.loc[name, 'CI Lower'] < value < summary.loc[name, 'CI Upper'])
+        self.assertAlmostEqual(summary.loc['x2', 'Std'], 0.0)
+
+    def test_bootstrap_run_extends_without_refitting(self):
+        features = log_features(self.data, 3)
+        run = BootstrapRun(self.sh, features, 3, 0.33, seed=5, chunk_size=100)
+        self.assertEqual(list(run.extend(250)), [100, 200, 250])
+        self.assertEqual(len(run), 250)
+        self.assertEqual(len(run.samples), 250)
+
+        # Only the partial last chunk and the new chunks are fitted, also after a round trip through pickle
+        run = pickle.loads(pickle.dumps(run))
+        self.assertEqual(list(run.extend(400)), [300, 400])
+        self.assertEqual(list(run.extend(300)), [])
+
+        single = bootstrap(self.sh, features, 3, 0.33, n_resamples=400, seed=run.entropy, chunk_size=100)
+        pd.testing.assert_frame_equal(run.samples, single)
+
+    def test_parameter_covariance_matches_finite_difference_jacobian(self):
+        correlation = PowerLawCorrelation(2.5, 0.7, 0.33, -0.3)
+        fit = parameter_covariance(correlation, self.data, self.sh)
+        self.assertEqual(fit['names'], ['a', 'x1', 'x3'])
+        self.assertEqual(fit['dof'], 22)
+
+        params = np.array([2.5, 0.7, -0.3])
+        jacobian = np.empty((len(self.sh), 3))
+        for j in range(3):
+            step = np.zeros(3)
+            step[j] = 1e-6
+            upper, lower = params + step, params - step
+            jacobian[:, j] = (
+                PowerLawCorrelation(upper[0], upper[1], 0.33, upper[2]).predict(self.data)
+                - PowerLawCorrelation(lower[0], lower[1], 0.33, lower[2]).predict(self.data)
+            ) / 2e-6
+
+        residual = self.sh - correlation.predict(self.data)
+        expected = residual @ residual / 22 * np.linalg.inv(jacobian.T @ jacobian)
+        np.testing.assert_allclose(fit['covariance'], expected, rtol=1e-4)
+
+    def test_prediction_interval_vectorizes_over_points(self):
+        correlation = PowerLawCorrelation(2.5, 0.7, 0.33, -0.3)
+        fit = parameter_covariance(correlation, self.data, self.sh)
+        points = {'Re': np.linspace(1000, 5000, 50), 'Sc': 1.0, 'We': 3.0}
+        interval = prediction_interval(correlation, fit, points)
+        self.assertEqual(interval['std'].shape, (50,))
+        self.assertTrue(np.all(interval['lower'] < interval['sh']))
+        self.assertTrue(np.all(interval['sh'] < interval['upper']))
+
+        single = prediction_interval(correlation, fit, {'Re': 2000.0, 'Sc': 1.0, 'We': 3.0})
+        gradient = correlation.gradient({'Re': 2000.0, 'Sc': 1.0, 'We': 3.0})[[0, 1, 3]]
+        self.assertAlmostEqual(float(single['std']), np.sqrt(gradient @ fit['covariance'] @ gradient))
+
+    def test_leave_one_out_matches_refits(self):
+        features = log_features(self.data, 1)
+        design, offset = log_design(features, 1, 0.33)
+        target = np.log(self.sh) - offset
+        loo = leave_one_out(self.sh, features, 1, 0.33)
+
+        full = np.linalg.lstsq(design, target, rcond=None)[0]
+        variance = np.sum((target - design @ full)**2) / (len(self.sh) - 4)
+        for i in [0, 7, 24]:
+            keep = np.arange(len(self.sh)) != i
+            coef = np.linalg.lstsq(design[keep], target[keep], rcond=None)[0]
+            self.assertAlmostEqual(loo['loo']['a'][i], np.exp(coef[0]))
+            np.testing.assert_allclose(loo['loo'].loc[i, ['x1', 'x3', 'x4']], coef[1:])
+
+            # Cook's distance from its definition
+            change = design @ (full - coef)
+            self.assertAlmostEqual(loo['cooks_distance'][i], change @ change / (4 * variance))
+
+        hat = design @ np.linalg.inv(design.T @ design) @ design.T
+        np.testing.assert_allclose(loo['leverage'], np.diag(hat))
+        self.assertAlmostEqual(loo['leverage'].sum(), 4)
+        self.assertEqual(loo['std']['x2'], 0)
+
+    def test_bca_interval_contains_estimate(self):
+        features = log_features(self.data, 4)
+        loo = leave_one_out(self.sh, features, 4, 0.33)
+        samples = bootstrap(self.sh, features, 4, 0.33, n_resamples=2000, seed=2)
+        interval = bca_interval(samples, loo)
+        self.assertEqual(list(interval.index), ['a', 'x1', 'x2'])
+        self.assertTrue(np.all(interval['CI Lower'] <= interval['Estimate']))
+        self.assertTrue(np.all(interval['Estimate'] <= interval['CI Upper']))
+        self.assertEqual(interval.loc['x2', 'CI Lower'], 0.33)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 import numpy as np
-from app.utils.visualization import create_bubble_plot
+import plotly.graph_objects as go
+from app.utils.visualization import create_bubble_plot, downsample_indices, scatter_trace, downsampled_trace, histogram_trace
 
 class TestVisualization(unittest.TestCase):
     def setUp(self):
@@ -20,5 +21,46 @@ class TestVisualization(unittest.TestCase):
         self.assertEqual(fig.layout.width, 800)
         self.assertEqual(fig.layout.height, 800)
 
+    def test_downsample_indices_keeps_extremes(self):
+        x = np.arange(100000)
+        y = np.sin(x / 1000.0)
+        y[31337] = 50.0
+        y[4242] = -50.0
+        keep = downsample_indices(x, y, 1000)
+        self.assertLessEqual(len(keep), 1000)
+        self.assertTrue(np.all(np.diff(keep) > 0))
+        self.assertIn(31337, keep)
+        self.assertIn(4242, keep)
+        self.assertEqual(keep[0], 0)
+        self.assertEqual(keep[-1], 99999)
+        np.testing.assert_array_equal(downsample_indices(x[:10], y[:10], 1000), np.arange(10))
+
+    def test_scatter_trace_switches_to_webgl(self):
+        x = np.arange(20)
+        trace = scatter_trace(x, x * 2.0, hover_labels=x + 1, marker=dict(color=x, size=10))
+        self.assertIsInstance(trace, go.Scatter)
+        self.assertEqual(trace.text[0], "Data Point 1")
+
+        rng = np.random.default_rng(0)
+        x = rng.uniform(0, 1, 1000000)
+        trace = scatter_trace(x, x + rng.normal(0, 0.1, len(x)), max_points=8000, hover_labels=np.arange(len(x)), marker=dict(color=x))
+        self.assertIsInstance(trace, go.Scattergl)
+        self.assertLessEqual(len(trace.x), 8000)
+        self.assertEqual(len(trace.text), len(trace.x))
+        self.assertEqual(len(trace.marker.color), len(trace.x))
+
+    def test_figure_payload_is_bounded(self):
+        sizes = []
+        for n in [20000, 1000000]:
+            x = np.arange(n)
+            fig = go.Figure([
+                scatter_trace(x, np.cos(x / 500.0), hover_labels=x),
+                downsampled_trace(go.Bar, x, np.sin(x / 500.0)),
+                histogram_trace(np.cos(x / 500.0), density=True)
+            ])
+            sizes.append(len(fig.to_json()))
+        self.assertLess(sizes[1], 1.5 * sizes[0])
+        self.assertLess(sizes[1], 1000000)
+
 if __name__ == '__main__':
     unittest.main()